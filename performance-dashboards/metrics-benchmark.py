@@ -0,0 +1,391 @@
+"""
+Team Metrics Tracker Benchmark Suite
+
+Times the metrics tracker against seeded synthetic data at increasing org
+sizes (N teams x M weeks) and writes machine-readable JSON results that can
+be compared against a stored baseline across releases.
+
+Purpose: Track throughput and peak memory of team-metrics-tracker.py at scale
+
+Usage:
+    python metrics-benchmark.py --sizes 10x52,50x104 --output results.json
+    python metrics-benchmark.py --baseline benchmark-baseline.json
+    python metrics-benchmark.py --update-baseline benchmark-baseline.json
+
+collect_github_metrics runs against scripts/fake-api-server.py replaying generated fixtures.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import platform
+import tracemalloc
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Tuple, Callable, Any
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+def load_tracker():
+    """Import team-metrics-tracker.py (its file name is not a valid module name)"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'team-metrics-tracker.py')
+    spec = importlib.util.spec_from_file_location('team_metrics_tracker', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def load_fake_api():
+    """Import scripts/fake-api-server.py for offline collector benchmarks"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'fake-api-server.py')
+    spec = importlib.util.spec_from_file_location('fake_api_server', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+tracker = load_tracker()
+fake_api = load_fake_api()
+
+class SyntheticDataGenerator:
+    """Seeded generator for realistic-looking engineering metrics fixtures"""
+    
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.start_date = datetime(2022, 1, 3, tzinfo=timezone.utc)
+    
+    def team_names(self, n_teams: int) -> List[str]:
+        return [f'team-{i:04d}' for i in range(n_teams)]
+    
+    def team_members(self, team_name: str, size: int = 6) -> List[str]:
+        return [f'{team_name}-dev{i}' for i in range(size)]
+    
+    def pull_requests(self, members: List[str], weeks: int, per_week: int = 8) -> List[Dict[str, Any]]:
+        """GitHub /pulls payloads; about 10% are closed without merging"""
+        pulls = []
+        for week in range(weeks):
+            for i in range(per_week):
+                created = self.start_date + timedelta(weeks=week, hours=self.rng.uniform(0, 120))
+                merged = created + timedelta(hours=self.rng.lognormvariate(2.5, 0.8))
+                is_merged = self.rng.random() > 0.1
+                pulls.append({
+                    'number': len(pulls) + 1,
+                    'state': 'closed',
+                    'user': {'login': self.rng.choice(members)},
+                    'created_at': created.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'closed_at': merged.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'merged_at': merged.strftime('%Y-%m-%dT%H:%M:%SZ') if is_merged else None
+                })
+        return pulls
+    
+    def contributor_weeks(self, members: List[str], weeks: int) -> List[Dict[str, Any]]:
+        """GitHub /stats/contributors payloads"""
+        contributors = []
+        for login in members:
+            contributors.append({
+                'author': {'login': login},
+                'total': 0,
+                'weeks': [
+                    {
+                        'w': int((self.start_date + timedelta(weeks=w)).timestamp()),
+                        'a': self.rng.randint(0, 800),
+                        'd': self.rng.randint(0, 400),
+                        'c': self.rng.randint(0, 25)
+                    }
+                    for w in range(weeks)
+                ]
+            })
+        return contributors
+    
+    def deployments(self, services: List[str], weeks: int, per_week: int = 5) -> List[Dict[str, Any]]:
+        return [
+            {
+                'service': service,
+                'status': 'success' if self.rng.random() > 0.05 else 'failed',
+                'timestamp': self.start_date + timedelta(weeks=week, hours=self.rng.uniform(0, 168)),
+                'commit_date': self.start_date + timedelta(weeks=week, hours=self.rng.uniform(-72, 0))
+            }
+            for service in services
+            for week in range(weeks)
+            for _ in range(per_week)
+        ]
+    
+    def incidents(self, services: List[str], weeks: int, per_week: float = 0.3) -> List[Dict[str, Any]]:
+        incidents = []
+        for service in services:
+            for week in range(weeks):
+                if self.rng.random() < per_week:
+                    created = self.start_date + timedelta(weeks=week, hours=self.rng.uniform(0, 168))
+                    incidents.append({
+                        'service': service,
+                        'created_at': created,
+                        'resolved_at': created + timedelta(hours=self.rng.expovariate(0.5))
+                    })
+        return incidents
+    
+    def metrics_history(self, n_teams: int, weeks: int) -> List[Any]:
+        """Weekly TeamMetrics snapshots for every team, interleaved by week"""
+        history = []
+        teams = self.team_names(n_teams)
+        baselines = {team: self.rng.uniform(25, 60) for team in teams}
+        
+        for week in range(weeks):
+            date = (self.start_date + timedelta(weeks=week)).strftime('%Y-%m-%d')
+            for team in teams:
+                velocity = max(0, int(self.rng.gauss(baselines[team], 6)))
+                history.append(tracker.TeamMetrics(
+                    date=date,
+                    team_name=team,
+                    story_points_completed=velocity,
+                    stories_delivered=max(0, velocity // 4 + self.rng.randint(-2, 2)),
+                    bugs_fixed=self.rng.randint(0, 12),
+                    technical_debt_items=self.rng.randint(0, 8),
+                    pull_requests_merged=self.rng.randint(5, 40),
+                    code_review_time_hours=round(self.rng.lognormvariate(2.0, 0.5), 2),
+                    test_coverage_percent=round(self.rng.uniform(65, 95), 1),
+                    code_quality_score=round(self.rng.uniform(6, 9.5), 1),
+                    deployments_count=self.rng.randint(0, 30),
+                    deployment_success_rate=round(self.rng.uniform(85, 100), 1),
+                    mean_time_to_recovery_hours=round(self.rng.expovariate(0.5), 2),
+                    uptime_percent=round(self.rng.uniform(99.0, 100.0), 3),
+                    team_satisfaction_score=round(self.rng.uniform(3.0, 5.0), 1),
+                    knowledge_sharing_sessions=self.rng.randint(0, 10),
+                    cross_training_hours=round(self.rng.uniform(0, 20), 1),
+                    innovation_time_percent=round(self.rng.uniform(0, 20), 1)
+                ))
+        return history
+
+def measure(func: Callable[[], int], repeats: int = 5) -> Tuple[float, float, int]:
+    """Run func repeatedly, returning (best seconds, peak MB, operation count)
+    
+    Timed runs happen with tracemalloc off, since tracing slows allocation-heavy
+    code several-fold; the best of `repeats` filters out scheduler noise. Peak
+    memory comes from one further, traced run.
+    """
+    seconds = float('inf')
+    for _ in range(max(repeats, 1)):
+        start = time.perf_counter()
+        ops = func()
+        seconds = min(seconds, time.perf_counter() - start)
+    
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak / (1024 * 1024), ops
+
+def github_fixtures(generator: SyntheticDataGenerator, n_teams: int, 
+                    weeks: int) -> Tuple[Dict[str, Tuple[str, List[str]]], Dict[str, Dict[str, Any]]]:
+    """Per-team (repo, members) plus fake API fixtures for each repo"""
+    teams = {}
+    responses = {}
+    for team in generator.team_names(n_teams):
+        members = generator.team_members(team)
+        repo = f'company/{team}-api'
+        teams[team] = (repo, members)
+        responses[f'GET /repos/{repo}/pulls'] = {
+            'status': 200, 'body': generator.pull_requests(members, weeks)
+        }
+        responses[f'GET /repos/{repo}/stats/contributors'] = {
+            'status': 200, 'body': generator.contributor_weeks(members, weeks)
+        }
+    return teams, {'responses': responses}
+
+def bench_collect_github(teams: Dict[str, Tuple[str, List[str]]], base_url: str, 
+                         weeks: int) -> Callable[[], int]:
+    def run() -> int:
+        collector = tracker.MetricsCollector({
+            'github_token': 'benchmark',
+            'github_api_url': base_url
+        })
+        for repo, members in teams.values():
+            collector.collect_github_metrics(repo, members, days=weeks * 7)
+        return len(teams)
+    
+    return run
+
+def bench_dashboard_reports(history: List[Any], team_names: List[str]) -> Callable[[], int]:
+    def run() -> int:
+        dashboard = tracker.MetricsDashboard()
+        for metrics in history:
+            dashboard.add_metrics(metrics)
+        for team in team_names:
+            dashboard.generate_quality_metrics_report(team)
+            dashboard.generate_executive_summary(team)
+        return len(team_names)
+    
+    return run
+
+def bench_dora(deployments: List[Dict[str, Any]], incidents: List[Dict[str, Any]],
+               weeks: int) -> Callable[[], int]:
+    def run() -> int:
+        for deployment in deployments:
+            tracker.DORAMetrics.calculate_lead_time(deployment['commit_date'], deployment['timestamp'])
+        tracker.DORAMetrics.calculate_deployment_frequency(
+            [d['timestamp'] for d in deployments], period_days=weeks * 7
+        )
+        tracker.DORAMetrics.calculate_mttr(incidents)
+        failed = sum(1 for d in deployments if d['status'] != 'success')
+        tracker.DORAMetrics.calculate_change_failure_rate(len(deployments), failed)
+        return len(deployments) + len(incidents)
+    
+    return run
+
+def bench_alerts(history: List[Any], team_names: List[str]) -> Callable[[], int]:
+    thresholds = {team: {'min_deployment_success': 95, 'min_test_coverage': 80,
+                         'min_satisfaction': 3.5, 'max_mttr': 4} for team in team_names}
+    
+    def run() -> int:
+        alerts = tracker.MetricsAlerts(thresholds)
+        for metrics in history:
+            alerts.check_thresholds(metrics)
+        return len(history)
+    
+    return run
+
+def bench_analytics(history: List[Any], team_names: List[str]) -> Callable[[], int]:
+    by_team: Dict[str, List[Any]] = {team: [] for team in team_names}
+    for metrics in history:
+        by_team[metrics.team_name].append(metrics)
+    
+    def run() -> int:
+        for team_history in by_team.values():
+            velocity = [m.story_points_completed for m in team_history]
+            tracker.MetricsAnalytics.predict_sprint_capacity(velocity)
+            tracker.MetricsAnalytics.identify_bottlenecks(team_history)
+        return len(by_team)
+    
+    return run
+
+def run_suite(sizes: List[Tuple[int, int]], seed: int, repeats: int = 5) -> List[Dict[str, Any]]:
+    """Run every benchmark at every size, keeping the best of `repeats` timings"""
+    results = []
+    
+    for n_teams, weeks in sizes:
+        generator = SyntheticDataGenerator(seed)
+        team_names = generator.team_names(n_teams)
+        history = generator.metrics_history(n_teams, weeks)
+        services = [f'{team}-svc' for team in team_names]
+        deployments = generator.deployments(services, weeks)
+        incidents = generator.incidents(services, weeks)
+        
+        github_teams, fixtures = github_fixtures(generator, n_teams, weeks)
+        
+        with fake_api.FakeAPIServer(fixtures=fixtures) as server:
+            benchmarks = {
+                'collect_github_metrics': bench_collect_github(github_teams, server.base_url, weeks),
+                'dashboard_reports': bench_dashboard_reports(history, team_names),
+                'dora_metrics': bench_dora(deployments, incidents, weeks),
+                'alerts_check_thresholds': bench_alerts(history, team_names),
+                'analytics': bench_analytics(history, team_names)
+            }
+            timings = {name: measure(func, repeats) for name, func in benchmarks.items()}
+        
+        for name, (seconds, peak_mb, ops) in timings.items():
+            result = {
+                'name': name,
+                'size': f'{n_teams}x{weeks}',
+                'teams': n_teams,
+                'weeks': weeks,
+                'seconds': round(seconds, 6),
+                'ops': ops,
+                'ops_per_sec': round(ops / seconds, 2) if seconds > 0 else None,
+                'peak_memory_mb': round(peak_mb, 3)
+            }
+            results.append(result)
+            print(f"{name:<26} {result['size']:>10} {seconds:>10.3f}s "
+                  f"{result['ops_per_sec'] or 0:>12.1f} ops/s {peak_mb:>9.1f} MB")
+    
+    return results
+
+# Absolute changes below these are treated as timer/allocator noise
+NOISE_FLOOR = {'seconds': 0.005, 'peak_memory_mb': 0.5}
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any],
+                        tolerance: float) -> List[Dict[str, Any]]:
+    """Return results whose time or peak memory regressed beyond tolerance"""
+    baseline_index = {(r['name'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    
+    for result in results:
+        previous = baseline_index.get((result['name'], result['size']))
+        if not previous:
+            continue
+        
+        for metric in ('seconds', 'peak_memory_mb'):
+            if (previous[metric] and result[metric] > previous[metric] * (1 + tolerance)
+                    and result[metric] - previous[metric] > NOISE_FLOOR[metric]):
+                regressions.append({
+                    'name': result['name'],
+                    'size': result['size'],
+                    'metric': metric,
+                    'baseline': previous[metric],
+                    'current': result[metric],
+                    'change_percent': round((result[metric] / previous[metric] - 1) * 100, 1)
+                })
+    
+    return regressions
+
+def parse_sizes(value: str) -> List[Tuple[int, int]]:
+    """Parse '10x52,50x104' into [(10, 52), (50, 104)]"""
+    sizes = []
+    for item in value.split(','):
+        teams, weeks = item.lower().split('x')
+        sizes.append((int(teams), int(weeks)))
+    return sizes
+
+def main():
+    """CLI entry point for the benchmark suite"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Benchmark the team metrics tracker at scale')
+    parser.add_argument('--sizes', default='10x52,50x104,200x156', help='Comma-separated TEAMSxWEEKS sizes')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the synthetic data generator')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed runs per benchmark; the best is reported')
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write JSON results')
+    parser.add_argument('--baseline', help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed regression ratio (0.2 = 20%%)')
+    parser.add_argument('--update-baseline', metavar='PATH', help='Also write these results as the new baseline')
+    
+    args = parser.parse_args()
+    
+    results = run_suite(parse_sizes(args.sizes), args.seed, args.repeats)
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'repeats': args.repeats,
+        'results': results
+    }
+    
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        report['baseline'] = args.baseline
+        report['regressions'] = compare_to_baseline(results, baseline, args.tolerance)
+    
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    
+    if args.update_baseline:
+        with open(args.update_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated: {args.update_baseline}")
+    
+    regressions = report.get('regressions', [])
+    for regression in regressions:
+        print(f"REGRESSION: {regression['name']} [{regression['size']}] {regression['metric']} "
+              f"{regression['baseline']} -> {regression['current']} (+{regression['change_percent']}%)")
+    
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,675 @@
+"""
+Fake API Server
+
+Local stand-in for the GitHub, Slack, Jira and deployment endpoints used by
+performance-dashboards/team-metrics-tracker.py and onboarding-automation.py.
+Replays recorded fixtures or deterministic generated data so collectors can
+be load-tested and benchmarked offline.
+
+Purpose: Offline benchmarking and load testing of the toolkit's integrations
+
+Usage:
+    python fake-api-server.py --port 8099 --latency-ms 40 --page-size 30
+    python fake-api-server.py --fixtures recorded.json
+    python fake-api-server.py --record https://api.github.com --fixtures recorded.json
+
+Point the tools at it with:
+    tracker config:    github_api_url / deployment_api_url / incident_api_url = http://127.0.0.1:8099
+    onboarding config: github.base_url = http://127.0.0.1:8099
+                       slack.base_url  = http://127.0.0.1:8099/api
+                       jira.url        = http://127.0.0.1:8099
+"""
+
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, urlencode
+from typing import List, Dict, Optional, Any, Tuple
+
+@dataclass
+class FakeAPIConfig:
+    """Behavior knobs for the fake server"""
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    page_size: int = 30              # Default per_page / limit when the client sends none
+    max_page_size: int = 100
+    stats_pending_polls: int = 1     # 202 responses before /stats/contributors is ready
+    rate_limit: int = 0              # Requests per window per API before 429 (0 = unlimited)
+    rate_limit_window: float = 60.0
+    max_concurrency: int = 0         # Requests handled at once; extra requests queue (0 = unlimited)
+    jira_bulk_limit: int = 50        # Most issueUpdates accepted by one bulk create
+    jira_bulk_failure_rate: float = 0.0   # Fraction of bulk items rejected, to exercise fallbacks
+    jira_bulk_lost_rate: float = 0.0      # Fraction of bulk requests that create issues but answer 502
+    seed: int = 42
+    org: str = 'your-org'
+    domain: str = 'company.com'
+    users: int = 200
+    channels: int = 50
+    teams: int = 20
+    repos: int = 60
+
+class FixtureGenerator:
+    """Deterministic generated payloads for endpoints without recorded fixtures"""
+    
+    def __init__(self, config: FakeAPIConfig):
+        self.config = config
+    
+    def _rng(self, *key: str) -> random.Random:
+        digest = hashlib.sha256('/'.join((str(self.config.seed),) + key).encode('utf-8')).hexdigest()
+        return random.Random(int(digest[:16], 16))
+    
+    def repo_members(self, repo: str) -> List[str]:
+        return [f'dev{i}' for i in range(1, 9)]
+    
+    def pull_requests(self, repo: str, count: int = 250) -> List[Dict[str, Any]]:
+        rng = self._rng('pulls', repo)
+        now = datetime.now(timezone.utc)
+        members = self.repo_members(repo)
+        pulls = []
+        for number in range(count, 0, -1):
+            created = now - timedelta(hours=rng.uniform(0, 24 * 90))
+            merged = created + timedelta(hours=rng.lognormvariate(2.5, 0.8))
+            pulls.append({
+                'number': number,
+                'state': 'closed',
+                'user': {'login': rng.choice(members)},
+                'created_at': created.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'closed_at': merged.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'merged_at': merged.strftime('%Y-%m-%dT%H:%M:%SZ') if rng.random() > 0.1 else None
+            })
+        return pulls
+    
+    def contributors(self, repo: str, weeks: int = 52) -> List[Dict[str, Any]]:
+        rng = self._rng('contributors', repo)
+        start = datetime.now(timezone.utc) - timedelta(weeks=weeks)
+        return [
+            {
+                'author': {'login': login},
+                'weeks': [
+                    {'w': int((start + timedelta(weeks=w)).timestamp()),
+                     'a': rng.randint(0, 800), 'd': rng.randint(0, 400), 'c': rng.randint(0, 25)}
+                    for w in range(weeks)
+                ]
+            }
+            for login in self.repo_members(repo)
+        ]
+    
+    def org_teams(self) -> List[Dict[str, Any]]:
+        names = [f'{team}-team' for team in ('backend', 'frontend', 'fullstack', 'devops', 'data')]
+        names += [f'squad-{i:03d}' for i in range(max(self.config.teams - len(names), 0))]
+        return [
+            {'id': 1000 + i, 'name': name, 'slug': name.lower(), 'permission': 'pull'}
+            for i, name in enumerate(names)
+        ]
+    
+    def org_repos(self) -> List[Dict[str, Any]]:
+        names = ['documentation', 'onboarding', 'shared-configs', 'api-service', 'database-migrations',
+                 'shared-libraries', 'web-app', 'mobile-app', 'design-system', 'infrastructure',
+                 'deployment-scripts', 'monitoring', 'data-pipeline', 'analytics', 'ml-models']
+        names += [f'service-{i:03d}' for i in range(max(self.config.repos - len(names), 0))]
+        return [
+            {'id': 5000 + i, 'name': name, 'full_name': f'{self.config.org}/{name}', 'archived': False}
+            for i, name in enumerate(names)
+        ]
+    
+    def team_repos(self, team: str, repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        owned = {
+            'backend-team': ['api-service', 'database-migrations', 'shared-libraries'],
+            'frontend-team': ['web-app', 'mobile-app', 'design-system'],
+            'fullstack-team': ['api-service', 'web-app', 'shared-libraries'],
+            'devops-team': ['infrastructure', 'deployment-scripts', 'monitoring'],
+            'data-team': ['data-pipeline', 'analytics', 'ml-models']
+        }
+        names = owned.get(team) or [repo['name'] for repo in self._rng('team_repos', team).sample(repos, 4)]
+        return [
+            dict(repo, permissions={'admin': False, 'push': True, 'pull': True})
+            for repo in repos if repo['name'] in names
+        ]
+    
+    def slack_channels(self) -> List[Dict[str, Any]]:
+        names = ['engineering-general', 'announcements', 'random', 'code-reviews', 'tech-talks']
+        names += [f'team-{team}' for team in ('backend', 'frontend', 'fullstack', 'devops', 'data')]
+        names += [f'project-{i:04d}' for i in range(max(self.config.channels - len(names), 0))]
+        return [{'id': f'C{i:08d}', 'name': name, 'is_private': False} for i, name in enumerate(names)]
+    
+    def slack_users(self) -> List[Dict[str, Any]]:
+        emails = [f'manager@{self.config.domain}', f'buddy@{self.config.domain}']
+        emails += [f'dev{i}@{self.config.domain}' for i in range(max(self.config.users - len(emails), 0))]
+        return [
+            {'id': f'U{i:08d}', 'name': email.split('@')[0], 'deleted': False,
+             'profile': {'email': email}}
+            for i, email in enumerate(emails)
+        ]
+    
+    def deployments(self, service: str, since: datetime, until: datetime) -> List[Dict[str, Any]]:
+        rng = self._rng('deployments', service, since.date().isoformat())
+        days = max((until - since).days, 1)
+        return [
+            {
+                'service': service,
+                'status': 'success' if rng.random() > 0.05 else 'failed',
+                'timestamp': (since + timedelta(days=rng.uniform(0, days))).isoformat()
+            }
+            for _ in range(rng.randint(days // 3, days))
+        ]
+    
+    def incidents(self, service: str, since: datetime, until: datetime) -> List[Dict[str, Any]]:
+        rng = self._rng('incidents', service, since.date().isoformat())
+        days = max((until - since).days, 1)
+        incidents = []
+        for _ in range(rng.randint(0, max(days // 15, 1))):
+            created = since + timedelta(days=rng.uniform(0, days))
+            incidents.append({
+                'service': service,
+                'created_at': created.isoformat(),
+                'resolved_at': (created + timedelta(hours=rng.expovariate(0.5))).isoformat()
+            })
+        return incidents
+
+class FakeAPIState:
+    """Mutable server state shared by all handler threads"""
+    
+    def __init__(self, config: FakeAPIConfig, fixtures: Optional[Dict[str, Any]] = None):
+        self.config = config
+        self.generator = FixtureGenerator(config)
+        self.lock = threading.Lock()
+        self.concurrency = threading.BoundedSemaphore(config.max_concurrency) if config.max_concurrency else None
+        
+        # Recorded responses keyed by "METHOD /path?query" (query optional)
+        self.fixtures: Dict[str, Dict[str, Any]] = dict((fixtures or {}).get('responses', {}))
+        self.request_counts: Dict[str, int] = {}
+        self.stats_polls: Dict[str, int] = {}
+        self.rate_windows: Dict[str, Tuple[float, int]] = {}
+        self.jira_counter = 0
+        self.jira_issues: Dict[str, Dict[str, Any]] = {}
+        self._teams = None
+        self._repos = None
+        self._channels = None
+        self._users = None
+    
+    @property
+    def teams(self) -> List[Dict[str, Any]]:
+        if self._teams is None:
+            self._teams = self.generator.org_teams()
+        return self._teams
+    
+    @property
+    def repos(self) -> List[Dict[str, Any]]:
+        if self._repos is None:
+            self._repos = self.generator.org_repos()
+        return self._repos
+    
+    @property
+    def channels(self) -> List[Dict[str, Any]]:
+        if self._channels is None:
+            self._channels = self.generator.slack_channels()
+        return self._channels
+    
+    @property
+    def users(self) -> List[Dict[str, Any]]:
+        if self._users is None:
+            self._users = self.generator.slack_users()
+        return self._users
+    
+    def count(self, route: str):
+        with self.lock:
+            self.request_counts[route] = self.request_counts.get(route, 0) + 1
+    
+    def take_rate_token(self, api: str) -> Optional[float]:
+        """Consume one request from the API's window; return Retry-After seconds if exhausted"""
+        if not self.config.rate_limit:
+            return None
+        now = time.monotonic()
+        with self.lock:
+            window_start, used = self.rate_windows.get(api, (now, 0))
+            if now - window_start >= self.config.rate_limit_window:
+                window_start, used = now, 0
+            if used >= self.config.rate_limit:
+                return max(self.config.rate_limit_window - (now - window_start), 0.0)
+            self.rate_windows[api] = (window_start, used + 1)
+        return None
+    
+    def next_issue_key(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.jira_counter += 1
+            project = fields.get('project', {}).get('key', 'ONBOARD')
+            issue = {'id': str(10000 + self.jira_counter), 'key': f'{project}-{self.jira_counter}'}
+            self.jira_issues[issue['key']] = fields
+        return issue
+
+# Route table: (method, pattern, handler name, route template used for stats)
+ROUTES = [
+    ('GET', r'^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/pulls$', 'github_pulls', '/repos/{r}/pulls'),
+    ('GET', r'^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/stats/contributors$', 'github_contributors',
+     '/repos/{r}/stats/contributors'),
+    ('PUT', r'^/orgs/(?P<org>[^/]+)/memberships/(?P<user>[^/]+)$', 'github_membership',
+     '/orgs/{org}/memberships/{user}'),
+    ('GET', r'^/orgs/(?P<org>[^/]+)/teams$', 'github_teams', '/orgs/{org}/teams'),
+    ('GET', r'^/orgs/(?P<org>[^/]+)/repos$', 'github_repos', '/orgs/{org}/repos'),
+    ('PUT', r'^/teams/(?P<team_id>\d+)/memberships/(?P<user>[^/]+)$', 'github_team_membership',
+     '/teams/{id}/memberships/{user}'),
+    ('GET', r'^/teams/(?P<team_id>\d+)/repos$', 'github_team_repos', '/teams/{id}/repos'),
+    ('PUT', r'^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/collaborators/(?P<user>[^/]+)$',
+     'github_collaborator', '/repos/{r}/collaborators/{user}'),
+    ('POST', r'^/api/chat\.postMessage$', 'slack_post_message', '/api/chat.postMessage'),
+    ('GET', r'^/api/conversations\.list$', 'slack_conversations_list', '/api/conversations.list'),
+    ('POST', r'^/api/conversations\.invite$', 'slack_invite', '/api/conversations.invite'),
+    ('GET', r'^/api/users\.lookupByEmail$', 'slack_lookup_by_email', '/api/users.lookupByEmail'),
+    ('GET', r'^/api/users\.list$', 'slack_users_list', '/api/users.list'),
+    ('POST', r'^/rest/api/2/issue$', 'jira_create_issue', '/rest/api/2/issue'),
+    ('POST', r'^/rest/api/2/issue/bulk$', 'jira_bulk_create', '/rest/api/2/issue/bulk'),
+    ('GET', r'^/rest/api/2/search$', 'jira_search', '/rest/api/2/search'),
+    ('GET', r'^/deployments$', 'deployments', '/deployments'),
+    ('GET', r'^/incidents$', 'incidents', '/incidents'),
+    ('GET', r'^/__stats$', 'server_stats', '/__stats'),
+]
+COMPILED_ROUTES = [(method, re.compile(pattern), name, template) for method, pattern, name, template in ROUTES]
+
+def api_for_path(path: str) -> str:
+    """Which upstream API a path belongs to, for rate limiting"""
+    if path.startswith('/api/'):
+        return 'slack'
+    if path.startswith('/rest/api/'):
+        return 'jira'
+    if path.startswith(('/deployments', '/incidents')):
+        return 'deployments'
+    return 'github'
+
+class FakeAPIServer:
+    """Threaded local HTTP server that fakes the toolkit's SaaS endpoints"""
+    
+    def __init__(self, config: Optional[FakeAPIConfig] = None, fixtures: Optional[Dict[str, Any]] = None,
+                 host: str = '127.0.0.1', port: int = 0, record_upstream: Optional[str] = None):
+        self.config = config or FakeAPIConfig()
+        self.state = FakeAPIState(self.config, fixtures)
+        self.record_upstream = record_upstream.rstrip('/') if record_upstream else None
+        self.recorded: Dict[str, Dict[str, Any]] = {}
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+    
+    def start(self) -> 'FakeAPIServer':
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def __enter__(self) -> 'FakeAPIServer':
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    def save_recording(self, path: str):
+        """Write recorded upstream responses as a replayable fixtures file"""
+        with open(path, 'w') as f:
+            json.dump({'responses': self.recorded}, f, indent=2)
+    
+    def _make_handler(self):
+        fake = self
+        state = self.state
+        config = self.config
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def do_GET(self):
+                self._dispatch('GET')
+            
+            def do_POST(self):
+                self._dispatch('POST')
+            
+            def do_PUT(self):
+                self._dispatch('PUT')
+            
+            def log_message(self, format, *args):
+                pass
+            
+            def _dispatch(self, method: str):
+                if state.concurrency:
+                    with state.concurrency:
+                        self._handle(method)
+                else:
+                    self._handle(method)
+            
+            def _handle(self, method: str):
+                parsed = urlparse(self.path)
+                self.query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+                length = int(self.headers.get('Content-Length') or 0)
+                raw_body = self.rfile.read(length) if length else b''
+                try:
+                    self.json_body = json.loads(raw_body) if raw_body else {}
+                except ValueError:
+                    self.json_body = {}
+                
+                if config.latency_ms or config.latency_jitter_ms:
+                    time.sleep(max(config.latency_ms + random.uniform(-1, 1) * config.latency_jitter_ms, 0) / 1000)
+                
+                if parsed.path != '/__stats':
+                    retry_after = state.take_rate_token(api_for_path(parsed.path))
+                    if retry_after is not None:
+                        state.count('429')
+                        self._send(429, {'message': 'API rate limit exceeded', 'ok': False,
+                                         'error': 'ratelimited'},
+                                   {'Retry-After': str(int(retry_after) + 1), 'X-RateLimit-Remaining': '0'})
+                        return
+                
+                if fake.record_upstream:
+                    self._proxy_and_record(method, parsed, raw_body)
+                    return
+                
+                recorded = (state.fixtures.get(f'{method} {self.path}') or
+                            state.fixtures.get(f'{method} {parsed.path}'))
+                
+                for route_method, pattern, name, template in COMPILED_ROUTES:
+                    match = pattern.match(parsed.path)
+                    if match and route_method == method:
+                        state.count(template)
+                        if recorded is not None:
+                            self._replay(name, recorded, parsed)
+                        else:
+                            getattr(self, f'route_{name}')(**match.groupdict())
+                        return
+                
+                if recorded is not None:
+                    state.count(parsed.path)
+                    self._replay(None, recorded, parsed)
+                    return
+                
+                state.count('404')
+                self._send(404, {'message': 'Not Found'})
+            
+            def _send(self, status: int, payload: Any = None, headers: Optional[Dict[str, str]] = None):
+                body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                
+                if status == 200 and self.command == 'GET' and self.headers.get('If-None-Match') == etag:
+                    status, body = 304, b''
+                
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if self.command == 'GET' and status in (200, 304):
+                    self.send_header('ETag', etag)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def _paginate_github(self, items: List[Any]) -> Tuple[List[Any], Dict[str, str]]:
+                """Page/per_page pagination with a GitHub-style Link header"""
+                per_page = min(int(self.query.get('per_page', config.page_size)), config.max_page_size)
+                page = max(int(self.query.get('page', 1)), 1)
+                start = (page - 1) * per_page
+                page_items = items[start:start + per_page]
+                
+                links = []
+                if start + per_page < len(items):
+                    links.append(f'<{self._page_url(page + 1)}>; rel="next"')
+                    last = (len(items) + per_page - 1) // per_page
+                    links.append(f'<{self._page_url(last)}>; rel="last"')
+                return page_items, ({'Link': ', '.join(links)} if links else {})
+            
+            def _page_url(self, page: int) -> str:
+                query = dict(self.query, page=str(page))
+                host = self.headers.get('Host', '127.0.0.1')
+                return f'http://{host}{urlparse(self.path).path}?{urlencode(query)}'
+            
+            def _paginate_slack(self, items: List[Any]) -> Tuple[List[Any], str]:
+                """Cursor pagination as used by Slack list methods"""
+                limit = min(int(self.query.get('limit', config.page_size)), 1000)
+                start = int(self.query.get('cursor') or 0)
+                next_start = start + limit
+                return items[start:next_start], (str(next_start) if next_start < len(items) else '')
+            
+            def _replay(self, name: Optional[str], recorded: Dict[str, Any], parsed):
+                body = recorded.get('body')
+                headers = dict(recorded.get('headers', {}))
+                if isinstance(body, list) and name in ('github_pulls', 'github_teams', 'github_repos') \
+                        and recorded.get('status', 200) == 200:
+                    body, link = self._paginate_github(body)
+                    headers.update(link)
+                self._send(recorded.get('status', 200), body, headers)
+            
+            def _proxy_and_record(self, method: str, parsed, raw_body: bytes):
+                import requests
+                
+                forward_headers = {k: v for k, v in self.headers.items()
+                                   if k.lower() in ('authorization', 'accept', 'content-type')}
+                response = requests.request(method, f'{fake.record_upstream}{self.path}',
+                                            headers=forward_headers, data=raw_body or None)
+                try:
+                    payload = response.json()
+                except ValueError:
+                    payload = None
+                
+                with state.lock:
+                    fake.recorded[f'{method} {self.path}'] = {'status': response.status_code, 'body': payload}
+                self._send(response.status_code, payload)
+            
+            # GitHub
+            
+            def route_github_pulls(self, owner: str, repo: str):
+                pulls = state.generator.pull_requests(f'{owner}/{repo}')
+                page_items, headers = self._paginate_github(pulls)
+                self._send(200, page_items, headers)
+            
+            def route_github_contributors(self, owner: str, repo: str):
+                key = f'{owner}/{repo}'
+                with state.lock:
+                    polls = state.stats_polls.get(key, 0)
+                    state.stats_polls[key] = polls + 1
+                if polls < config.stats_pending_polls:
+                    # GitHub computes statistics asynchronously and answers 202 until ready
+                    self._send(202, {})
+                    return
+                self._send(200, state.generator.contributors(key))
+            
+            def route_github_membership(self, org: str, user: str):
+                self._send(200, {'state': 'pending', 'role': 'member', 'user': {'login': user}})
+            
+            def route_github_teams(self, org: str):
+                page_items, headers = self._paginate_github(state.teams)
+                self._send(200, page_items, headers)
+            
+            def route_github_repos(self, org: str):
+                page_items, headers = self._paginate_github(state.repos)
+                self._send(200, page_items, headers)
+            
+            def route_github_team_membership(self, team_id: str, user: str):
+                if not any(str(team['id']) == team_id for team in state.teams):
+                    self._send(404, {'message': 'Not Found'})
+                    return
+                self._send(200, {'state': 'active', 'role': 'member'})
+            
+            def route_github_team_repos(self, team_id: str):
+                team = next((team for team in state.teams if str(team['id']) == team_id), None)
+                if team is None:
+                    self._send(404, {'message': 'Not Found'})
+                    return
+                page_items, headers = self._paginate_github(state.generator.team_repos(team['name'], state.repos))
+                self._send(200, page_items, headers)
+            
+            def route_github_collaborator(self, owner: str, repo: str, user: str):
+                self._send(201, {'invitee': {'login': user}, 'permissions': self.json_body.get('permission')})
+            
+            # Slack
+            
+            def route_slack_post_message(self):
+                self._send(200, {'ok': True, 'channel': self.json_body.get('channel'), 'ts': f'{time.time():.6f}'})
+            
+            def route_slack_conversations_list(self):
+                channels, next_cursor = self._paginate_slack(state.channels)
+                self._send(200, {'ok': True, 'channels': channels,
+                                 'response_metadata': {'next_cursor': next_cursor}})
+            
+            def route_slack_invite(self):
+                self._send(200, {'ok': True, 'channel': {'id': self.json_body.get('channel')}})
+            
+            def route_slack_lookup_by_email(self):
+                email = self.query.get('email', '').lower()
+                user = next((u for u in state.users if u['profile']['email'] == email), None)
+                if user:
+                    self._send(200, {'ok': True, 'user': user})
+                else:
+                    self._send(200, {'ok': False, 'error': 'users_not_found'})
+            
+            def route_slack_users_list(self):
+                members, next_cursor = self._paginate_slack(state.users)
+                self._send(200, {'ok': True, 'members': members,
+                                 'response_metadata': {'next_cursor': next_cursor}})
+            
+            # Jira
+            
+            def route_jira_create_issue(self):
+                fields = self.json_body.get('fields')
+                if not fields or not fields.get('summary'):
+                    self._send(400, {'errorMessages': [], 'errors': {'summary': 'You must specify a summary.'}})
+                    return
+                issue = state.next_issue_key(fields)
+                issue['self'] = f"{fake.base_url}/rest/api/2/issue/{issue['id']}"
+                self._send(201, issue)
+            
+            def route_jira_bulk_create(self):
+                updates = self.json_body.get('issueUpdates', [])
+                if len(updates) > config.jira_bulk_limit:
+                    self._send(400, {'errorMessages': [f'Bulk create accepts at most {config.jira_bulk_limit} issues'],
+                                     'errors': {}})
+                    return
+                
+                issues, errors = [], []
+                for number, update in enumerate(updates):
+                    fields = update.get('fields') or {}
+                    if not fields.get('summary'):
+                        element_errors, status = {'errorMessages': [], 'errors': {'summary': 'You must specify a summary.'}}, 400
+                    elif random.random() < config.jira_bulk_failure_rate:
+                        element_errors, status = {'errorMessages': ['Issue could not be created, try again'],
+                                                  'errors': {}}, 503
+                    else:
+                        issue = state.next_issue_key(fields)
+                        issue['self'] = f"{fake.base_url}/rest/api/2/issue/{issue['id']}"
+                        issues.append(issue)
+                        continue
+                    errors.append({'status': status, 'elementErrors': element_errors, 'failedElementNumber': number})
+                
+                if issues and random.random() < config.jira_bulk_lost_rate:
+                    # The issues exist but the client never learns their keys
+                    self._send(502, {'message': 'Bad gateway'})
+                    return
+                # Jira answers 201 if anything was created and 400 if every element failed
+                self._send(201 if issues or not updates else 400, {'issues': issues, 'errors': errors})
+            
+            def route_jira_search(self):
+                # Only conjunctions of project/labels/cf[NNNNN] = "value" clauses are understood
+                clauses = re.findall(r'(\w+|cf\[\d+\])\s*=\s*"?([^"\s]+)"?', self.query.get('jql', ''))
+                
+                def matches(key: str, fields: Dict[str, Any]) -> bool:
+                    for name, value in clauses:
+                        if name == 'project' and key.split('-')[0] != value:
+                            return False
+                        if name == 'labels' and value not in fields.get('labels', []):
+                            return False
+                        if name.startswith('cf[') and fields.get(f'customfield_{name[3:-1]}') != value:
+                            return False
+                    return True
+                
+                with state.lock:
+                    found = [{'key': key, 'fields': {'summary': fields.get('summary')}} 
+                             for key, fields in state.jira_issues.items() if matches(key, fields)]
+                limit = int(self.query.get('maxResults', 50))
+                self._send(200, {'startAt': 0, 'maxResults': limit, 'total': len(found), 'issues': found[:limit]})
+            
+            # Deployment and incident feeds
+            
+            def _time_range(self) -> Tuple[datetime, datetime]:
+                until = datetime.fromisoformat(self.query['until']) if 'until' in self.query \
+                    else datetime.now()
+                since = datetime.fromisoformat(self.query['since']) if 'since' in self.query \
+                    else until - timedelta(days=30)
+                return since, until
+            
+            def route_deployments(self):
+                since, until = self._time_range()
+                self._send(200, state.generator.deployments(self.query.get('service', ''), since, until))
+            
+            def route_incidents(self):
+                since, until = self._time_range()
+                self._send(200, state.generator.incidents(self.query.get('service', ''), since, until))
+            
+            def route_server_stats(self):
+                with state.lock:
+                    self._send(200, {'requests': dict(state.request_counts),
+                                     'jira_issues': len(state.jira_issues)})
+        
+        return Handler
+
+def main():
+    """CLI entry point for the fake API server"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Local fake GitHub/Slack/Jira/deployment API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--fixtures', help='Recorded fixtures to replay (or write, with --record)')
+    parser.add_argument('--record', metavar='UPSTREAM', help='Proxy to UPSTREAM and record responses')
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--latency-jitter-ms', type=float, default=0.0)
+    parser.add_argument('--page-size', type=int, default=30)
+    parser.add_argument('--stats-pending-polls', type=int, default=1, help='202 responses before stats are ready')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Requests per window per API before 429')
+    parser.add_argument('--rate-limit-window', type=float, default=60.0)
+    parser.add_argument('--max-concurrency', type=int, default=0)
+    parser.add_argument('--jira-bulk-failure-rate', type=float, default=0.0,
+                        help='Fraction of Jira bulk-create items to reject')
+    parser.add_argument('--jira-bulk-lost-rate', type=float, default=0.0,
+                        help='Fraction of Jira bulk creates that succeed but answer 502')
+    parser.add_argument('--seed', type=int, default=42)
+    
+    args = parser.parse_args()
+    
+    config = FakeAPIConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        page_size=args.page_size,
+        stats_pending_polls=args.stats_pending_polls,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        max_concurrency=args.max_concurrency,
+        jira_bulk_failure_rate=args.jira_bulk_failure_rate,
+        jira_bulk_lost_rate=args.jira_bulk_lost_rate,
+        seed=args.seed
+    )
+    
+    fixtures = None
+    if args.fixtures and not args.record:
+        with open(args.fixtures, 'r') as f:
+            fixtures = json.load(f)
+    
+    server = FakeAPIServer(config, fixtures, host=args.host, port=args.port, record_upstream=args.record)
+    print(f"Fake API server listening on {server.base_url}")
+    
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+        if args.record and args.fixtures:
+            server.save_recording(args.fixtures)
+            print(f"Recorded {len(server.recorded)} responses to {args.fixtures}")
+
+if __name__ == "__main__":
+    main()
@@ -11,14 +11,23 @@ Last Updated: 2024-05-24
 
 import os
 import json
+import time
 import logging
+import uuid
+import random
+import socket
 import smtplib
+import sqlite3
+import threading
 import requests
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Any
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from typing import List, Dict, Optional, Any, Callable, Tuple
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 import subprocess
 import yaml
 
@@ -60,6 +69,18 @@ class OnboardingTask:
     dependencies: List[str] = None
     automation_script: Optional[str] = None
 
+@dataclass
+class OnboardingStep:
+    """One node of the onboarding dependency graph
+    
+    `run` receives the employee and the shared results dict; it may read the
+    results of the steps listed in `dependencies`, which are complete by then.
+    """
+    name: str
+    run: Callable[['NewEmployee', Dict[str, Any]], Dict[str, Any]]
+    integration: str
+    dependencies: List[str] = None
+
 class OnboardingConfig:
     """Configuration management for onboarding automation"""
     
@@ -79,6 +100,7 @@ class OnboardingConfig:
     def _default_config(self) -> Dict[str, Any]:
         """Default configuration if file doesn't exist"""
         return {
+            'journal': 'onboarding_journal.db',
             'company': {
                 'name': 'Your Company',
                 'domain': 'company.com',
@@ -86,11 +108,23 @@ class OnboardingConfig:
             },
             'github': {
                 'org': 'your-org',
-                'base_url': 'https://api.github.com'
+                'base_url': 'https://api.github.com',
+                'org_cache': '.github_org_cache.json',
+                'org_cache_ttl': 3600,
+                'grant_workers': 4,
+                'grant_via_team': True
+            },
+            'slack': {
+                'base_url': 'https://slack.com/api',
+                'channel_cache_ttl': 900,
+                'user_directory_cache': '.slack_user_directory.json',
+                'user_directory_ttl': 86400
             },
             'jira': {
                 'url': 'https://company.atlassian.net',
-                'project_key': 'ONBOARD'
+                'project_key': 'ONBOARD',
+                'bulk_size': 50,
+                'fallback_workers': 4
             },
             'aws': {
                 'region': 'us-west-2',
@@ -99,7 +133,24 @@ class OnboardingConfig:
             'email': {
                 'smtp_server': 'smtp.company.com',
                 'smtp_port': 587,
-                'from_address': 'engineering@company.com'
+                'from_address': 'engineering@company.com',
+                'pool_size': 2,
+                'max_messages_per_connection': 100,
+                'idle_timeout': 60,
+                'starttls': True,
+                'outbox': 'email_outbox.db',
+                'outbox_workers': 2,
+                'max_attempts': 6,
+                'retry_base_seconds': 30,
+                'drain_timeout': 30
+            },
+            'concurrency': {
+                'workers': 8,
+                'github': 4,
+                'slack': 4,
+                'jira': 4,
+                'smtp': 2,
+                'aws': 2
             },
             'teams': {
                 'backend': ['python', 'postgres', 'redis', 'aws'],
@@ -112,14 +163,38 @@ class OnboardingConfig:
 class GitHubIntegration:
     """GitHub API integration for repository access and team management"""
     
-    def __init__(self, token: str, org: str):
+    ORG_PAGE_SIZE = 100
+    ORG_MISS_REFRESH_SECONDS = 60   # Don't re-list the org on every lookup of a missing team or repo
+    RATE_LIMIT_RETRIES = 4
+    
+    def __init__(self, token: str, org: str, base_url: str = 'https://api.github.com',
+                 org_cache_path: Optional[str] = '.github_org_cache.json', org_cache_ttl: float = 3600,
+                 grant_workers: int = 4):
         self.token = token
         self.org = org
         self.headers = {
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
         }
-        self.base_url = 'https://api.github.com'
+        self.base_url = base_url.rstrip('/')
+        
+        # Teams (by lowercased name and slug) and repositories (by lowercased name),
+        # listed once and shared by every employee this instance onboards
+        self.org_cache_path = org_cache_path
+        self.org_cache_ttl = org_cache_ttl
+        self._teams: List[Dict[str, Any]] = []
+        self._repos: List[Dict[str, Any]] = []
+        self._team_index: Dict[str, Dict[str, Any]] = {}
+        self._repo_index: Dict[str, Dict[str, Any]] = {}
+        self._org_fetched_at: Optional[float] = None
+        self._org_attempted_at: Optional[float] = None
+        self._org_lock = threading.Lock()
+        self._team_repos: Dict[int, Dict[str, bool]] = {}   # team id -> lowercased repo -> team can push
+        
+        # Rate limits apply per token, so one backoff pauses every thread using this instance
+        self.grant_workers = grant_workers
+        self._paused_until = 0.0
+        self._pause_lock = threading.Lock()
     
     def add_user_to_org(self, username: str) -> bool:
         """Add user to GitHub organization"""
@@ -127,7 +202,7 @@ class GitHubIntegration:
         data = {'role': 'member'}
         
         try:
-            response = requests.put(url, headers=self.headers, json=data)
+            response = self._request('PUT', url, json=data)
             if response.status_code in [200, 201]:
                 logger.info(f"Added {username} to GitHub org {self.org}")
                 return True
@@ -149,7 +224,7 @@ class GitHubIntegration:
         data = {'role': 'member'}
         
         try:
-            response = requests.put(url, headers=self.headers, json=data)
+            response = self._request('PUT', url, json=data)
             if response.status_code in [200, 201]:
                 logger.info(f"Added {username} to team {team_name}")
                 return True
@@ -161,55 +236,258 @@ class GitHubIntegration:
             return False
     
     def _get_team_id(self, team_name: str) -> Optional[int]:
-        """Get team ID by name"""
-        url = f"{self.base_url}/orgs/{self.org}/teams"
+        """Get team ID by name or slug (case-insensitive)"""
+        team = self.get_team(team_name)
+        return team['id'] if team else None
+    
+    def get_team(self, team_name: str) -> Optional[Dict[str, Any]]:
+        """Team record (id, name, slug) from the org metadata cache"""
+        return self._lookup_org('_team_index', team_name)
+    
+    def get_repository(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Repository record (name, archived) from the org metadata cache"""
+        return self._lookup_org('_repo_index', repo_name)
+    
+    def team_repositories(self, team_name: str) -> Dict[str, bool]:
+        """Repositories the team has access to, as lowercased name -> team can push
+        
+        Listed once per team per org refresh; empty if the team is unknown or the
+        listing fails.
+        """
+        team = self.get_team(team_name)
+        if team is None:
+            return {}
+        with self._org_lock:
+            cached = self._team_repos.get(team['id'])
+        if cached is not None:
+            return cached
+        
+        # Listed without the lock: rate-limit backoff can sleep, and other teams shouldn't wait on it
+        repos = self._list_all(f"{self.base_url}/teams/{team['id']}/repos")
+        if repos is None:
+            return {}
+        # A missing permissions block doesn't prove push access, so grant individually then
+        listed = {repo['name'].lower(): repo.get('permissions', {}).get('push', False) for repo in repos}
+        with self._org_lock:
+            return self._team_repos.setdefault(team['id'], listed)
+    
+    def load_org_metadata(self, force: bool = False):
+        """Load teams and repositories, from the snapshot if fresh enough, else from the API"""
+        with self._org_lock:
+            if force:
+                self._org_fetched_at = self._org_attempted_at = None
+            self._ensure_org_metadata()
+    
+    def _lookup_org(self, index_name: str, name: str) -> Optional[Dict[str, Any]]:
+        key = name.lower()
+        with self._org_lock:
+            self._ensure_org_metadata()
+            record = getattr(self, index_name).get(key)
+            if record is None and self._may_refresh_org():
+                logger.info(f"{name} not in GitHub org cache, refreshing")
+                self._refresh_org_metadata()
+                record = getattr(self, index_name).get(key)
+            return record
+    
+    def _ensure_org_metadata(self):
+        """Make sure org metadata is loaded and within its TTL (caller holds _org_lock)"""
+        if self._org_fetched_at is None:
+            self._load_org_snapshot()
+        expired = self._org_fetched_at is None or time.time() - self._org_fetched_at > self.org_cache_ttl
+        if expired and self._may_refresh_org():
+            self._refresh_org_metadata()
+    
+    def _may_refresh_org(self) -> bool:
+        """Whether enough time has passed since the last listing attempt"""
+        return self._org_attempted_at is None or \
+            time.monotonic() - self._org_attempted_at > self.ORG_MISS_REFRESH_SECONDS
+    
+    def _refresh_org_metadata(self):
+        """Re-list every team and repository in the org; keep the old data on failure"""
+        self._org_attempted_at = time.monotonic()
+        teams = self._list_all(f"{self.base_url}/orgs/{self.org}/teams")
+        repos = self._list_all(f"{self.base_url}/orgs/{self.org}/repos")
+        if teams is not None:
+            self._teams = [{'id': t['id'], 'name': t['name'], 'slug': t.get('slug', t['name'])} for t in teams]
+        if repos is not None:
+            self._repos = [{'name': r['name'], 'archived': r.get('archived', False)} for r in repos]
+        self._index_org_metadata()
+        self._team_repos = {}
+        if teams is None or repos is None:
+            return
+        
+        self._org_fetched_at = time.time()
+        logger.info(f"Cached {len(self._teams)} teams and {len(self._repos)} repositories for {self.org}")
+        self._save_org_snapshot()
+    
+    def _list_all(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Follow Link rel="next" pages of a GitHub list endpoint"""
+        params = {'per_page': self.ORG_PAGE_SIZE}
+        items = []
         
         try:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                teams = response.json()
-                for team in teams:
-                    if team['name'].lower() == team_name.lower():
-                        return team['id']
-            return None
+            while url:
+                response = self._request('GET', url, params=params)
+                if response.status_code != 200:
+                    logger.error(f"Error listing {url}: {response.text}")
+                    return None
+                items.extend(response.json())
+                url = response.links.get('next', {}).get('url')
+                params = None   # The next link already carries the query
         except Exception as e:
-            logger.error(f"Error getting team ID: {e}")
+            logger.error(f"Error listing {url}: {e}")
             return None
+        
+        return items
     
-    def grant_repository_access(self, username: str, repositories: List[str]) -> Dict[str, bool]:
-        """Grant user access to specified repositories"""
-        results = {}
+    def _index_org_metadata(self):
+        self._team_index = {}
+        for team in self._teams:
+            self._team_index[team['slug'].lower()] = team
+            self._team_index[team['name'].lower()] = team
+        self._repo_index = {repo['name'].lower(): repo for repo in self._repos}
+    
+    def _load_org_snapshot(self):
+        """Read the persisted org snapshot if it belongs to this org"""
+        if not self.org_cache_path or not os.path.exists(self.org_cache_path):
+            return
+        try:
+            with open(self.org_cache_path, 'r') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable GitHub org cache {self.org_cache_path}: {e}")
+            return
+        if snapshot.get('base_url') == self.base_url and snapshot.get('org') == self.org:
+            self._teams = snapshot.get('teams', [])
+            self._repos = snapshot.get('repos', [])
+            self._org_fetched_at = snapshot.get('fetched_at')
+            self._index_org_metadata()
+    
+    def _save_org_snapshot(self):
+        """Persist the org snapshot atomically (caller holds _org_lock)"""
+        if not self.org_cache_path:
+            return
+        tmp_path = f"{self.org_cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'base_url': self.base_url, 'org': self.org, 'fetched_at': self._org_fetched_at,
+                           'teams': self._teams, 'repos': self._repos}, f)
+            os.replace(tmp_path, self.org_cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save GitHub org cache: {e}")
+    
+    def grant_repository_access(self, username: str, repositories: List[str], 
+                                team_name: Optional[str] = None) -> Dict[str, bool]:
+        """Grant user access to specified repositories
+        
+        If team_name is given (and the user is a member of it), repositories the
+        team can already push to count as granted without a collaborator call.
+        The rest are granted concurrently on up to grant_workers threads.
+        """
+        results = dict.fromkeys(repositories, False)
+        via_team = self.team_repositories(team_name) if team_name else {}
+        pending = []
         
         for repo in repositories:
-            url = f"{self.base_url}/repos/{self.org}/{repo}/collaborators/{username}"
-            data = {'permission': 'write'}
+            if via_team.get(repo.lower()):
+                logger.info(f"{username} has access to {repo} through {team_name}")
+                results[repo] = True
+                continue
             
-            try:
-                response = requests.put(url, headers=self.headers, json=data)
-                success = response.status_code in [200, 201, 204]
-                results[repo] = success
-                
-                if success:
-                    logger.info(f"Granted {username} access to {repo}")
-                else:
-                    logger.error(f"Failed to grant access to {repo}: {response.text}")
-                    
-            except Exception as e:
-                logger.error(f"Error granting access to {repo}: {e}")
-                results[repo] = False
+            record = self.get_repository(repo)
+            if record is None and self._repo_index:
+                logger.error(f"Repository {repo} not found in {self.org}")
+                continue
+            pending.append((repo, record['name'] if record else repo))
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.grant_workers, len(pending)),
+                                    thread_name_prefix='github-grant') as executor:
+                granted = executor.map(lambda item: self._grant_collaborator(username, *item), pending)
+                for (repo, _), success in zip(pending, granted):
+                    results[repo] = success
         
         return results
+    
+    def _grant_collaborator(self, username: str, repo: str, repo_name: str) -> bool:
+        url = f"{self.base_url}/repos/{self.org}/{repo_name}/collaborators/{username}"
+        data = {'permission': 'write'}
+        
+        try:
+            response = self._request('PUT', url, json=data)
+            success = response.status_code in [200, 201, 204]
+            
+            if success:
+                logger.info(f"Granted {username} access to {repo}")
+            else:
+                logger.error(f"Failed to grant access to {repo}: {response.text}")
+            return success
+                
+        except Exception as e:
+            logger.error(f"Error granting access to {repo}: {e}")
+            return False
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, waiting out primary and secondary rate limits"""
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            with self._pause_lock:
+                pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+            
+            response = requests.request(method, url, headers=self.headers, **kwargs)
+            delay = self._rate_limit_delay(response, attempt)
+            if delay is None or attempt == self.RATE_LIMIT_RETRIES:
+                return response
+            
+            logger.warning(f"GitHub rate limit hit, pausing {delay:.0f}s")
+            with self._pause_lock:
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+    
+    def _rate_limit_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the response isn't a rate limit"""
+        if response.status_code not in (403, 429):
+            return None
+        if 'Retry-After' in response.headers:
+            return float(response.headers['Retry-After'])
+        if response.headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in response.headers:
+            return max(float(response.headers['X-RateLimit-Reset']) - time.time(), 1.0)
+        if 'secondary rate limit' in response.text.lower():
+            # GitHub asks for at least a minute, growing exponentially on repeats
+            return 60.0 * 2 ** attempt
+        return None
 
 class SlackIntegration:
     """Slack API integration for user management and notifications"""
     
-    def __init__(self, token: str):
+    CHANNEL_PAGE_SIZE = 200
+    CHANNEL_MISS_REFRESH_SECONDS = 60   # Don't re-list on every lookup of a channel that doesn't exist
+    USER_PAGE_SIZE = 200
+    RATE_LIMIT_RETRIES = 4   # Consecutive 429s tolerated per listing page
+    REQUEST_TIMEOUT = 30
+    
+    def __init__(self, token: str, base_url: str = 'https://slack.com/api', channel_cache_ttl: float = 900,
+                 user_directory_path: Optional[str] = '.slack_user_directory.json',
+                 user_directory_ttl: float = 86400):
         self.token = token
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         }
-        self.base_url = 'https://slack.com/api'
+        self.base_url = base_url.rstrip('/')
+        
+        # Channel name -> ID, shared by every employee this instance onboards
+        self.channel_cache_ttl = channel_cache_ttl
+        self._channel_index: Dict[str, str] = {}
+        self._channel_index_loaded_at: Optional[float] = None
+        self._channel_lock = threading.Lock()
+        
+        # Lowercased email -> user ID from users.list, persisted between runs
+        self.user_directory_path = user_directory_path
+        self.user_directory_ttl = user_directory_ttl
+        self._user_index: Dict[str, str] = {}
+        self._user_index_fetched_at: Optional[float] = None
+        self._user_lock = threading.Lock()
     
     def send_welcome_message(self, user_id: str, employee: NewEmployee) -> bool:
         """Send welcome message to new employee"""
@@ -324,36 +602,196 @@ Looking forward to having you on the team, <@{employee.slack_user_id}>! 🎉
             return False
     
     def _get_channel_id(self, channel_name: str) -> Optional[str]:
-        """Get channel ID by name"""
+        """Get channel ID by name from the cached channel index
+        
+        The index is rebuilt when older than channel_cache_ttl, or on a miss if the
+        last rebuild is more than CHANNEL_MISS_REFRESH_SECONDS old (new channels).
+        """
+        channel_name = channel_name.lstrip('#')
+        
+        with self._channel_lock:
+            age = None if self._channel_index_loaded_at is None else time.monotonic() - self._channel_index_loaded_at
+            if age is None or age > self.channel_cache_ttl:
+                self._refresh_channel_index()
+            elif channel_name not in self._channel_index and age > self.CHANNEL_MISS_REFRESH_SECONDS:
+                logger.info(f"Channel {channel_name} not in index, refreshing")
+                self._refresh_channel_index()
+            return self._channel_index.get(channel_name)
+    
+    def _refresh_channel_index(self):
+        """Rebuild the channel index from every page of conversations.list
+        
+        Callers hold _channel_lock. On failure the previous index is kept.
+        """
+        index = self._list_channels()
+        # Stamped on failure too, so an unreachable Slack isn't re-listed on every
+        # lookup; misses still retry after CHANNEL_MISS_REFRESH_SECONDS
+        self._channel_index_loaded_at = time.monotonic()
+        if index is not None:
+            self._channel_index = index
+            logger.info(f"Indexed {len(index)} Slack channels")
+    
+    def _list_channels(self) -> Optional[Dict[str, str]]:
+        """Page through conversations.list and index channel IDs by name"""
         url = f"{self.base_url}/conversations.list"
-        params = {'types': 'public_channel,private_channel'}
+        params = {
+            'types': 'public_channel,private_channel',
+            'exclude_archived': 'true',
+            'limit': self.CHANNEL_PAGE_SIZE
+        }
+        index = {}
+        throttled = 0
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
-                channels = response.json().get('channels', [])
-                for channel in channels:
-                    if channel['name'] == channel_name:
-                        return channel['id']
-            return None
+            while True:
+                response = requests.get(url, headers=self.headers, params=params, timeout=self.REQUEST_TIMEOUT)
+                if response.status_code == 429:
+                    throttled += 1
+                    if throttled > self.RATE_LIMIT_RETRIES:
+                        logger.error("Still rate limited listing Slack channels; keeping the previous index")
+                        return None
+                    time.sleep(float(response.headers.get('Retry-After', 1)))
+                    continue
+                throttled = 0
+                payload = response.json()
+                if response.status_code != 200 or not payload.get('ok', False):
+                    logger.error(f"Error listing channels: {response.text}")
+                    return None
+                
+                for channel in payload.get('channels', []):
+                    index[channel['name']] = channel['id']
+                
+                cursor = payload.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+                params['cursor'] = cursor
         except Exception as e:
-            logger.error(f"Error getting channel ID: {e}")
+            logger.error(f"Error listing channels: {e}")
             return None
+        
+        return index
     
     def _get_user_id_by_email(self, email: str) -> Optional[str]:
-        """Get user ID by email"""
+        """Get user ID by email, from the user directory when possible
+        
+        Only addresses missing from the directory (accounts created since it was
+        fetched) cost a users.lookupByEmail call; hits are added to the directory.
+        """
+        key = email.strip().lower()
+        with self._user_lock:
+            self._ensure_user_directory()
+            user_id = self._user_index.get(key)
+        if user_id:
+            return user_id
+        
         url = f"{self.base_url}/users.lookupByEmail"
         params = {'email': email}
         
         try:
             response = requests.get(url, headers=self.headers, params=params)
             if response.status_code == 200:
-                return response.json().get('user', {}).get('id')
+                user_id = response.json().get('user', {}).get('id')
+                if user_id:
+                    with self._user_lock:
+                        self._user_index[key] = user_id
+                        self._save_user_directory()
+                return user_id
             return None
         except Exception as e:
             logger.error(f"Error looking up user by email: {e}")
             return None
     
+    def prefetch_user_directory(self, force: bool = False):
+        """Load the user directory, from disk if fresh enough, else from users.list"""
+        with self._user_lock:
+            if force:
+                self._user_index_fetched_at = None
+            self._ensure_user_directory()
+    
+    def _ensure_user_directory(self):
+        """Make sure the user index is loaded and within its TTL (caller holds _user_lock)"""
+        if self._user_index_fetched_at is None:
+            self._load_user_directory()
+        if self._user_index_fetched_at is not None and \
+                time.time() - self._user_index_fetched_at <= self.user_directory_ttl:
+            return
+        
+        index = self._fetch_user_directory()
+        if index is not None:
+            self._user_index = index
+            self._user_index_fetched_at = time.time()
+            self._save_user_directory()
+        elif self._user_index_fetched_at is None:
+            # Nothing cached and the fetch failed; fall back to per-person lookups
+            # without retrying the full listing for every employee
+            self._user_index_fetched_at = time.time()
+    
+    def _fetch_user_directory(self) -> Optional[Dict[str, str]]:
+        """Page through users.list and index active members by email"""
+        url = f"{self.base_url}/users.list"
+        params = {'limit': self.USER_PAGE_SIZE}
+        index = {}
+        throttled = 0
+        
+        try:
+            while True:
+                response = requests.get(url, headers=self.headers, params=params, timeout=self.REQUEST_TIMEOUT)
+                if response.status_code == 429:
+                    throttled += 1
+                    if throttled > self.RATE_LIMIT_RETRIES:
+                        logger.error("Still rate limited listing Slack users; falling back to per-email lookups")
+                        return None
+                    time.sleep(float(response.headers.get('Retry-After', 1)))
+                    continue
+                throttled = 0
+                payload = response.json()
+                if response.status_code != 200 or not payload.get('ok', False):
+                    logger.error(f"Error listing users: {response.text}")
+                    return None
+                
+                for member in payload.get('members', []):
+                    email = member.get('profile', {}).get('email')
+                    if email and not member.get('deleted') and not member.get('is_bot'):
+                        index[email.lower()] = member['id']
+                
+                cursor = payload.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+                params['cursor'] = cursor
+        except Exception as e:
+            logger.error(f"Error listing users: {e}")
+            return None
+        
+        logger.info(f"Indexed {len(index)} Slack users")
+        return index
+    
+    def _load_user_directory(self):
+        """Read the persisted directory if it belongs to this workspace"""
+        if not self.user_directory_path or not os.path.exists(self.user_directory_path):
+            return
+        try:
+            with open(self.user_directory_path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable Slack user directory {self.user_directory_path}: {e}")
+            return
+        if cached.get('base_url') == self.base_url:
+            self._user_index = cached.get('users', {})
+            self._user_index_fetched_at = cached.get('fetched_at')
+    
+    def _save_user_directory(self):
+        """Persist the directory atomically (caller holds _user_lock)"""
+        if not self.user_directory_path:
+            return
+        tmp_path = f"{self.user_directory_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'base_url': self.base_url, 'fetched_at': self._user_index_fetched_at,
+                           'users': self._user_index}, f)
+            os.replace(tmp_path, self.user_directory_path)
+        except OSError as e:
+            logger.warning(f"Could not save Slack user directory: {e}")
+    
     def _add_user_to_channel(self, user_id: str, channel_id: str) -> bool:
         """Add user to specific channel"""
         url = f"{self.base_url}/conversations.invite"
@@ -372,19 +810,26 @@ Looking forward to having you on the team, <@{employee.slack_user_id}>! 🎉
 class JiraIntegration:
     """Jira API integration for onboarding task management"""
     
-    def __init__(self, url: str, username: str, api_token: str):
-        self.url = url
+    BULK_LIMIT = 50   # Jira's maximum issueUpdates per bulk request
+    REQUEST_TIMEOUT = 30
+    
+    def __init__(self, url: str, username: str, api_token: str, bulk_size: int = 50, fallback_workers: int = 4,
+                 project_key: str = 'ONBOARD'):
+        self.url = url.rstrip('/')
+        self.project_key = project_key
         self.auth = (username, api_token)
         self.headers = {
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
+        self.bulk_size = max(1, min(bulk_size, self.BULK_LIMIT))
+        self.fallback_workers = fallback_workers
     
     def create_onboarding_epic(self, employee: NewEmployee) -> Optional[str]:
         """Create onboarding epic for new employee"""
         epic_data = {
             "fields": {
-                "project": {"key": "ONBOARD"},
+                "project": {"key": self.project_key},
                 "summary": f"Onboarding: {employee.first_name} {employee.last_name}",
                 "description": f"""
 Onboarding epic for {employee.first_name} {employee.last_name}
@@ -408,7 +853,8 @@ This epic tracks all onboarding tasks and milestones.
                 f"{self.url}/rest/api/2/issue",
                 auth=self.auth,
                 headers=self.headers,
-                json=epic_data
+                json=epic_data,
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code == 201:
@@ -424,15 +870,138 @@ This epic tracks all onboarding tasks and milestones.
     
     def create_onboarding_tasks(self, epic_key: str, employee: NewEmployee) -> List[str]:
         """Create standardized onboarding tasks"""
+        return [key for key in self.create_onboarding_task_keys(epic_key, employee).values() if key]
+    
+    def create_onboarding_task_keys(self, epic_key: str, employee: NewEmployee, 
+                                    existing: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+        """Create the standard tasks, returning task id -> issue key (None if failed)
+        
+        Tasks with a key in `existing` (from an earlier, partial run) are not created again.
+        """
+        existing = existing or {}
         tasks = self._get_onboarding_tasks(employee)
-        created_tasks = []
+        missing = [(task.id, self._task_payload(task, epic_key, employee)) for task in tasks
+                   if not existing.get(task.id)]
+        created = self.create_issues(missing) if missing else {}
         
-        for task in tasks:
-            task_key = self._create_task(task, epic_key, employee)
-            if task_key:
-                created_tasks.append(task_key)
+        return {task.id: existing.get(task.id) or created.get(task.id) for task in tasks}
+    
+    def create_issues(self, issues: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Optional[str]]:
+        """Create (item id, issue payload) pairs, returning item id -> issue key (None if failed)
         
-        return created_tasks
+        Issues go to /rest/api/2/issue/bulk in chunks of bulk_size. Items Jira
+        definitely did not create (per-element errors, or a chunk the endpoint
+        rejected outright) are retried as concurrent single creates. After an
+        ambiguous failure such as a timeout or 5xx the chunk may have been
+        created, so each item is first looked up by its labels and epic link.
+        """
+        created: Dict[str, Optional[str]] = {item_id: None for item_id, _ in issues}
+        retry = []
+        
+        for start in range(0, len(issues), self.bulk_size):
+            chunk = issues[start:start + self.bulk_size]
+            failed, unknown = self._bulk_create(chunk, created)
+            retry.extend((chunk[number], False) for number in failed)
+            retry.extend((chunk[number], True) for number in unknown)
+        
+        if retry:
+            logger.warning(f"Retrying {len(retry)} of {len(issues)} Jira issues individually")
+            with ThreadPoolExecutor(max_workers=min(self.fallback_workers, len(retry)),
+                                    thread_name_prefix='jira-create') as executor:
+                keys = executor.map(lambda entry: self._retry_issue(*entry[0], lookup=entry[1]), retry)
+                for ((item_id, _), _), key in zip(retry, keys):
+                    created[item_id] = key
+        
+        return created
+    
+    def _bulk_create(self, chunk: List[Tuple[str, Dict[str, Any]]], 
+                     created: Dict[str, Optional[str]]) -> Tuple[List[int], List[int]]:
+        """Create one chunk in a single request
+        
+        Returns positions in the chunk that definitely failed, and positions
+        whose outcome is unknown and which may already exist in Jira.
+        """
+        everything = list(range(len(chunk)))
+        try:
+            response = requests.post(
+                f"{self.url}/rest/api/2/issue/bulk",
+                auth=self.auth,
+                headers=self.headers,
+                json={'issueUpdates': [payload for _, payload in chunk]},
+                timeout=self.REQUEST_TIMEOUT
+            )
+        except Exception as e:
+            # A timeout or dropped connection says nothing about what Jira created
+            logger.error(f"Jira bulk create failed: {e}")
+            return [], everything
+        
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            body = {}
+        
+        if response.status_code in (404, 405):
+            logger.warning("Jira bulk create endpoint not available; creating issues individually")
+            return everything, []
+        if 'issues' not in body or not isinstance(body.get('errors'), list):
+            if 400 <= response.status_code < 500 and (body.get('errorMessages') or body.get('errors')):
+                # Request-level rejection: nothing in the chunk was created
+                logger.error(f"Jira bulk create rejected: {response.text}")
+                return everything, []
+            logger.error(f"Jira bulk create returned {response.status_code}: {response.text}")
+            return [], everything
+        
+        errors = body['errors']
+        failed = sorted({error.get('failedElementNumber') for error in errors})
+        if not all(isinstance(number, int) and 0 <= number < len(chunk) for number in failed):
+            # Issues can't be matched to elements without valid positions
+            logger.error(f"Jira bulk create returned unexpected element numbers: {failed}")
+            return [], everything
+        for error in errors:
+            item_id = chunk[error['failedElementNumber']][0]
+            logger.warning(f"Jira bulk create failed for {item_id}: {error.get('elementErrors')}")
+        
+        # Created issues are listed in request order, skipping failed elements
+        succeeded = [number for number in everything if number not in failed]
+        for number, issue in zip(succeeded, body['issues']):
+            item_id, payload = chunk[number]
+            created[item_id] = issue['key']
+            logger.info(f"Created onboarding task: {issue['key']} - {payload['fields'].get('summary')}")
+        return failed, succeeded[len(body['issues']):]
+    
+    def _retry_issue(self, item_id: str, payload: Dict[str, Any], lookup: bool = False) -> Optional[str]:
+        """Create one issue after a bulk failure, reusing one a lost bulk response created"""
+        if lookup:
+            try:
+                key = self._find_issue(payload)
+            except Exception as e:
+                # Creating now could duplicate an issue the bulk request made
+                logger.error(f"Could not check Jira for {item_id} after a failed bulk create: {e}")
+                return None
+            if key:
+                logger.info(f"Found onboarding task from failed bulk create: {key} - {payload['fields'].get('summary')}")
+                return key
+        return self._create_issue(item_id, payload)
+    
+    def _find_issue(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Key of an existing issue with the payload's project, labels and epic link, if any"""
+        fields = payload['fields']
+        clauses = [f'project = "{fields["project"]["key"]}"']
+        clauses += [f'labels = "{label}"' for label in fields.get('labels', [])]
+        if fields.get('customfield_10014'):
+            clauses.append(f'cf[10014] = "{fields["customfield_10014"]}"')
+        response = requests.get(
+            f"{self.url}/rest/api/2/search",
+            auth=self.auth,
+            headers=self.headers,
+            params={'jql': ' AND '.join(clauses), 'fields': 'summary', 'maxResults': 1},
+            timeout=self.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        issues = response.json().get('issues', [])
+        return issues[0]['key'] if issues else None
     
     def _get_onboarding_tasks(self, employee: NewEmployee) -> List[OnboardingTask]:
         """Get list of onboarding tasks based on role and team"""
@@ -531,11 +1100,11 @@ This epic tracks all onboarding tasks and milestones.
         
         return base_tasks
     
-    def _create_task(self, task: OnboardingTask, epic_key: str, employee: NewEmployee) -> Optional[str]:
-        """Create individual onboarding task"""
-        task_data = {
+    def _task_payload(self, task: OnboardingTask, epic_key: str, employee: NewEmployee) -> Dict[str, Any]:
+        """Issue payload for an onboarding task"""
+        return {
             "fields": {
-                "project": {"key": "ONBOARD"},
+                "project": {"key": self.project_key},
                 "summary": task.title,
                 "description": task.description,
                 "issuetype": {"name": "Task"},
@@ -545,35 +1114,412 @@ This epic tracks all onboarding tasks and milestones.
                 "labels": ["onboarding", employee.team, task.id]
             }
         }
-        
+    
+    def _create_issue(self, item_id: str, task_data: Dict[str, Any]) -> Optional[str]:
+        """Create individual onboarding task"""
+        title = task_data['fields'].get('summary', item_id)
         try:
             response = requests.post(
                 f"{self.url}/rest/api/2/issue",
                 auth=self.auth,
                 headers=self.headers,
-                json=task_data
+                json=task_data,
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code == 201:
                 task_key = response.json()['key']
-                logger.info(f"Created onboarding task: {task_key} - {task.title}")
+                logger.info(f"Created onboarding task: {task_key} - {title}")
                 return task_key
             else:
-                logger.error(f"Failed to create task {task.title}: {response.text}")
+                logger.error(f"Failed to create task {title}: {response.text}")
                 return None
         except Exception as e:
-            logger.error(f"Error creating task {task.title}: {e}")
+            logger.error(f"Error creating task {title}: {e}")
             return None
 
+class SMTPConnectionPool:
+    """Authenticated SMTP sessions reused across messages
+    
+    At most `size` sessions are open at once. A session is closed after
+    `max_messages` messages or when it has sat idle longer than `idle_timeout`
+    seconds, since relays drop quiet connections. A send that finds its session
+    dropped by the server is retried once on a fresh one.
+    """
+    
+    def __init__(self, host: str, port: int, username: Optional[str], password: Optional[str],
+                 size: int = 2, max_messages: int = 100, idle_timeout: float = 60, starttls: bool = True):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.max_messages = max_messages
+        self.idle_timeout = idle_timeout
+        self.starttls = starttls
+        self._idle = deque()   # (session, last used, messages sent)
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.stats = {'connections': 0, 'messages': 0, 'reconnects': 0}
+    
+    def sendmail(self, from_address: str, to_addresses: List[str], message: str):
+        """Send one message, reconnecting once if the pooled session was dropped"""
+        with self._slots:
+            for attempt in range(2):
+                server, sent = self._checkout(fresh=attempt > 0)
+                try:
+                    server.sendmail(from_address, to_addresses, message)
+                except Exception as e:
+                    self._discard(server)
+                    # 421 is the server closing the session; anything else is a real failure
+                    dropped = isinstance(e, (smtplib.SMTPServerDisconnected, ConnectionError)) or \
+                        getattr(e, 'smtp_code', None) == 421
+                    if attempt or not dropped or sent == 0:
+                        raise
+                    with self._lock:
+                        self.stats['reconnects'] += 1
+                    continue
+                
+                with self._lock:
+                    self.stats['messages'] += 1
+                    if sent + 1 < self.max_messages:
+                        self._idle.append((server, time.monotonic(), sent + 1))
+                        server = None
+                if server is not None:
+                    self._discard(server)
+                return
+    
+    def close(self):
+        """Quit every idle session"""
+        with self._lock:
+            sessions = [server for server, _, _ in self._idle]
+            self._idle.clear()
+        for server in sessions:
+            self._discard(server)
+    
+    def _checkout(self, fresh: bool = False):
+        """An idle session that is still recent, or a new one (caller holds a slot)"""
+        if fresh:
+            return self._connect(), 0
+        
+        stale = []
+        with self._lock:
+            while self._idle:
+                server, last_used, sent = self._idle.pop()
+                if time.monotonic() - last_used <= self.idle_timeout:
+                    break
+                stale.append(server)
+            else:
+                server, sent = None, 0
+        for old in stale:
+            self._discard(old)
+        
+        if server is None:
+            server = self._connect()
+        return server, sent
+    
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=30)
+        try:
+            if self.starttls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            self._discard(server)
+            raise
+        with self._lock:
+            self.stats['connections'] += 1
+        return server
+    
+    def _discard(self, server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+class EmailOutbox:
+    """Durable SQLite spool of outgoing mail, drained by background sender threads
+    
+    enqueue() only writes the rendered message and returns. Each of `workers`
+    threads claims the next due message and hands it to `sender`; a failure is
+    retried with exponential backoff (base_delay doubling up to max_delay, with
+    jitter) until max_attempts, while 5xx rejections of the recipients or content
+    fail immediately. Failing to connect or log in to the relay isn't the
+    message's fault: it is requeued without using an attempt and the whole outbox
+    pauses, backing off the same way, until a send succeeds. Messages still
+    queued at exit stay in the spool and are picked up by the next run.
+    
+    Several processes may share one spool. A claim is a conditional UPDATE inside
+    BEGIN IMMEDIATE, stamped with this instance's ID, and is a lease: a message
+    left 'sending' longer than lease_seconds (its sender died) becomes claimable
+    again. Without a sender the outbox can only enqueue and report status;
+    read_only opens an existing spool for status queries without writing to it.
+    """
+    
+    POLL_SECONDS = 5   # How often idle senders look for mail spooled by other processes
+    
+    def __init__(self, path: str, sender: Optional[Callable[[str, str, str], None]] = None, workers: int = 2,
+                 max_attempts: int = 6, base_delay: float = 30, max_delay: float = 3600,
+                 lease_seconds: float = 300, read_only: bool = False):
+        self.path = path
+        self.sender = sender
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lease_seconds = lease_seconds
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        
+        self.read_only = read_only
+        if read_only:
+            self._db = sqlite3.connect(f'file:{path}?mode=ro', uri=True, check_same_thread=False,
+                                       isolation_level=None)
+        else:
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stopping = False
+        self._threads: List[threading.Thread] = []
+        self._paused_until = 0.0          # time.monotonic() before which no sender claims mail
+        self._connection_failures = 0
+        if read_only:
+            return
+        
+        with self._lock:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('''
+                CREATE TABLE IF NOT EXISTS messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tag TEXT,
+                    from_address TEXT NOT NULL,
+                    to_address TEXT NOT NULL,
+                    subject TEXT,
+                    message TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    sent_at REAL,
+                    claimed_by TEXT,
+                    claimed_at REAL
+                )''')
+            # Spools created before claims were leased lack the claim columns
+            columns = {row['name'] for row in self._db.execute('PRAGMA table_info(messages)')}
+            for column, kind in (('claimed_by', 'TEXT'), ('claimed_at', 'REAL')):
+                if column not in columns:
+                    self._db.execute(f'ALTER TABLE messages ADD COLUMN {column} {kind}')
+            self._db.execute('CREATE INDEX IF NOT EXISTS messages_due ON messages (status, next_attempt_at)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS messages_tag ON messages (tag)')
+    
+    def start(self):
+        """Requeue messages whose sender's lease expired and start the sender threads"""
+        if self.sender is None or self.read_only:
+            raise ValueError("EmailOutbox needs a sender and a writable spool to deliver mail")
+        with self._lock:
+            self._db.execute("UPDATE messages SET status = 'queued', claimed_by = NULL, claimed_at = NULL "
+                             "WHERE status = 'sending' AND (claimed_at IS NULL OR claimed_at < ?)",
+                             (time.time() - self.lease_seconds,))
+            self._stopping = False
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f'email-outbox-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def enqueue(self, from_address: str, to_address: str, subject: str, message: str,
+                tag: Optional[str] = None) -> int:
+        """Spool a rendered message for delivery and return its ID"""
+        now = time.time()
+        with self._wakeup:
+            cursor = self._db.execute(
+                'INSERT INTO messages (tag, from_address, to_address, subject, message, next_attempt_at, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (tag, from_address, to_address, subject, message, now, now))
+            self._wakeup.notify()
+            return cursor.lastrowid
+    
+    def status(self, tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Delivery state of every message, or of those enqueued with `tag`"""
+        query = 'SELECT id, tag, to_address, subject, status, attempts, last_error, created_at, sent_at FROM messages'
+        with self._lock:
+            if tag is None:
+                rows = self._db.execute(query + ' ORDER BY id').fetchall()
+            else:
+                rows = self._db.execute(query + ' WHERE tag = ? ORDER BY id', (tag,)).fetchall()
+        return [dict(row) for row in rows]
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of messages per status"""
+        with self._lock:
+            rows = self._db.execute('SELECT status, COUNT(*) FROM messages GROUP BY status').fetchall()
+        return {status: count for status, count in rows}
+    
+    def drain(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for messages that fall due within it to be attempted"""
+        deadline = time.monotonic() + timeout
+        horizon = time.time() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                pending = self._db.execute(
+                    "SELECT COUNT(*) FROM messages WHERE (status = 'sending' AND claimed_by = ?) OR "
+                    "(status = 'queued' AND next_attempt_at <= ?)", (self.instance_id, horizon)).fetchone()[0]
+            if not pending:
+                return True
+            if self._paused_until > deadline:
+                return False
+            time.sleep(0.05)
+        return False
+    
+    def close(self, drain_timeout: float = 30):
+        """Give due messages up to drain_timeout seconds, then stop the senders"""
+        if self._threads:
+            if not self.drain(drain_timeout):
+                logger.warning(f"Email outbox did not drain in {drain_timeout}s; unsent mail stays in {self.path}")
+            with self._wakeup:
+                self._stopping = True
+                self._wakeup.notify_all()
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+        with self._lock:
+            counts = dict(self._db.execute('SELECT status, COUNT(*) FROM messages GROUP BY status').fetchall())
+            self._db.close()
+        if counts.get('queued'):
+            logger.info(f"{counts['queued']} emails queued for retry in {self.path}")
+    
+    def _worker(self):
+        while True:
+            message = self._claim()
+            if message is None:
+                return
+            try:
+                self.sender(message['from_address'], message['to_address'], message['message'])
+            except Exception as e:
+                self._record_failure(message, e)
+            else:
+                with self._lock:
+                    self._connection_failures = 0
+                    self._db.execute("UPDATE messages SET status = 'sent', attempts = attempts + 1, sent_at = ?, "
+                                     "last_error = NULL, claimed_by = NULL, claimed_at = NULL "
+                                     "WHERE id = ? AND claimed_by = ?",
+                                     (time.time(), message['id'], self.instance_id))
+                logger.info(f"Email sent to {message['to_address']}: {message['subject']}")
+    
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Claim the next due message for this instance, waiting until one is due; None once stopping"""
+        with self._wakeup:
+            while not self._stopping:
+                paused = self._paused_until - time.monotonic()
+                if paused > 0:
+                    self._wakeup.wait(min(paused, self.POLL_SECONDS))
+                    continue
+                
+                now = time.time()
+                row = self._try_claim(now)
+                if row is not None:
+                    return row
+                
+                upcoming = self._db.execute(
+                    "SELECT MIN(next_attempt_at) FROM messages WHERE status = 'queued'").fetchone()[0]
+                wait = self.POLL_SECONDS if upcoming is None else min(max(upcoming - now, 0.01), self.POLL_SECONDS)
+                self._wakeup.wait(wait)
+            return None
+    
+    def _try_claim(self, now: float) -> Optional[sqlite3.Row]:
+        """Atomically move one due (or lease-expired) message to 'sending' (caller holds _lock)"""
+        expired = now - self.lease_seconds
+        self._db.execute('BEGIN IMMEDIATE')
+        try:
+            row = self._db.execute(
+                "SELECT * FROM messages WHERE (status = 'queued' AND next_attempt_at <= ?) "
+                "OR (status = 'sending' AND claimed_at < ?) ORDER BY next_attempt_at, id LIMIT 1",
+                (now, expired)).fetchone()
+            claimed = row is not None and self._db.execute(
+                "UPDATE messages SET status = 'sending', claimed_by = ?, claimed_at = ? "
+                "WHERE id = ? AND (status = 'queued' OR (status = 'sending' AND claimed_at < ?))",
+                (self.instance_id, now, row['id'], expired)).rowcount == 1
+            self._db.execute('COMMIT')
+        except Exception:
+            self._db.execute('ROLLBACK')
+            raise
+        return row if claimed else None
+    
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        """Whether the relay couldn't be reached or logged in to, rather than refusing this message"""
+        if isinstance(error, (smtplib.SMTPConnectError, smtplib.SMTPAuthenticationError, smtplib.SMTPHeloError,
+                              smtplib.SMTPNotSupportedError, smtplib.SMTPServerDisconnected)):
+            return True
+        if isinstance(error, smtplib.SMTPResponseException):
+            # 530 authentication required, 535 credentials rejected
+            return error.smtp_code in (530, 535)
+        # Socket-level failures (refused, reset, timed out); SMTP replies are SMTPException
+        return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+    
+    @staticmethod
+    def _is_permanent_rejection(error: Exception) -> bool:
+        """5xx refusal of the recipients or the content, which won't succeed on retry"""
+        if isinstance(error, smtplib.SMTPRecipientsRefused):
+            return bool(error.recipients) and all(500 <= code < 600 for code, _ in error.recipients.values())
+        return isinstance(error, smtplib.SMTPDataError) and 500 <= error.smtp_code < 600
+    
+    def _record_failure(self, message: sqlite3.Row, error: Exception):
+        if self._is_connection_error(error):
+            with self._wakeup:
+                self._connection_failures += 1
+                delay = min(self.base_delay * 2 ** (self._connection_failures - 1), self.max_delay)
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                self._db.execute("UPDATE messages SET status = 'queued', next_attempt_at = ?, last_error = ?, "
+                                 "claimed_by = NULL, claimed_at = NULL WHERE id = ? AND claimed_by = ?",
+                                 (time.time(), str(error), message['id'], self.instance_id))
+            logger.error(f"Cannot send through the SMTP relay ({error}); pausing the outbox for {delay:.0f}s")
+            return
+        
+        attempts = message['attempts'] + 1
+        permanent = self._is_permanent_rejection(error)
+        
+        if permanent or attempts >= self.max_attempts:
+            status, next_attempt_at = 'failed', time.time()
+            logger.error(f"Giving up on email to {message['to_address']} after {attempts} attempts: {error}")
+        else:
+            delay = min(self.base_delay * 2 ** (attempts - 1), self.max_delay) * random.uniform(0.5, 1.0)
+            status, next_attempt_at = 'queued', time.time() + delay
+            logger.warning(f"Email to {message['to_address']} failed ({error}); retrying in {delay:.0f}s")
+        
+        with self._wakeup:
+            self._db.execute("UPDATE messages SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, "
+                             "claimed_by = NULL, claimed_at = NULL WHERE id = ? AND claimed_by = ?",
+                             (status, attempts, next_attempt_at, str(error), message['id'], self.instance_id))
+            self._wakeup.notify()
+
 class EmailNotification:
     """Email notification system for onboarding communications"""
     
-    def __init__(self, smtp_server: str, smtp_port: int, username: str, password: str, from_address: str):
+    def __init__(self, smtp_server: str, smtp_port: int, username: str, password: str, from_address: str,
+                 pool_size: int = 2, max_messages_per_connection: int = 100, idle_timeout: float = 60,
+                 starttls: bool = True, outbox_path: Optional[str] = None, outbox_options: Optional[Dict] = None):
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.username = username
         self.password = password
         self.from_address = from_address
+        self.pool = SMTPConnectionPool(smtp_server, smtp_port, username, password, size=pool_size,
+                                       max_messages=max_messages_per_connection, idle_timeout=idle_timeout,
+                                       starttls=starttls)
+        
+        # With an outbox, sends are spooled and delivered in the background
+        self.outbox = None
+        if outbox_path:
+            self.outbox = EmailOutbox(outbox_path, lambda sender, to, message: self.pool.sendmail(sender, [to], message),
+                                      **(outbox_options or {}))
+            self.outbox.start()
+    
+    def close(self, drain_timeout: float = 30):
+        """Flush the outbox (up to drain_timeout seconds) and close pooled SMTP sessions"""
+        if self.outbox:
+            self.outbox.close(drain_timeout)
+        self.pool.close()
     
     def send_welcome_email(self, employee: NewEmployee) -> bool:
         """Send welcome email to new employee"""
@@ -615,7 +1561,7 @@ Best regards,
 Engineering Team
         """
         
-        return self._send_email(employee.email, subject, body)
+        return self._send_email(employee.email, subject, body, tag=employee.email)
     
     def send_manager_notification(self, employee: NewEmployee, epic_key: str, tasks: List[str]) -> bool:
         """Send notification to manager about onboarding setup"""
@@ -656,7 +1602,7 @@ Best regards,
 Engineering Operations
         """
         
-        return self._send_email(employee.manager_email, subject, body)
+        return self._send_email(employee.manager_email, subject, body, tag=employee.email)
     
     def send_buddy_assignment(self, employee: NewEmployee, buddy_email: str) -> bool:
         """Send notification to assigned onboarding buddy"""
@@ -695,25 +1641,28 @@ Best regards,
 Engineering Team
         """
         
-        return self._send_email(buddy_email, subject, body)
+        return self._send_email(buddy_email, subject, body, tag=employee.email)
     
-    def _send_email(self, to_email: str, subject: str, body: str) -> bool:
-        """Send email using SMTP"""
+    def _send_email(self, to_email: str, subject: str, body: str, tag: Optional[str] = None) -> bool:
+        """Send email using SMTP, or spool it to the outbox when one is configured
+        
+        `tag` (the onboarded employee's email) groups outbox messages for status queries.
+        """
         try:
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg['From'] = self.from_address
             msg['To'] = to_email
             msg['Subject'] = subject
             
-            msg.attach(MimeText(body, 'plain'))
-            
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.username, self.password)
+            msg.attach(MIMEText(body, 'plain'))
             
             text = msg.as_string()
-            server.sendmail(self.from_address, to_email, text)
-            server.quit()
+            if self.outbox:
+                self.outbox.enqueue(self.from_address, to_email, subject, text, tag=tag)
+                logger.info(f"Email queued for {to_email}: {subject}")
+                return True
+            
+            self.pool.sendmail(self.from_address, [to_email], text)
             
             logger.info(f"Email sent to {to_email}: {subject}")
             return True
@@ -738,15 +1687,18 @@ class AWSIntegration:
             logger.error("boto3 not installed. Run: pip install boto3")
             self.iam = None
     
-    def create_user_account(self, employee: NewEmployee) -> Optional[Dict[str, str]]:
-        """Create AWS IAM user account"""
+    def create_iam_user(self, employee: NewEmployee) -> Optional[str]:
+        """Create the employee's IAM user and return its username
+        
+        A user that already exists, e.g. from an interrupted earlier run, counts
+        as created.
+        """
         if not self.iam:
             return None
         
         username = f"{employee.first_name.lower()}.{employee.last_name.lower()}"
         
         try:
-            # Create user
             self.iam.create_user(
                 UserName=username,
                 Tags=[
@@ -756,7 +1708,26 @@ class AWSIntegration:
                     {'Key': 'Manager', 'Value': employee.manager_email}
                 ]
             )
-            
+        except Exception as e:
+            if getattr(e, 'response', {}).get('Error', {}).get('Code') == 'EntityAlreadyExists':
+                logger.info(f"AWS user {username} already exists")
+                return username
+            logger.error(f"Failed to create AWS user: {e}")
+            return None
+        
+        logger.info(f"Created AWS user: {username}")
+        return username
+    
+    def create_user_account(self, employee: NewEmployee, username: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """Create AWS IAM user account, or finish setting up an already created user"""
+        if not self.iam:
+            return None
+        
+        username = username or self.create_iam_user(employee)
+        if not username:
+            return None
+        
+        try:
             # Create access key
             response = self.iam.create_access_key(UserName=username)
             access_key = response['AccessKey']
@@ -772,8 +1743,6 @@ class AWSIntegration:
                 except Exception as e:
                     logger.warning(f"Could not add {username} to group {group}: {e}")
             
-            logger.info(f"Created AWS user: {username}")
-            
             return {
                 'username': username,
                 'access_key_id': access_key['AccessKeyId'],
@@ -781,7 +1750,7 @@ class AWSIntegration:
             }
             
         except Exception as e:
-            logger.error(f"Failed to create AWS user: {e}")
+            logger.error(f"Failed to set up AWS user {username}: {e}")
             return None
     
     def _get_groups_for_team(self, team: str) -> List[str]:
@@ -796,13 +1765,115 @@ class AWSIntegration:
         
         return group_mapping.get(team.lower(), ['Developers'])
 
+class OnboardingJournal:
+    """Persistent record of each employee's completed onboarding steps
+    
+    Rows are keyed by employee email and step name ('github', 'jira',
+    'jira.epic', ...) and keep the step's output, so a rerun can reuse an epic
+    key or IAM username instead of creating it again. Only steps recorded as
+    'done' are skipped; failed ones are retried.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('''
+                CREATE TABLE IF NOT EXISTS steps (
+                    employee TEXT NOT NULL,
+                    step TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    output TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 1,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (employee, step)
+                )''')
+    
+    def get(self, employee_email: str, step: str) -> Optional[Dict[str, Any]]:
+        """The journal entry (status, output, error, attempts) for a step, if any"""
+        with self._lock:
+            row = self._db.execute('SELECT status, output, error, attempts FROM steps WHERE employee = ? AND step = ?',
+                                   (employee_email.lower(), step)).fetchone()
+        if row is None:
+            return None
+        return {'status': row[0], 'output': json.loads(row[1]) if row[1] else None, 'error': row[2],
+                'attempts': row[3]}
+    
+    def record(self, employee_email: str, step: str, output: Any, success: bool, error: Optional[str] = None):
+        with self._lock:
+            self._db.execute(
+                'INSERT INTO steps (employee, step, status, output, error, updated_at) VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (employee, step) DO UPDATE SET status = excluded.status, output = excluded.output, '
+                'error = excluded.error, attempts = attempts + 1, updated_at = excluded.updated_at',
+                (employee_email.lower(), step, 'done' if success else 'failed', json.dumps(output, default=str),
+                 error, datetime.now().isoformat()))
+    
+    def history(self, employee_email: str) -> Dict[str, Dict[str, Any]]:
+        """Every recorded step for an employee"""
+        with self._lock:
+            rows = self._db.execute('SELECT step, status, error, attempts, updated_at FROM steps WHERE employee = ?',
+                                    (employee_email.lower(),)).fetchall()
+        return {step: {'status': status, 'error': error, 'attempts': attempts, 'updated_at': updated_at}
+                for step, status, error, attempts, updated_at in rows}
+    
+    def reset(self, employee_email: str):
+        """Forget an employee's progress so the next run starts from scratch"""
+        with self._lock:
+            self._db.execute('DELETE FROM steps WHERE employee = ?', (employee_email.lower(),))
+    
+    def close(self):
+        with self._lock:
+            self._db.close()
+
 class OnboardingOrchestrator:
     """Main orchestrator class that coordinates all onboarding activities"""
     
     def __init__(self, config_file: str = "onboarding_config.yaml"):
         self.config = OnboardingConfig(config_file)
+        self.limits: Dict[str, threading.BoundedSemaphore] = {}
+        journal_path = self.config.config.get('journal', 'onboarding_journal.db')
+        self.journal = OnboardingJournal(journal_path) if journal_path else None
         self._initialize_integrations()
     
+    def set_concurrency_limits(self, limits: Dict[str, int]):
+        """Cap how many employees may use each integration at once (github, slack, jira, smtp, aws)"""
+        self.limits = {name: threading.BoundedSemaphore(limit) for name, limit in limits.items() 
+                       if name != 'workers' and limit}
+    
+    def close(self):
+        """Release pooled connections held by the integrations"""
+        if self.email:
+            self.email.close(self.config.config['email'].get('drain_timeout', 30))
+        if self.journal:
+            self.journal.close()
+    
+    def _journaled(self, employee: NewEmployee, step: str, action: Callable[[], Any],
+                   succeeded: Callable[[Any], bool] = bool) -> Any:
+        """Run a non-idempotent action once per employee, replaying its journaled output on reruns"""
+        if self.journal:
+            entry = self.journal.get(employee.email, step)
+            if entry and entry['status'] == 'done':
+                logger.info(f"Skipping {step} for {employee.email}: already completed")
+                return entry['output']
+        
+        output = action()
+        if self.journal:
+            self.journal.record(employee.email, step, output, succeeded(output))
+        return output
+    
+    @contextmanager
+    def _limited(self, integration: str):
+        """Hold a slot for the integration while a step runs, if it is capped"""
+        semaphore = self.limits.get(integration)
+        if semaphore is None:
+            yield
+            return
+        with semaphore:
+            yield
+    
     def _initialize_integrations(self):
         """Initialize all service integrations"""
         # GitHub integration
@@ -810,7 +1881,11 @@ class OnboardingOrchestrator:
         if github_token:
             self.github = GitHubIntegration(
                 token=github_token,
-                org=self.config.config['github']['org']
+                org=self.config.config['github']['org'],
+                base_url=self.config.config['github'].get('base_url', 'https://api.github.com'),
+                org_cache_path=self.config.config['github'].get('org_cache', '.github_org_cache.json'),
+                org_cache_ttl=self.config.config['github'].get('org_cache_ttl', 3600),
+                grant_workers=self.config.config['github'].get('grant_workers', 4)
             )
         else:
             logger.warning("GITHUB_TOKEN not set. GitHub integration disabled.")
@@ -819,7 +1894,14 @@ class OnboardingOrchestrator:
         # Slack integration
         slack_token = os.getenv('SLACK_BOT_TOKEN')
         if slack_token:
-            self.slack = SlackIntegration(token=slack_token)
+            self.slack = SlackIntegration(
+                token=slack_token,
+                base_url=self.config.config.get('slack', {}).get('base_url', 'https://slack.com/api'),
+                channel_cache_ttl=self.config.config.get('slack', {}).get('channel_cache_ttl', 900),
+                user_directory_path=self.config.config.get('slack', {}).get(
+                    'user_directory_cache', '.slack_user_directory.json'),
+                user_directory_ttl=self.config.config.get('slack', {}).get('user_directory_ttl', 86400)
+            )
         else:
             logger.warning("SLACK_BOT_TOKEN not set. Slack integration disabled.")
             self.slack = None
@@ -831,7 +1913,10 @@ class OnboardingOrchestrator:
             self.jira = JiraIntegration(
                 url=self.config.config['jira']['url'],
                 username=jira_username,
-                api_token=jira_token
+                api_token=jira_token,
+                bulk_size=self.config.config['jira'].get('bulk_size', 50),
+                fallback_workers=self.config.config['jira'].get('fallback_workers', 4),
+                project_key=self.config.config['jira'].get('project_key', 'ONBOARD')
             )
         else:
             logger.warning("JIRA credentials not set. Jira integration disabled.")
@@ -846,7 +1931,17 @@ class OnboardingOrchestrator:
                 smtp_port=self.config.config['email']['smtp_port'],
                 username=email_username,
                 password=email_password,
-                from_address=self.config.config['email']['from_address']
+                from_address=self.config.config['email']['from_address'],
+                pool_size=self.config.config['email'].get('pool_size', 2),
+                max_messages_per_connection=self.config.config['email'].get('max_messages_per_connection', 100),
+                idle_timeout=self.config.config['email'].get('idle_timeout', 60),
+                starttls=self.config.config['email'].get('starttls', True),
+                outbox_path=self.config.config['email'].get('outbox', 'email_outbox.db'),
+                outbox_options={
+                    'workers': self.config.config['email'].get('outbox_workers', 2),
+                    'max_attempts': self.config.config['email'].get('max_attempts', 6),
+                    'base_delay': self.config.config['email'].get('retry_base_seconds', 30)
+                }
             )
         else:
             logger.warning("Email credentials not set. Email notifications disabled.")
@@ -878,29 +1973,13 @@ class OnboardingOrchestrator:
             'aws': {},
             'email': {},
             'success': True,
-            'errors': []
+            'errors': [],
+            'resumed': []
         }
         
         try:
-            # Step 1: GitHub setup
-            if self.github:
-                results['github'] = self._setup_github_access(employee)
-            
-            # Step 2: Slack setup
-            if self.slack and employee.slack_user_id:
-                results['slack'] = self._setup_slack_access(employee)
-            
-            # Step 3: AWS setup
-            if self.aws:
-                results['aws'] = self._setup_aws_access(employee)
-            
-            # Step 4: Jira project management
-            if self.jira:
-                results['jira'] = self._setup_jira_tracking(employee)
-            
-            # Step 5: Email notifications
-            if self.email:
-                results['email'] = self._send_email_notifications(employee, results)
+            # Steps 1-5: integrations, run as a dependency graph
+            self._run_steps(employee, self._onboarding_steps(employee), results)
             
             # Step 6: Generate onboarding report
             self._generate_onboarding_report(employee, results)
@@ -914,6 +1993,93 @@ class OnboardingOrchestrator:
         
         return results
     
+    def _onboarding_steps(self, employee: NewEmployee) -> List[OnboardingStep]:
+        """Integration steps enabled for this employee, with their inputs"""
+        steps = []
+        if self.github:
+            steps.append(OnboardingStep('github', lambda emp, _: self._setup_github_access(emp), 'github'))
+        if self.slack and employee.slack_user_id:
+            steps.append(OnboardingStep('slack', lambda emp, _: self._setup_slack_access(emp), 'slack'))
+        if self.aws:
+            steps.append(OnboardingStep('aws', lambda emp, _: self._setup_aws_access(emp), 'aws'))
+        if self.jira:
+            steps.append(OnboardingStep('jira', lambda emp, _: self._setup_jira_tracking(emp), 'jira'))
+        if self.email:
+            # Manager notification includes the Jira epic and tasks
+            steps.append(OnboardingStep('email', self._send_email_notifications, 'smtp', ['jira']))
+        return steps
+    
+    def _run_steps(self, employee: NewEmployee, steps: List[OnboardingStep], results: Dict[str, Any]):
+        """Run steps as soon as their dependencies finish, independent ones in parallel
+        
+        Dependencies on steps that are not enabled are ignored. A step that raises
+        marks the onboarding failed and skips everything downstream of it; other
+        branches keep going. Wall-clock seconds per step land in results['timings'].
+        Steps the journal has as done reuse their recorded output and are listed
+        in results['resumed'].
+        """
+        enabled = {step.name for step in steps}
+        waiting = {step.name: {dep for dep in (step.dependencies or []) if dep in enabled} for step in steps}
+        by_name = {step.name: step for step in steps}
+        timings = results.setdefault('timings', {})
+        started = time.monotonic()
+        
+        def timed(step: OnboardingStep) -> Dict[str, Any]:
+            entry = self.journal.get(employee.email, step.name) if self.journal else None
+            if entry and entry['status'] == 'done':
+                results['resumed'].append(step.name)
+                timings[step.name] = 0.0
+                return entry['output']
+            
+            step_started = time.monotonic()
+            try:
+                with self._limited(step.integration):
+                    output = step.run(employee, results)
+            except Exception as e:
+                if self.journal:
+                    self.journal.record(employee.email, step.name, None, False, str(e))
+                raise
+            finally:
+                timings[step.name] = round(time.monotonic() - step_started, 3)
+            
+            if self.journal:
+                self.journal.record(employee.email, step.name, output, output.get('success', False),
+                                    output.get('error'))
+            return output
+        
+        def skip_dependents(name: str):
+            for dependent, deps in list(waiting.items()):
+                if name in deps and dependent in waiting:
+                    del waiting[dependent]
+                    results[dependent] = {'success': False, 'skipped': f"{name} did not complete"}
+                    skip_dependents(dependent)
+        
+        if not steps:
+            return
+        with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix='onboard-step') as executor:
+            running = {}
+            while waiting or running:
+                for name in [name for name, deps in waiting.items() if not deps]:
+                    del waiting[name]
+                    running[executor.submit(timed, by_name[name])] = name
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"{name} step failed: {e}")
+                        results['success'] = False
+                        results['errors'].append(f"{name}: {e}")
+                        results[name] = {'success': False, 'error': str(e)}
+                        skip_dependents(name)
+                        continue
+                    for deps in waiting.values():
+                        deps.discard(name)
+        
+        timings['total'] = round(time.monotonic() - started, 3)
+    
     def _setup_github_access(self, employee: NewEmployee) -> Dict[str, Any]:
         """Setup GitHub organization and repository access"""
         github_results = {
@@ -939,11 +2105,13 @@ class OnboardingOrchestrator:
                 team_name
             )
             
-            # Grant repository access based on team
+            # Grant repository access based on team, skipping repos the team already covers
             repositories = self._get_repositories_for_team(employee.team)
+            grant_via_team = self.config.config['github'].get('grant_via_team', True)
             github_results['repository_access'] = self.github.grant_repository_access(
                 employee.github_username,
-                repositories
+                repositories,
+                team_name=team_name if grant_via_team and github_results['team_assignment'] else None
             )
             
             # Check overall success
@@ -971,10 +2139,8 @@ class OnboardingOrchestrator:
         
         try:
             # Send welcome message
-            slack_results['welcome_message'] = self.slack.send_welcome_message(
-                employee.slack_user_id,
-                employee
-            )
+            slack_results['welcome_message'] = self._journaled(employee, 'slack.welcome_message', 
+                lambda: self.slack.send_welcome_message(employee.slack_user_id, employee))
             
             # Add to relevant channels
             slack_results['channel_invitations'] = self.slack.add_user_to_channels(
@@ -984,10 +2150,8 @@ class OnboardingOrchestrator:
             
             # Notify team about new member
             team_channel = f"team-{employee.team}"
-            slack_results['team_notification'] = self.slack.notify_team_about_new_member(
-                team_channel,
-                employee
-            )
+            slack_results['team_notification'] = self._journaled(employee, 'slack.team_notification',
+                lambda: self.slack.notify_team_about_new_member(team_channel, employee))
             
             # Check overall success
             slack_results['success'] = (
@@ -1012,7 +2176,9 @@ class OnboardingOrchestrator:
         }
         
         try:
-            credentials = self.aws.create_user_account(employee)
+            # The IAM user is journaled on its own so a rerun doesn't try to create it again
+            username = self._journaled(employee, 'aws.user', lambda: self.aws.create_iam_user(employee))
+            credentials = self.aws.create_user_account(employee, username=username) if username else None
             if credentials:
                 aws_results['user_created'] = True
                 aws_results['credentials'] = {
@@ -1043,13 +2209,18 @@ class OnboardingOrchestrator:
         
         try:
             # Create onboarding epic
-            epic_key = self.jira.create_onboarding_epic(employee)
+            epic_key = self._journaled(employee, 'jira.epic', lambda: self.jira.create_onboarding_epic(employee))
             if epic_key:
                 jira_results['epic_created'] = True
                 jira_results['epic_key'] = epic_key
                 
-                # Create onboarding tasks
-                tasks = self.jira.create_onboarding_tasks(epic_key, employee)
+                # Create onboarding tasks, keeping any a previous run already created
+                previous = self.journal.get(employee.email, 'jira.tasks') if self.journal else None
+                created = self.jira.create_onboarding_task_keys(
+                    epic_key, employee, existing=previous['output'] if previous else None)
+                if self.journal:
+                    self.journal.record(employee.email, 'jira.tasks', created, all(created.values()))
+                tasks = [key for key in created.values() if key]
                 jira_results['tasks_created'] = tasks
                 jira_results['success'] = len(tasks) > 0
             else:
@@ -1074,25 +2245,25 @@ class OnboardingOrchestrator:
         
         try:
             # Send welcome email to employee
-            email_results['welcome_email'] = self.email.send_welcome_email(employee)
+            email_results['welcome_email'] = self._journaled(employee, 'email.welcome',
+                lambda: self.email.send_welcome_email(employee))
             
             # Send notification to manager
             epic_key = results.get('jira', {}).get('epic_key', 'N/A')
             tasks = results.get('jira', {}).get('tasks_created', [])
-            email_results['manager_notification'] = self.email.send_manager_notification(
-                employee, epic_key, tasks
-            )
+            email_results['manager_notification'] = self._journaled(employee, 'email.manager_notification',
+                lambda: self.email.send_manager_notification(employee, epic_key, tasks))
             
             # Send notification to buddy if assigned
             if employee.buddy_email:
-                email_results['buddy_notification'] = self.email.send_buddy_assignment(
-                    employee, employee.buddy_email
-                )
+                email_results['buddy_notification'] = self._journaled(employee, 'email.buddy_notification',
+                    lambda: self.email.send_buddy_assignment(employee, employee.buddy_email))
             
             email_results['success'] = (
                 email_results['welcome_email'] and
                 email_results['manager_notification']
             )
+            email_results['delivery'] = 'queued' if self.email.outbox else 'sent'
             
         except Exception as e:
             logger.error(f"Email notifications failed: {e}")
@@ -1184,6 +2355,93 @@ class OnboardingOrchestrator:
         
         logger.info(f"Reports generated: {report_filename}, {summary_filename}")
 
+class BatchOnboarder:
+    """Onboards many employees concurrently with per-integration caps
+    
+    Each employee runs on a worker thread; the orchestrator's semaphores keep
+    any one integration (GitHub, Slack, Jira, SMTP, AWS) under its limit. An
+    employee whose onboarding fails or raises is recorded and does not hold up
+    the others.
+    """
+    
+    def __init__(self, orchestrator: OnboardingOrchestrator, workers: Optional[int] = None, 
+                 limits: Optional[Dict[str, int]] = None):
+        concurrency = dict(orchestrator.config.config.get('concurrency', {}))
+        concurrency.update(limits or {})
+        self.orchestrator = orchestrator
+        self.workers = workers or concurrency.get('workers', 8)
+        orchestrator.set_concurrency_limits(concurrency)
+    
+    def run(self, employees: List[NewEmployee], show_progress: bool = True) -> List[Dict[str, Any]]:
+        """Onboard everyone and return results in input order"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(employees)
+        started = time.monotonic()
+        succeeded = failed = 0
+        self._warm_caches()
+        
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='onboard') as executor:
+            futures = {executor.submit(self._onboard, employee): i for i, employee in enumerate(employees)}
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                result = future.result()
+                results[i] = result
+                if result['success']:
+                    succeeded += 1
+                else:
+                    failed += 1
+                
+                if show_progress:
+                    employee = employees[i]
+                    elapsed = time.monotonic() - started
+                    eta = elapsed / done * (len(employees) - done)
+                    print(f"[{done:>{len(str(len(employees)))}}/{len(employees)}] "
+                          f"{'✅' if result['success'] else '❌'} {employee.first_name} {employee.last_name} "
+                          f"({result['duration_seconds']:.1f}s) | {succeeded} ok, {failed} failed | "
+                          f"elapsed {elapsed:.0f}s, eta {eta:.0f}s", flush=True)
+        
+        return results
+    
+    def _warm_caches(self):
+        """Load GitHub org metadata and the Slack user directory once, before workers need them"""
+        orchestrator = self.orchestrator
+        try:
+            if orchestrator.github:
+                orchestrator.github.load_org_metadata()
+            if orchestrator.slack:
+                orchestrator.slack.prefetch_user_directory()
+        except Exception as e:
+            # Workers load whatever is still missing on first use
+            logger.warning(f"Could not prefetch integration metadata: {e}")
+    
+    def _onboard(self, employee: NewEmployee) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result = self.orchestrator.onboard_employee(employee)
+        except Exception as e:
+            # onboard_employee handles step failures itself; this catches anything it lets through
+            logger.error(f"Onboarding crashed for {employee.email}: {e}")
+            result = {'employee': asdict(employee), 'success': False, 'errors': [str(e)]}
+        result['duration_seconds'] = time.monotonic() - started
+        return result
+
+def show_email_status(config: Dict[str, Any], employee_email: Optional[str] = None):
+    """Print outbox delivery status without starting senders or touching the spool"""
+    outbox_path = config.get('email', {}).get('outbox', 'email_outbox.db')
+    if not outbox_path or not os.path.exists(outbox_path):
+        print("No email outbox found.")
+        return
+    
+    outbox = EmailOutbox(outbox_path, read_only=True)
+    try:
+        print(f"📬 Email outbox {outbox.path}: " + 
+              ", ".join(f"{count} {status}" for status, count in sorted(outbox.counts().items())))
+        for message in outbox.status(employee_email):
+            if employee_email or message['status'] != 'sent':
+                print(f"  [{message['status']:>7}] {message['to_address']}: {message['subject']} "
+                      f"(attempts: {message['attempts']}{', ' + message['last_error'] if message['last_error'] else ''})")
+    finally:
+        outbox.close()
+
 def main():
     """Main CLI interface for onboarding automation"""
     import argparse
@@ -1193,9 +2451,19 @@ def main():
     parser.add_argument('--employee-file', help='JSON file with employee information')
     parser.add_argument('--interactive', action='store_true', help='Interactive mode for single employee')
     parser.add_argument('--dry-run', action='store_true', help='Preview actions without executing')
+    parser.add_argument('--workers', type=int, help='Employees onboarded concurrently (default from config, 8)')
+    parser.add_argument('--reset-journal', action='store_true',
+                        help='Forget recorded progress for these employees and redo every step')
+    parser.add_argument('--email-status', nargs='?', const='', metavar='EMPLOYEE_EMAIL',
+                        help='Show outbox delivery status (optionally for one employee)')
     
     args = parser.parse_args()
     
+    if args.email_status is not None:
+        # Read the spool directly: building the integrations would start senders and deliver mail
+        show_email_status(OnboardingConfig(args.config).config, args.email_status or None)
+        return
+    
     # Initialize orchestrator
     orchestrator = OnboardingOrchestrator(args.config)
     
@@ -1204,13 +2472,26 @@ def main():
         with open(args.employee_file, 'r') as f:
             employees_data = json.load(f)
         
-        for emp_data in employees_data:
-            employee = NewEmployee(**emp_data)
-            if args.dry_run:
+        employees = [NewEmployee(**emp_data) for emp_data in employees_data]
+        if args.reset_journal and orchestrator.journal and not args.dry_run:
+            for employee in employees:
+                orchestrator.journal.reset(employee.email)
+        
+        if args.dry_run:
+            for employee in employees:
                 logger.info(f"DRY RUN: Would onboard {employee.first_name} {employee.last_name}")
-            else:
-                result = orchestrator.onboard_employee(employee)
-                print(f"Onboarding {'successful' if result['success'] else 'failed'} for {employee.first_name}")
+        else:
+            batch = BatchOnboarder(orchestrator, workers=args.workers)
+            results = batch.run(employees)
+            
+            failures = [r for r in results if not r['success']]
+            resumed = sum(len(r.get('resumed', [])) for r in results)
+            print(f"\nOnboarded {len(results) - len(failures)}/{len(results)} employees "
+                  f"with {batch.workers} workers" + (f" ({resumed} steps already done, skipped)" if resumed else ""))
+            for result in failures:
+                employee = result['employee']
+                print(f"  ❌ {employee['first_name']} {employee['last_name']}: "
+                      f"{'; '.join(result.get('errors', [])) or 'see onboarding report'}")
     
     elif args.interactive:
         # Interactive mode
@@ -1257,10 +2538,13 @@ def main():
     
     else:
         parser.print_help()
+    
+    orchestrator.close()
 
 def create_sample_config():
     """Create sample configuration file"""
     sample_config = {
+        'journal': 'onboarding_journal.db',
         'company': {
             'name': 'Your Company',
             'domain': 'company.com',
@@ -1268,11 +2552,23 @@ def create_sample_config():
         },
         'github': {
             'org': 'your-org',
-            'base_url': 'https://api.github.com'
+            'base_url': 'https://api.github.com',
+            'org_cache': '.github_org_cache.json',
+            'org_cache_ttl': 3600,
+            'grant_workers': 4,
+            'grant_via_team': True
+        },
+        'slack': {
+            'base_url': 'https://slack.com/api',
+            'channel_cache_ttl': 900,
+            'user_directory_cache': '.slack_user_directory.json',
+            'user_directory_ttl': 86400
         },
         'jira': {
             'url': 'https://company.atlassian.net',
-            'project_key': 'ONBOARD'
+            'project_key': 'ONBOARD',
+            'bulk_size': 50,
+            'fallback_workers': 4
         },
         'aws': {
             'region': 'us-west-2',
@@ -1281,7 +2577,24 @@ def create_sample_config():
         'email': {
             'smtp_server': 'smtp.company.com',
             'smtp_port': 587,
-            'from_address': 'engineering@company.com'
+            'from_address': 'engineering@company.com',
+            'pool_size': 2,
+            'max_messages_per_connection': 100,
+            'idle_timeout': 60,
+            'starttls': True,
+            'outbox': 'email_outbox.db',
+            'outbox_workers': 2,
+            'max_attempts': 6,
+            'retry_base_seconds': 30,
+            'drain_timeout': 30
+        },
+        'concurrency': {
+            'workers': 8,
+            'github': 4,
+            'slack': 4,
+            'jira': 4,
+            'smtp': 2,
+            'aws': 2
         },
         'teams': {
             'backend': {
@@ -0,0 +1,69 @@
+"""Shared fixtures: the tools are hyphenated scripts, so they are loaded by path"""
+
+import os
+import sys
+import importlib.util
+from dataclasses import fields
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Charts are rendered headless
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+def load_script(relative_path: str, module_name: str):
+    """Import a script such as scripts/onboarding-automation.py as a module"""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(REPO_ROOT, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module  # Lets pickle find the module's classes
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope='session')
+def tracker():
+    pytest.importorskip('pandas')
+    pytest.importorskip('matplotlib')
+    pytest.importorskip('seaborn')
+    return load_script('performance-dashboards/team-metrics-tracker.py', 'team_metrics_tracker')
+
+@pytest.fixture(scope='session')
+def onboarding():
+    pytest.importorskip('yaml')
+    pytest.importorskip('requests')
+    return load_script('scripts/onboarding-automation.py', 'onboarding_automation')
+
+@pytest.fixture
+def make_metrics(tracker):
+    """TeamMetrics with every value set to 1 unless overridden"""
+    def make(team_name='core', date='2024-03-01', **values):
+        record = {field.name: 1 for field in fields(tracker.TeamMetrics)}
+        record.update(team_name=team_name, date=date, **values)
+        return tracker.TeamMetrics(**record)
+    return make
+
+@pytest.fixture(scope='session')
+def fake_api_module():
+    return load_script('scripts/fake-api-server.py', 'fake_api_server')
+
+@pytest.fixture
+def fake_api(fake_api_module):
+    """Start fake API servers with FakeAPIConfig overrides; stopped after the test"""
+    servers = []
+
+    def start(fixtures=None, **config):
+        server = fake_api_module.FakeAPIServer(fake_api_module.FakeAPIConfig(**config), fixtures).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+@pytest.fixture
+def make_employee(onboarding):
+    def make(first_name='Ada', last_name='Lovelace', **values):
+        values = dict({'email': f'{first_name}@example.com', 'role': 'Engineer', 'team': 'backend',
+                       'start_date': '2024-03-04', 'manager_email': 'manager@example.com'}, **values)
+        return onboarding.NewEmployee(first_name=first_name, last_name=last_name, **values)
+    return make
@@ -0,0 +1,81 @@
+"""ArtifactCache keys, eviction and cached dashboard artifacts"""
+
+import os
+
+import pytest
+
+@pytest.fixture
+def cache(tracker, tmp_path):
+    return tracker.ArtifactCache(str(tmp_path / 'cache'))
+
+def test_key_depends_on_data_and_params(tracker, make_metrics):
+    key = tracker.ArtifactCache.make_key('chart', [make_metrics()], {'days': 90})
+    assert key == tracker.ArtifactCache.make_key('chart', [make_metrics()], {'days': 90})
+    assert key != tracker.ArtifactCache.make_key('chart', [make_metrics()], {'days': 30})
+    assert key != tracker.ArtifactCache.make_key('chart', [make_metrics(bugs_fixed=2)], {'days': 90})
+    assert key == tracker.ArtifactCache.make_key('chart', [make_metrics(date='2024-03-02')], {'days': 90})
+
+def test_text_round_trip(cache):
+    assert cache.get_text('summary') is None
+    cache.put_text('summary', 'all good')
+    assert cache.get_text('summary') == 'all good'
+
+def test_least_recently_used_files_are_evicted(tracker, tmp_path):
+    cache = tracker.ArtifactCache(str(tmp_path / 'cache'), max_entries=2)
+    for i, key in enumerate(['a', 'b']):
+        cache.put_text(key, key)
+        os.utime(cache._path(key, '.txt'), (i, i))
+    cache.get_text('a')  # Now more recent than b
+
+    cache.put_text('c', 'c')
+    assert cache.get_text('b') is None
+    assert cache.get_text('a') == 'a' and cache.get_text('c') == 'c'
+
+def test_velocity_chart_is_rendered_once_per_data_slice(tracker, make_metrics, cache, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    renders = []
+    monkeypatch.setattr(tracker.plt, 'savefig', lambda path, **kwargs: (renders.append(path), open(path, 'wb').close()))
+
+    dashboard = tracker.MetricsDashboard(cache=cache)
+    dashboard.add_metrics(make_metrics())
+    assert dashboard.generate_velocity_chart('core') == 'core_velocity_trends.png'
+    assert dashboard.generate_velocity_chart('core') == 'core_velocity_trends.png'
+    assert len(renders) == 1
+
+    dashboard.add_metrics(make_metrics(date='2024-03-08', stories_delivered=4))
+    dashboard.generate_velocity_chart('core')
+    assert len(renders) == 2
+
+def test_executive_summary_is_reused_until_the_data_changes(tracker, make_metrics, cache):
+    dashboard = tracker.MetricsDashboard(cache=cache)
+    dashboard.add_metrics(make_metrics())
+    summary = dashboard.generate_executive_summary('core')
+    assert '**Report Date**: 2024-03-01' in summary
+    cached = cache.get_text(tracker.ArtifactCache.make_key(
+        'executive_summary', [make_metrics()],
+        {'team_name': 'core', 'version': tracker.EXECUTIVE_SUMMARY_VERSION}))
+    assert cached == summary.replace('2024-03-01', '$date')
+
+    dashboard.add_metrics(make_metrics(date='2024-03-08', deployments_count=9))
+    assert '**Deployments This Month**: 9' in dashboard.generate_executive_summary('core')
+
+def test_unchanged_values_on_a_later_day_hit_the_cache(tracker, make_metrics, cache, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    renders = []
+    monkeypatch.setattr(tracker.plt, 'savefig', lambda path, **kwargs: (renders.append(path), open(path, 'wb').close()))
+    builds = []
+    build = tracker.MetricsDashboard._summary_columns
+    monkeypatch.setattr(tracker.MetricsDashboard, '_summary_columns',
+                        lambda self, team_names: builds.append(team_names) or build(self, team_names))
+
+    for date in ('2024-03-01', '2024-03-02'):
+        # A fresh dashboard per run, as main() builds one
+        dashboard = tracker.MetricsDashboard(cache=cache)
+        dashboard.add_metrics(make_metrics(date=date, team_name='data$team'))
+        summary = dashboard.generate_executive_summary('data$team')
+        assert f'**Report Date**: {date}' in summary
+        assert summary.startswith('# Engineering Team Performance Summary - data$team')
+        dashboard.generate_velocity_chart('data$team')
+
+    assert len(builds) == 1
+    assert len(renders) == 2  # The chart draws the dates, so it is rendered per day
@@ -0,0 +1,80 @@
+"""Concurrent batch onboarding with per-integration limits"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+@pytest.fixture
+def orchestrator(onboarding):
+    # Skips config loading and integration setup; tests supply onboard_employee
+    orchestrator = onboarding.OnboardingOrchestrator.__new__(onboarding.OnboardingOrchestrator)
+    orchestrator.config = SimpleNamespace(config={'concurrency': {'workers': 3, 'github': 2}})
+    orchestrator.limits = {}
+    orchestrator.github = orchestrator.slack = None
+    return orchestrator
+
+def test_results_keep_input_order_and_failures_stay_isolated(onboarding, orchestrator, make_employee):
+    def onboard_employee(employee):
+        time.sleep(0.01 * (5 - int(employee.first_name[-1])))
+        if employee.first_name == 'emp2':
+            raise RuntimeError('directory unavailable')
+        return {'employee': {'first_name': employee.first_name}, 'success': True, 'errors': []}
+    orchestrator.onboard_employee = onboard_employee
+
+    employees = [make_employee(f'emp{i}') for i in range(5)]
+    results = onboarding.BatchOnboarder(orchestrator).run(employees, show_progress=False)
+
+    assert [r['employee']['first_name'] for r in results] == [f'emp{i}' for i in range(5)]
+    assert [r['success'] for r in results] == [True, True, False, True, True]
+    assert results[2]['errors'] == ['directory unavailable']
+    assert all(r['duration_seconds'] >= 0 for r in results)
+
+def test_integration_limits_cap_concurrent_steps(onboarding, orchestrator, make_employee):
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def onboard_employee(employee):
+        with orchestrator._limited('github'):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+        return {'success': True}
+    orchestrator.onboard_employee = onboard_employee
+
+    batch = onboarding.BatchOnboarder(orchestrator, workers=6)
+    batch.run([make_employee(f'emp{i}') for i in range(12)], show_progress=False)
+    assert batch.workers == 6
+    assert peak[0] == 2
+
+def test_workers_default_to_the_concurrency_config(onboarding, orchestrator):
+    batch = onboarding.BatchOnboarder(orchestrator, limits={'slack': 1})
+    assert batch.workers == 3
+    assert set(orchestrator.limits) == {'github', 'slack'}
+
+class FakeIntegration:
+    """Counts metadata loads, raising the given error if any"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        if self.error:
+            raise self.error
+
+    load_org_metadata = prefetch_user_directory = load
+
+@pytest.mark.parametrize('error', [None, RuntimeError('users.list unavailable')])
+def test_integration_metadata_is_loaded_once_per_batch(onboarding, orchestrator, make_employee, error):
+    orchestrator.github, orchestrator.slack = FakeIntegration(), FakeIntegration(error)
+    orchestrator.onboard_employee = lambda employee: {'success': True}
+
+    results = onboarding.BatchOnboarder(orchestrator).run([make_employee(f'emp{i}') for i in range(4)],
+                                                          show_progress=False)
+    assert (orchestrator.github.loads, orchestrator.slack.loads) == (1, 1)
+    assert all(r['success'] for r in results)
@@ -0,0 +1,96 @@
+"""Streaming EWMA/CUSUM bottleneck detection"""
+
+import json
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+def review_history(make_metrics, team_name, hours):
+    return [make_metrics(team_name, date=f'2024-01-{day + 1:02d}', code_review_time_hours=value,
+                         deployments_count=10, technical_debt_items=5)
+            for day, value in enumerate(hours)]
+
+STEADY = [4.0, 4.2, 3.9, 4.1, 4.0, 3.8, 4.1, 4.0]
+
+def assert_same_state(left, right):
+    assert left.teams == right.teams
+    n = len(left.teams)
+    for key in left._state:
+        np.testing.assert_allclose(left._state[key][:n], right._state[key][:n])
+
+def test_review_time_spike_is_flagged(tracker, make_metrics):
+    detector = tracker.BottleneckDetector.from_history(review_history(make_metrics, 'core', STEADY))
+    assert detector.bottlenecks('core') == {}
+
+    detector.update(review_history(make_metrics, 'core', [9.0])[0])
+    assert set(detector.bottlenecks('core')) == {'code_review'}
+    assert set(detector.all_bottlenecks()) == {'core'}
+    assert detector.bottlenecks('unknown') == {}
+
+def test_batch_matches_one_at_a_time(tracker, make_metrics):
+    core = review_history(make_metrics, 'core', STEADY + [9.0])
+    web = review_history(make_metrics, 'web', list(reversed(STEADY)))
+    interleaved = [m for pair in zip(core, web) for m in pair] + core[len(web):]
+
+    batched = tracker.BottleneckDetector()
+    batched.update_batch(interleaved)
+    streamed = tracker.BottleneckDetector()
+    for metrics in interleaved:
+        streamed.update(metrics)
+    assert_same_state(batched, streamed)
+
+def test_store_replay_matches_list_replay(tracker, make_metrics):
+    history = review_history(make_metrics, 'core', STEADY) + review_history(make_metrics, 'web', STEADY)
+    store = tracker.TeamMetricsStore.from_records(asdict(m) for m in history)
+    assert_same_state(tracker.BottleneckDetector.from_history(store),
+                      tracker.BottleneckDetector.from_history(history))
+
+def test_same_day_replacement_rescoring(tracker, make_metrics):
+    history = review_history(make_metrics, 'core', STEADY + [9.0])
+    dashboard = tracker.MetricsDashboard()
+    for metrics in history:
+        dashboard.add_metrics(metrics)
+    assert 'code_review' in dashboard.detector.bottlenecks('core')
+
+    corrected = make_metrics('core', date=history[-1].date, code_review_time_hours=4.1,
+                             deployments_count=10, technical_debt_items=5)
+    dashboard.update_metrics(corrected)
+    assert dashboard.detector.bottlenecks('core') == {}
+    assert_same_state(dashboard.detector, tracker.BottleneckDetector.from_history(history[:-1] + [corrected]))
+
+def test_checkpointed_state_round_trips(tracker, make_metrics):
+    history = review_history(make_metrics, 'core', STEADY)
+    detector = tracker.BottleneckDetector.from_history(history[:-1])
+    restored = tracker.BottleneckDetector.from_dict(json.loads(json.dumps(detector.to_dict())))
+    assert_same_state(restored, detector)
+
+    # Same-day replacement still works from the restored previous state
+    detector.update(history[-1])
+    restored.update(history[-1])
+    spike = review_history(make_metrics, 'core', [9.0])[0]
+    detector.replace_latest(spike)
+    restored.replace_latest(spike)
+    assert_same_state(restored, detector)
+    assert restored.bottlenecks('core') == detector.bottlenecks('core') != {}
+
+def test_state_for_other_metrics_is_not_restored(tracker):
+    state = tracker.BottleneckDetector().to_dict()
+    assert tracker.BottleneckDetector.from_dict(dict(state, metrics=['bugs_fixed'])) is None
+
+def test_identify_bottlenecks_keeps_its_interface(tracker, make_metrics):
+    history = review_history(make_metrics, 'core', STEADY + [9.0])
+    assert tracker.MetricsAnalytics.identify_bottlenecks(history[:3]) == {}
+    assert 'code_review' in tracker.MetricsAnalytics.identify_bottlenecks(history)
+
+def test_identify_bottlenecks_uses_only_the_last_snapshots_team(tracker, make_metrics, monkeypatch):
+    core = review_history(make_metrics, 'core', STEADY + [9.0])
+    web = review_history(make_metrics, 'web', STEADY[:2])
+    replayed = []
+    from_history = tracker.BottleneckDetector.from_history
+    monkeypatch.setattr(tracker.BottleneckDetector, 'from_history',
+                        lambda history: replayed.extend(history) or from_history(history))
+
+    assert tracker.MetricsAnalytics.identify_bottlenecks(core[:2] + web) == {}
+    assert 'code_review' in tracker.MetricsAnalytics.identify_bottlenecks(web + core)
+    assert {m.team_name for m in replayed} == {'core'}
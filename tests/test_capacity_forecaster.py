@@ -0,0 +1,46 @@
+"""Monte Carlo capacity and backlog forecasts"""
+
+from dataclasses import asdict
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+VELOCITY = {'core': [20, 30, 40], 'web': [10] * 12, 'new': []}
+
+@pytest.fixture
+def forecaster(tracker):
+    return tracker.CapacityForecaster(simulations=20_000, seed=3)
+
+def test_capacity_percentiles(forecaster):
+    table = forecaster.forecast(VELOCITY)
+    assert list(table.index) == ['core', 'web', 'new']
+    assert table.loc['web', 'capacity_p85'] == 10
+    assert 20 <= table.loc['core', 'capacity_p85'] <= table.loc['core', 'capacity_p50'] <= 40
+    assert np.isnan(table.loc['new', 'capacity_p50'])
+
+def test_backlog_completion_dates(tracker, forecaster):
+    table = forecaster.forecast(VELOCITY, backlog_points={'web': 35, 'core': 10_000},
+                                start_date=datetime(2024, 1, 1), max_sprints=10)
+    assert table.loc['web', 'sprints_p85'] == 4
+    assert table.loc['web', 'completion_p85'] == '2024-02-26'
+    assert tracker.pd.isna(table.loc['core', 'completion_p50'])  # Not done within max_sprints
+
+def test_team_changes_scale_capacity(forecaster):
+    table = forecaster.forecast({'web': [10] * 12}, team_changes={'web': {'new_members': 1, 'departures': 1}})
+    assert table.loc['web', 'capacity_p50'] == pytest.approx(7.0)
+
+def test_chunked_runs_match_a_single_chunk(tracker):
+    velocity = {f'team-{i}': [10 + i, 20 + i, 15 + i] for i in range(7)}
+    whole = tracker.CapacityForecaster(simulations=1000, seed=5).forecast(velocity)
+    chunked = tracker.CapacityForecaster(simulations=1000, seed=5, max_chunk_elements=3000).forecast(velocity)
+    assert chunked.shape == whole.shape
+    assert (chunked['capacity_p50'] >= 10).all() and (chunked['capacity_p50'] <= 26).all()
+
+def test_velocity_history_from_list_or_store(tracker, make_metrics):
+    history = [make_metrics('core', story_points_completed=5), make_metrics('web', story_points_completed=8),
+               make_metrics('core', date='2024-03-02', story_points_completed=7)]
+    store = tracker.TeamMetricsStore.from_records(asdict(m) for m in history)
+    expected = {'core': [5, 7], 'web': [8]}
+    assert tracker.CapacityForecaster.velocity_history(history) == expected
+    assert tracker.CapacityForecaster.velocity_history(store) == expected
@@ -0,0 +1,117 @@
+"""CollectorDaemon refreshes, in-place snapshot updates and checkpoints"""
+
+import json
+import threading
+
+import pytest
+
+TEAMS = {'core': {'members': ['alice'], 'repositories': ['acme/api'], 'services': ['api']}}
+
+@pytest.fixture
+def make_daemon(tracker, fake_api, tmp_path):
+    server = fake_api(stats_pending_polls=0)
+
+    def make(**options):
+        config = {'github_token': 'test', 'github_api_url': server.base_url}
+        return tracker.CollectorDaemon(config, TEAMS, checkpoint_path=str(tmp_path / 'checkpoint.json'),
+                                       **options)
+    return make
+
+def test_snapshot_is_published_once_required_sources_report(make_daemon):
+    daemon = make_daemon()
+    daemon.refresh('core', 'pull_requests')
+    daemon.refresh('core', 'deployments')
+    assert len(daemon.dashboard.metrics_history) == 0
+
+    daemon.refresh('core', 'team_health')
+    daemon.refresh('core', 'pull_requests')
+    [snapshot] = daemon.dashboard.metrics_history
+    assert snapshot.team_name == 'core'
+    assert snapshot.pull_requests_merged == daemon.partials['core']['pull_requests']['pull_requests_merged']
+
+def test_update_metrics_replaces_same_day_snapshot(tracker, make_metrics):
+    dashboard = tracker.MetricsDashboard()
+    dashboard.update_metrics(make_metrics('core', bugs_fixed=1))
+    dashboard.update_metrics(make_metrics('web'))
+    dashboard.update_metrics(make_metrics('core', bugs_fixed=2))
+    dashboard.update_metrics(make_metrics('core', date='2024-03-02', bugs_fixed=3))
+    assert [(m.team_name, m.date, m.bugs_fixed) for m in dashboard.metrics_history] == [
+        ('core', '2024-03-01', 2), ('web', '2024-03-01', 1), ('core', '2024-03-02', 3)]
+
+def test_checkpoint_restores_history_partials_and_schedule(make_daemon):
+    daemon = make_daemon()
+    for source in ('deployments', 'team_health'):
+        daemon.refresh('core', source)
+    daemon._schedule = [(123.0, 'core', 'deployments')]
+    daemon.checkpoint()
+
+    restored = make_daemon()
+    assert restored.restore() == {'core/deployments': 123.0}
+    assert restored.partials == daemon.partials
+    assert [m.team_name for m in restored.dashboard.metrics_history] == ['core']
+
+def test_run_checkpoints_when_stopped(make_daemon, tmp_path):
+    daemon = make_daemon(intervals={source: 3600 for source in ('pull_requests', 'contributor_stats',
+                                                                 'deployments', 'team_health')},
+                         jitter=0)
+    thread = threading.Thread(target=daemon.run)
+    thread.start()
+    daemon.stop()
+    thread.join(10)
+    assert not thread.is_alive()
+    assert (tmp_path / 'checkpoint.json').exists()
+
+def test_pending_statistics_keep_the_previous_result(tracker, fake_api, tmp_path):
+    server = fake_api(stats_pending_polls=1)
+    config = {'github_token': 'test', 'github_api_url': server.base_url}
+    daemon = tracker.CollectorDaemon(config, TEAMS, checkpoint_path=str(tmp_path / 'checkpoint.json'))
+
+    assert daemon.refresh('core', 'contributor_stats') is False
+    assert 'contributor_stats' not in daemon.partials.get('core', {})
+    assert daemon.refresh('core', 'contributor_stats') is True
+    assert set(daemon.partials['core']['contributor_stats']) == {'commits_count', 'lines_changed'}
+
+def test_conditional_cache_keeps_the_most_recently_used_responses(tracker, fake_api):
+    server = fake_api()
+    collector = tracker.MetricsCollector({'conditional_cache_size': 2})
+    url = f'{server.base_url}/orgs/acme/teams'
+    for page in (1, 2, 1, 3):
+        collector._get(url, '/orgs/{org}/teams', params={'page': page})
+    assert [dict(params)['page'] for _, params in collector._conditional_cache] == [1, 3]
+
+def test_team_health_refreshes_share_one_survey_ingest(make_daemon, monkeypatch):
+    daemon = make_daemon()
+    ingests = []
+    monkeypatch.setattr(daemon.collector, 'ingest_surveys', lambda: ingests.append(1) or 0)
+    daemon.teams = dict(TEAMS, web=TEAMS['core'])
+    daemon.refresh('core', 'team_health')
+    daemon.refresh('web', 'team_health')
+    assert len(ingests) == 1
+
+    daemon._surveys_ingested_at -= daemon.SURVEY_INGEST_SECONDS
+    daemon.refresh('core', 'team_health')
+    assert len(ingests) == 2
+
+def test_checkpoint_keeps_a_bounded_window_per_team(tracker, make_daemon, make_metrics, tmp_path):
+    daemon = make_daemon()
+    daemon.CHECKPOINT_SNAPSHOTS_PER_TEAM = 3
+    for day in range(1, 6):
+        for team in ('core', 'web'):
+            daemon.dashboard.add_metrics(make_metrics(team, date=f'2024-03-0{day}', bugs_fixed=day))
+    daemon.checkpoint()
+
+    state = json.loads((tmp_path / 'checkpoint.json').read_text())
+    assert [(r['team_name'], r['date'][-1]) for r in state['history']] == [
+        ('core', '3'), ('web', '3'), ('core', '4'), ('web', '4'), ('core', '5'), ('web', '5')]
+    # Older snapshots still count through the checkpointed rollups
+    rollups = tracker.MetricsRollups.from_dict(state['rollups'])
+    assert [row['count'] for row in rollups.table('core', 'month')] == [5]
+
+def test_checkpoint_is_synced_before_it_replaces_the_old_one(tracker, make_daemon, monkeypatch):
+    daemon = make_daemon()
+    calls = []
+    fsync, replace = tracker.os.fsync, tracker.os.replace
+    monkeypatch.setattr(tracker.os, 'fsync', lambda fd: calls.append('fsync') or fsync(fd))
+    monkeypatch.setattr(tracker.os, 'replace', lambda src, dst: calls.append('replace') or replace(src, dst))
+    daemon.checkpoint()
+    assert calls[:2] == ['fsync', 'replace']
@@ -0,0 +1,53 @@
+"""CollectorTelemetry histograms, spans and OpenMetrics export"""
+
+import pytest
+import requests
+
+@pytest.fixture
+def telemetry(tracker):
+    return tracker.CollectorTelemetry(slowest_calls=2)
+
+def test_latency_histogram_is_cumulative(telemetry):
+    for latency in (0.004, 0.03, 2.0):
+        telemetry.record_call('api.github.com', '/repos/{repo}/pulls', 200, 100, latency)
+    text = telemetry.to_openmetrics()
+    labels = 'host="api.github.com",endpoint="/repos/{repo}/pulls",status="200"'
+    assert f'collector_http_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in text
+    assert f'collector_http_request_duration_seconds_bucket{{{labels},le="0.05"}} 2' in text
+    assert f'collector_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f'collector_http_response_bytes_total{{{labels}}} 300' in text
+    assert text.endswith('# EOF\n')
+
+def test_only_the_slowest_calls_are_kept(telemetry):
+    for latency in (0.1, 0.5, 0.2, 0.3):
+        telemetry.record_call('host', '/x', 200, 0, latency)
+    assert sorted(latency for latency, _, _ in telemetry.slowest_calls) == [0.3, 0.5]
+
+def test_calls_are_attributed_to_the_enclosing_span(telemetry):
+    with telemetry.span('team', team='core'):
+        with telemetry.span('github'):
+            telemetry.record_call('host', '/x', 500, 0, 0.1)
+    [(_, _, call)] = telemetry.slowest_calls
+    assert call['span'] == 'github'
+    assert [(span['name'], span['parent']) for span in telemetry.spans] == [('github', 'team'), ('team', None)]
+    assert 'collector_stage_duration_seconds_count{stage="team",team="core"} 1' in telemetry.to_openmetrics()
+
+def test_request_records_status_and_errors(telemetry, fake_api):
+    server = fake_api()
+    telemetry.request('GET', f'{server.base_url}/orgs/acme/teams', '/orgs/{org}/teams')
+    with pytest.raises(requests.RequestException):
+        telemetry.request('GET', 'http://127.0.0.1:9/unreachable', '/unreachable', timeout=1)
+    statuses = {status for _, _, status in telemetry.call_histograms}
+    assert statuses == {'200', 'error'}
+
+def test_metrics_endpoint_serves_the_exposition(telemetry):
+    telemetry.record_call('host', '/x', 200, 0, 0.1)
+    server = telemetry.serve_metrics(port=0)
+    try:
+        host, port = server.server_address[:2]
+        response = requests.get(f'http://{host}:{port}/metrics')
+        assert response.status_code == 200
+        assert response.text == telemetry.to_openmetrics()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,72 @@
+"""DashboardAPI aggregate caching and conditional GETs"""
+
+import json
+import threading
+
+import pytest
+import requests
+
+@pytest.fixture
+def dashboard(tracker, make_metrics):
+    dashboard = tracker.MetricsDashboard()
+    dashboard.add_metrics(make_metrics('core', deployments_count=10, deployment_success_rate=90.0))
+    dashboard.add_metrics(make_metrics('web'))
+    dashboard.add_metrics(make_metrics('data platform'))
+    return dashboard
+
+def test_views_are_built_once_per_history_change(tracker, dashboard, make_metrics, monkeypatch):
+    api = tracker.DashboardAPI(dashboard)
+    builds = []
+    build = api._build
+    monkeypatch.setattr(api, '_build', lambda team_name: builds.append(team_name) or build(team_name))
+    etag, body = api.get('core', 'dora')
+    assert json.loads(body)['change_failure_rate_percent'] == pytest.approx(10.0)
+    assert api.get('core', 'quality')[0] == api.get('core', 'quality')[0]
+    assert builds == ['core']
+
+    dashboard.add_metrics(make_metrics('core', date='2024-03-02', deployments_count=20))
+    assert api.get('core', 'dora')[0] != etag
+    api.get('web')
+    assert builds == ['core', 'core', 'web']
+
+def test_a_slow_build_only_holds_up_its_own_team(tracker, dashboard, monkeypatch):
+    api = tracker.DashboardAPI(dashboard)
+    core_building, release = threading.Event(), threading.Event()
+    order = []
+    build = api._build
+
+    def slow_build(team_name):
+        if team_name == 'core':
+            core_building.set()
+            release.wait(5)
+        order.append(team_name)
+        return build(team_name)
+
+    monkeypatch.setattr(api, '_build', slow_build)
+    thread = threading.Thread(target=api.get, args=('core',))
+    thread.start()
+    assert core_building.wait(5)
+    api.get('web')
+    release.set()
+    thread.join(5)
+    assert order == ['web', 'core']
+
+def test_unknown_team_or_view(tracker, dashboard):
+    api = tracker.DashboardAPI(dashboard)
+    assert api.get('missing') is None
+    assert api.get('core', 'missing') is None
+    assert json.loads(api.teams()[1])['teams'] == ['core', 'data platform', 'web']
+
+def test_http_conditional_get(tracker, dashboard):
+    server = tracker.DashboardAPI(dashboard).serve(port=0)
+    try:
+        host, port = server.server_address[:2]
+        url = f'http://{host}:{port}/teams/core/summary'
+        first = requests.get(url)
+        assert first.status_code == 200 and first.json()['team'] == 'core'
+        assert requests.get(url, headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+        assert requests.get(f'http://{host}:{port}/teams/core/nope').status_code == 404
+        assert requests.get(f'http://{host}:{port}/teams/data%20platform/summary').json()['team'] == 'data platform'
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,59 @@
+"""DeltaExporter change detection and crash recovery"""
+
+import json
+
+import pytest
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / 'changelog.jsonl'), str(tmp_path / 'state.json')
+
+def test_unchanged_values_on_a_new_date_are_skipped(tracker, make_metrics, paths):
+    exporter = tracker.DeltaExporter(*paths)
+    assert exporter.export(make_metrics())['op'] == 'upsert'
+    assert exporter.export(make_metrics(date='2024-03-02')) is None
+
+    entry = exporter.export(make_metrics(date='2024-03-03', deployments_count=7))
+    assert entry['op'] == 'update'
+    assert entry['changes'] == {'date': '2024-03-03', 'deployments_count': 7}
+
+def test_changelog_replays_to_latest_snapshots(tracker, make_metrics, paths):
+    exporter = tracker.DeltaExporter(*paths)
+    exporter.export_many([make_metrics('core'), make_metrics('web')])
+    exporter.export(make_metrics('web', date='2024-03-02', stories_delivered=9))
+
+    snapshots = {}
+    assert tracker.apply_changelog(snapshots, tracker.read_changelog(paths[0])) == 3
+    assert snapshots['web']['stories_delivered'] == 9
+    assert snapshots['web']['date'] == '2024-03-02'
+
+def test_sequence_resumes_past_changelog_written_before_a_crash(tracker, make_metrics, paths):
+    changelog_path, state_path = paths
+    exporter = tracker.DeltaExporter(changelog_path, state_path)
+    exporter.export(make_metrics())
+    with open(state_path) as f:
+        saved_state = f.read()
+
+    # Crash between the changelog append and the state write
+    exporter.export(make_metrics(deployments_count=5))
+    with open(state_path, 'w') as f:
+        f.write(saved_state)
+
+    recovered = tracker.DeltaExporter(changelog_path, state_path)
+    assert recovered.sequence == 2
+    assert recovered.export(make_metrics(deployments_count=6))['seq'] == 3
+
+def test_torn_final_line_is_skipped_and_terminated(tracker, make_metrics, paths):
+    changelog_path, state_path = paths
+    tracker.DeltaExporter(changelog_path, state_path).export(make_metrics())
+    with open(changelog_path, 'a') as f:
+        f.write('{"seq": 2, "op": "upd')  # Torn write
+
+    recovered = tracker.DeltaExporter(changelog_path, state_path)
+    assert recovered.sequence == 1
+    recovered.export(make_metrics(deployments_count=4))
+
+    entries = list(tracker.read_changelog(changelog_path))
+    assert [entry['seq'] for entry in entries] == [1, 2]
+    with open(changelog_path) as f:
+        assert json.loads(f.read().splitlines()[-1])['changes']['deployments_count'] == 4
@@ -0,0 +1,64 @@
+"""Chart series downsampling"""
+
+import numpy as np
+import pytest
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(7)
+    values = rng.normal(50, 5, 1000)
+    values[437] = 400  # Incident spike that must survive downsampling
+    return values
+
+def test_lttb_keeps_endpoints_and_spikes(tracker, series):
+    idx = tracker.downsample_lttb(series, 100)
+    assert len(idx) == 100
+    assert idx[0] == 0 and idx[-1] == len(series) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 437 in idx
+
+def test_short_series_are_not_downsampled(tracker):
+    assert list(tracker.downsample_lttb([3, 1, 2], 200)) == [0, 1, 2]
+    assert list(tracker.downsample_minmax([3, 1, 2], 200)) == [0, 1, 2]
+
+def test_minmax_keeps_each_bucket_extremes(tracker, series):
+    idx = tracker.downsample_minmax(series, 20)
+    assert idx[0] == 0 and idx[-1] == len(series) - 1
+    assert np.argmax(series) in idx and np.argmin(series) in idx
+    assert len(idx) <= 22
+
+def test_velocity_chart_downsamples_the_daily_series(tracker, make_metrics, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dashboard = tracker.MetricsDashboard()
+    start = tracker.datetime(2024, 1, 1)
+    for day in range(200):
+        date = (start + tracker.timedelta(days=day)).strftime('%Y-%m-%d')
+        dashboard.add_metrics(make_metrics(date=date, story_points_completed=day))
+
+    plotted = []
+    lttb = tracker.downsample_lttb
+    monkeypatch.setattr(tracker, 'downsample_lttb',
+                        lambda values, points: plotted.append(list(values)) or lttb(values, points))
+    assert dashboard.generate_velocity_chart('core', days=120, max_points=50)
+    assert plotted[0] == list(range(80, 200))
+    assert len(lttb(plotted[0], 50)) == 50
+
+def test_velocity_chart_can_downsample_with_minmax(tracker, make_metrics, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dashboard = tracker.MetricsDashboard()
+    start = tracker.datetime(2024, 1, 1)
+    for day in range(90):
+        date = (start + tracker.timedelta(days=day)).strftime('%Y-%m-%d')
+        dashboard.add_metrics(make_metrics(date=date, story_points_completed=400 if day == 37 else 50))
+
+    picked = []
+    minmax = tracker.downsample_minmax
+    monkeypatch.setattr(tracker, 'downsample_minmax',
+                        lambda values, points: picked.append(minmax(values, points)) or picked[-1])
+    tracker.plt.close('all')
+    assert dashboard.generate_velocity_chart('core', max_points=20, method='minmax')
+    assert 37 in picked[0] and len(picked[0]) <= 22
+    assert tracker.plt.get_fignums() == []  # The figure is closed, not shown
+
+    with pytest.raises(ValueError):
+        dashboard.generate_velocity_chart('core', method='average')
@@ -0,0 +1,120 @@
+"""EmailOutbox durable spooling, retries, relay pauses and claims across processes sharing a spool"""
+
+import smtplib
+import threading
+import time
+
+import pytest
+
+class ScriptedSender:
+    """Sender that raises the scripted errors in turn, then succeeds"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def __call__(self, from_address, to_address, message):
+        with self.lock:
+            if self.errors:
+                raise self.errors.pop(0)
+            self.sent.append(to_address)
+
+@pytest.fixture
+def spool(tmp_path):
+    return str(tmp_path / 'outbox.db')
+
+@pytest.fixture
+def make_outbox(onboarding, spool):
+    outboxes = []
+
+    def make(sender=None, **options):
+        options = dict({'workers': 1, 'base_delay': 0.01, 'max_delay': 0.05}, **options)
+        outbox = onboarding.EmailOutbox(spool, sender, **options)
+        outboxes.append(outbox)
+        return outbox
+
+    yield make
+    for outbox in outboxes:
+        try:
+            outbox.close(drain_timeout=1)
+        except Exception:
+            pass  # Already closed by the test
+
+def deliver(outbox, count=1):
+    ids = [outbox.enqueue('hr@example.com', f'user{i}@example.com', 'Welcome', 'body', tag='batch')
+           for i in range(count)]
+    outbox.start()
+    assert outbox.drain(10)
+    return {message['id']: message for message in outbox.status('batch') if message['id'] in ids}
+
+def test_transient_failure_is_retried_until_sent(make_outbox):
+    sender = ScriptedSender(smtplib.SMTPDataError(451, b'Try again later'))
+    [message] = deliver(make_outbox(sender)).values()
+    assert (message['status'], message['attempts']) == ('sent', 2)
+    assert sender.sent == ['user0@example.com']
+
+def test_permanent_rejection_fails_without_retry(make_outbox):
+    refused = smtplib.SMTPRecipientsRefused({'user0@example.com': (550, b'No such user')})
+    [message] = deliver(make_outbox(ScriptedSender(refused))).values()
+    assert (message['status'], message['attempts']) == ('failed', 1)
+    assert 'No such user' in message['last_error']
+
+def test_gives_up_after_max_attempts(make_outbox):
+    errors = [smtplib.SMTPDataError(451, b'Try again later')] * 5
+    [message] = deliver(make_outbox(ScriptedSender(*errors), max_attempts=3)).values()
+    assert (message['status'], message['attempts']) == ('failed', 3)
+
+def test_relay_login_failure_pauses_without_using_attempts(make_outbox):
+    errors = [smtplib.SMTPAuthenticationError(535, b'Bad credentials')] * 3
+    sender = ScriptedSender(*errors)
+    [message] = deliver(make_outbox(sender, max_attempts=2)).values()
+    assert (message['status'], message['attempts']) == ('sent', 1)
+    assert sender.sent == ['user0@example.com']
+
+def test_spooled_mail_survives_a_restart(make_outbox):
+    make_outbox().enqueue('hr@example.com', 'user@example.com', 'Welcome', 'body', tag='batch')
+
+    sender = ScriptedSender()
+    outbox = make_outbox(sender)
+    outbox.start()
+    assert outbox.drain(10)
+    assert sender.sent == ['user@example.com']
+    assert outbox.counts() == {'sent': 1}
+
+def test_live_claims_are_not_stolen_but_expired_leases_are(make_outbox):
+    first = make_outbox(lease_seconds=60)
+    second = make_outbox(lease_seconds=60)
+    message_id = first.enqueue('hr@example.com', 'user@example.com', 'Welcome', 'body')
+
+    now = time.time()
+    with first._lock:
+        assert first._try_claim(now)['id'] == message_id
+    with second._lock:
+        assert second._try_claim(now) is None
+        # The first instance died holding the message
+        assert second._try_claim(now + 61)['id'] == message_id
+
+def test_instances_sharing_a_spool_send_each_message_once(make_outbox):
+    sender = ScriptedSender()
+    outboxes = [make_outbox(sender, workers=3) for _ in range(3)]
+    for i in range(30):
+        outboxes[i % 3].enqueue('hr@example.com', f'user{i}@example.com', 'Welcome', 'body')
+    for outbox in outboxes:
+        outbox.start()
+    for outbox in outboxes:
+        assert outbox.drain(10)
+
+    assert sorted(sender.sent) == sorted(f'user{i}@example.com' for i in range(30))
+    assert outboxes[0].counts() == {'sent': 30}
+
+def test_read_only_outbox_reports_status_but_cannot_send(onboarding, make_outbox, spool):
+    make_outbox().enqueue('hr@example.com', 'user@example.com', 'Welcome', 'body', tag='user@example.com')
+
+    reader = onboarding.EmailOutbox(spool, read_only=True)
+    try:
+        assert [m['status'] for m in reader.status('user@example.com')] == ['queued']
+        with pytest.raises(ValueError):
+            reader.start()
+    finally:
+        reader.close()
@@ -0,0 +1,31 @@
+"""Batch executive summaries rendered from shared templates"""
+
+import pytest
+
+@pytest.fixture
+def dashboard(tracker, make_metrics):
+    dashboard = tracker.MetricsDashboard()
+    for day in range(1, 7):
+        dashboard.add_metrics(make_metrics('core', date=f'2024-03-0{day}', pull_requests_merged=day))
+    dashboard.add_metrics(make_metrics('<web>', code_review_time_hours=2.5))
+    return dashboard
+
+def test_batch_output_matches_single_team_summaries(dashboard, tmp_path):
+    paths = dashboard.generate_executive_summaries(output_dir=str(tmp_path), workers=2)
+    assert set(paths) == {'core', '<web>', '_all'}
+    for team_name in ('core', '<web>'):
+        with open(paths[team_name], encoding='utf-8') as f:
+            assert f.read() == dashboard.generate_executive_summary(team_name)
+
+    with open(paths['_all'], encoding='utf-8') as f:
+        consolidated = f.read()
+    assert consolidated.startswith('# Engineering Organization Summary\n**Teams**: 2')
+    assert '**PRs Merged (30 days)**: 18' in consolidated
+
+def test_html_escapes_team_names(dashboard, tmp_path):
+    dashboard.generate_executive_summaries(['<web>'], output_dir=str(tmp_path))
+    page = (tmp_path / '<web>_executive_summary.html').read_text(encoding='utf-8')
+    assert '&lt;web&gt;' in page and '<web>' not in page
+
+def test_unknown_teams_are_skipped(dashboard, tmp_path):
+    assert dashboard.generate_executive_summaries(['missing'], output_dir=str(tmp_path)) == {}
@@ -0,0 +1,57 @@
+"""Fake API server pagination, conditional requests, rate limits and replay"""
+
+import requests
+
+def test_github_link_pagination_covers_every_team(fake_api):
+    server = fake_api(teams=7)
+    url, teams = f'{server.base_url}/orgs/acme/teams?per_page=3', []
+    while url:
+        response = requests.get(url)
+        teams.extend(response.json())
+        url = response.links.get('next', {}).get('url')
+    assert len(teams) == 7 and len({team['id'] for team in teams}) == 7
+
+def test_slack_cursor_pagination(fake_api):
+    server = fake_api(channels=15)
+    cursor, channels = '', []
+    while True:
+        payload = requests.get(f'{server.base_url}/api/conversations.list',
+                               params={'limit': 2, 'cursor': cursor}).json()
+        channels.extend(payload['channels'])
+        cursor = payload['response_metadata']['next_cursor']
+        if not cursor:
+            break
+    assert len(channels) == 15 and channels[0]['name'] == 'engineering-general'
+
+def test_etag_revalidation_returns_304(fake_api):
+    server = fake_api()
+    url = f'{server.base_url}/orgs/acme/teams'
+    etag = requests.get(url).headers['ETag']
+    assert requests.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+def test_contributor_stats_are_pending_before_ready(fake_api):
+    server = fake_api(stats_pending_polls=2)
+    url = f'{server.base_url}/repos/acme/api/stats/contributors'
+    assert [requests.get(url).status_code for _ in range(3)] == [202, 202, 200]
+
+def test_rate_limit_answers_429_with_retry_after(fake_api):
+    server = fake_api(rate_limit=2, rate_limit_window=60)
+    responses = [requests.get(f'{server.base_url}/orgs/acme/teams') for _ in range(3)]
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert int(responses[-1].headers['Retry-After']) > 0
+    # Other APIs have their own window
+    assert requests.get(f'{server.base_url}/api/conversations.list').status_code == 200
+
+def test_recorded_fixtures_are_replayed(fake_api):
+    fixtures = {'responses': {'GET /repos/acme/api/pulls': {'status': 200, 'body': [{'number': 1}]}}}
+    server = fake_api(fixtures=fixtures)
+    assert requests.get(f'{server.base_url}/repos/acme/api/pulls').json() == [{'number': 1}]
+    stats = requests.get(f'{server.base_url}/__stats').json()
+    assert stats['requests']['/repos/{r}/pulls'] == 1
+
+def test_jira_issue_requires_a_summary(fake_api):
+    server = fake_api()
+    url = f'{server.base_url}/rest/api/2/issue'
+    assert requests.post(url, json={'fields': {}}).status_code == 400
+    created = requests.post(url, json={'fields': {'project': {'key': 'ENG'}, 'summary': 'Laptop'}})
+    assert created.status_code == 201 and created.json()['key'] == 'ENG-1'
@@ -0,0 +1,100 @@
+"""GitHub org metadata cache against the fake API server"""
+
+import pytest
+import requests
+
+def request_count(server, route):
+    return requests.get(f'{server.base_url}/__stats').json()['requests'].get(route, 0)
+
+@pytest.fixture
+def server(fake_api):
+    return fake_api(teams=25, repos=30)
+
+@pytest.fixture
+def make_github(onboarding, server, tmp_path):
+    def make(org='acme'):
+        github = onboarding.GitHubIntegration('ghp-test', org, base_url=server.base_url,
+                                              org_cache_path=str(tmp_path / 'org_cache.json'))
+        github.ORG_PAGE_SIZE = 10
+        return github
+    return make
+
+def test_teams_past_the_first_page_resolve_from_one_listing(make_github, server):
+    github = make_github()
+    assert github.add_user_to_team('ada', 'squad-019')
+    assert github.add_user_to_team('ada', 'Backend-Team')
+    assert github.get_repository('SERVICE-014')['name'] == 'service-014'
+    assert request_count(server, '/orgs/{org}/teams') == 3
+    assert request_count(server, '/orgs/{org}/repos') == 3
+
+def test_snapshot_is_reused_by_the_next_run(make_github, server):
+    make_github().load_org_metadata()
+    assert make_github().get_team('squad-000')['id'] == 1005
+    assert request_count(server, '/orgs/{org}/teams') == 3
+
+    make_github(org='other').load_org_metadata()
+    assert request_count(server, '/orgs/{org}/teams') == 6
+
+def test_misses_refresh_at_most_once_per_interval(make_github, server):
+    github = make_github()
+    assert github.get_team('no-such-team') is None
+    assert github.get_team('no-such-team') is None
+    assert request_count(server, '/orgs/{org}/teams') == 3
+
+    github._org_attempted_at -= github.ORG_MISS_REFRESH_SECONDS + 1
+    assert github.get_team('no-such-team') is None
+    assert request_count(server, '/orgs/{org}/teams') == 6
+
+def test_unknown_repositories_fail_without_a_request(make_github, server):
+    results = make_github().grant_repository_access('ada', ['Web-App', 'not-a-repo'])
+    assert results == {'Web-App': True, 'not-a-repo': False}
+    assert request_count(server, '/repos/{r}/collaborators/{user}') == 1
+
+def test_team_repositories_are_granted_through_membership(make_github, server):
+    github = make_github()
+    repos = ['shared-libraries', 'documentation', 'API-Service', 'onboarding']
+    results = github.grant_repository_access('ada', repos, team_name='backend-team')
+
+    assert list(results) == repos and all(results.values())
+    assert request_count(server, '/teams/{id}/repos') == 1
+    assert request_count(server, '/repos/{r}/collaborators/{user}') == 2
+
+    github.grant_repository_access('grace', repos, team_name='backend-team')
+    assert request_count(server, '/teams/{id}/repos') == 1
+
+def response(status, text='', **headers):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    response._content = text.encode()
+    return response
+
+def test_rate_limit_delays(make_github):
+    delay = make_github()._rate_limit_delay
+    assert delay(response(201), 0) is None
+    assert delay(response(403, 'Resource not accessible'), 0) is None
+    assert delay(response(429, **{'Retry-After': '7'}), 0) == 7.0
+    assert delay(response(403, 'You have exceeded a secondary rate limit'), 2) == 240.0
+
+    reset = response(403, **{'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '0'})
+    assert delay(reset, 0) == 1.0
+
+def test_repositories_listed_without_permissions_get_explicit_grants(make_github, monkeypatch):
+    github = make_github()
+    github.load_org_metadata()
+    monkeypatch.setattr(github, '_list_all', lambda url: [{'name': 'Web-App'},
+                                                          {'name': 'docs', 'permissions': {'push': True}}])
+    assert github.team_repositories('backend-team') == {'web-app': False, 'docs': True}
+
+def test_team_repositories_are_listed_outside_the_org_lock(make_github, monkeypatch):
+    github = make_github()
+    github.load_org_metadata()
+
+    def list_all(url):
+        # Another grant thread must be able to take the lock while this one pages
+        assert github._org_lock.acquire(timeout=1)
+        github._org_lock.release()
+        return [{'name': 'web-app', 'permissions': {'push': True}}]
+
+    monkeypatch.setattr(github, '_list_all', list_all)
+    assert github.team_repositories('backend-team') == {'web-app': True}
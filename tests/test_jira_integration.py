@@ -0,0 +1,112 @@
+"""Jira bulk issue creation against the fake API server"""
+
+import pytest
+import requests
+
+def stats(server):
+    return requests.get(f'{server.base_url}/__stats').json()
+
+def request_count(server, route):
+    return stats(server)['requests'].get(route, 0)
+
+def issues(count, prefix='task'):
+    return [(f'{prefix}-{i}', {'fields': {'project': {'key': 'ENG'}, 'summary': f'Task {i}'}})
+            for i in range(count)]
+
+@pytest.fixture
+def make_jira(onboarding):
+    def make(server, **options):
+        return onboarding.JiraIntegration(server.base_url, 'bot', 'token', **options)
+    return make
+
+def test_issues_are_created_in_bulk_chunks(make_jira, fake_api):
+    server = fake_api()
+    created = make_jira(server, bulk_size=3).create_issues(issues(7))
+    assert list(created.values()) == [f'ENG-{i}' for i in range(1, 8)]
+    assert request_count(server, '/rest/api/2/issue/bulk') == 3
+    assert request_count(server, '/rest/api/2/issue') == 0
+
+def test_only_failed_elements_are_retried_individually(make_jira, fake_api):
+    server = fake_api(jira_bulk_failure_rate=0.5)
+    created = make_jira(server, bulk_size=10).create_issues(issues(20))
+    assert all(created.values())
+    assert len(set(created.values())) == 20
+    assert stats(server)['jira_issues'] == 20  # Nothing created twice
+    assert request_count(server, '/rest/api/2/issue/bulk') == 2
+    assert 0 < request_count(server, '/rest/api/2/issue') < 20
+
+def test_rejected_elements_map_back_to_their_items(make_jira, fake_api):
+    server = fake_api()
+    batch = issues(3)
+    batch[1] = ('no-summary', {'fields': {'project': {'key': 'ENG'}}})
+    created = make_jira(server).create_issues(batch)
+    assert created == {'task-0': 'ENG-1', 'no-summary': None, 'task-2': 'ENG-2'}
+    assert request_count(server, '/rest/api/2/issue') == 1
+
+def test_chunk_rejected_as_a_whole_falls_back_to_single_creates(make_jira, fake_api):
+    server = fake_api(jira_bulk_limit=2)
+    created = make_jira(server, bulk_size=5).create_issues(issues(5))
+    assert all(created.values())
+    assert request_count(server, '/rest/api/2/issue') == 5
+
+def test_onboarding_tasks_keep_task_order(make_jira, fake_api, make_employee):
+    server = fake_api(jira_bulk_failure_rate=0.3)
+    jira = make_jira(server)
+    employee = make_employee()
+    keys = jira.create_onboarding_tasks('ONBOARD-1', employee)
+    tasks = jira._get_onboarding_tasks(employee)
+    assert len(keys) == len(tasks)
+    summaries = [server.state.jira_issues[key]['summary'] for key in keys]
+    assert summaries == [jira._task_payload(task, 'ONBOARD-1', employee)['fields']['summary'] for task in tasks]
+
+@pytest.mark.parametrize('config, expected', [
+    ({'jira_bulk_failure_rate': 1.0}, 'failed'),
+    ({'jira_bulk_limit': 2}, 'failed'),
+    ({'jira_bulk_lost_rate': 1.0}, 'unknown'),
+])
+def test_bulk_create_splits_definite_failures_from_unknown_outcomes(make_jira, fake_api, config, expected):
+    server = fake_api(**config)
+    chunk = issues(3)
+    created = dict.fromkeys(item_id for item_id, _ in chunk)
+    failed, unknown = make_jira(server)._bulk_create(chunk, created)
+    assert {'failed': failed, 'unknown': unknown}[expected] == [0, 1, 2]
+    assert not failed or not unknown
+    assert not any(created.values())
+
+def test_unreachable_jira_leaves_the_outcome_unknown(onboarding):
+    jira = onboarding.JiraIntegration('http://127.0.0.1:9', 'bot', 'token')
+    assert jira._bulk_create(issues(2), {}) == ([], [0, 1])
+
+def test_lost_bulk_response_reuses_the_created_issues(make_jira, fake_api, make_employee):
+    server = fake_api(jira_bulk_lost_rate=1.0)
+    jira = make_jira(server)
+    employee = make_employee()
+    keys = jira.create_onboarding_tasks('ONBOARD-1', employee)
+
+    tasks = jira._get_onboarding_tasks(employee)
+    assert len(set(keys)) == len(tasks)
+    assert stats(server)['jira_issues'] == len(tasks)
+    assert request_count(server, '/rest/api/2/issue') == 0
+    assert request_count(server, '/rest/api/2/search') == len(tasks)
+
+def test_issues_go_to_the_configured_project(make_jira, fake_api, make_employee):
+    server = fake_api(jira_bulk_lost_rate=1.0)
+    jira = make_jira(server, project_key='PEOPLE')
+    employee = make_employee()
+    epic = jira.create_onboarding_epic(employee)
+    keys = jira.create_onboarding_tasks(epic, employee)
+
+    assert epic.startswith('PEOPLE-') and all(key.startswith('PEOPLE-') for key in keys)
+    # Lost bulk responses were recovered by searching the configured project
+    assert len(keys) == len(jira._get_onboarding_tasks(employee))
+    assert stats(server)['jira_issues'] == len(keys) + 1
+
+def test_single_creates_time_out(onboarding, make_jira, fake_api, monkeypatch):
+    server = fake_api()
+    timeouts = []
+    post = onboarding.requests.post
+    monkeypatch.setattr(onboarding.requests, 'post',
+                        lambda url, **kwargs: timeouts.append(kwargs.get('timeout')) or post(url, **kwargs))
+    jira = make_jira(server)
+    assert jira._create_issue('task-0', issues(1)[0][1]) == 'ENG-1'
+    assert timeouts == [jira.REQUEST_TIMEOUT]
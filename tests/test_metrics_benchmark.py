@@ -0,0 +1,54 @@
+"""Benchmark suite results and baseline comparison"""
+
+import sys
+import tracemalloc
+
+import pytest
+
+from conftest import load_script
+
+@pytest.fixture(scope='module')
+def benchmark(tracker):
+    module = load_script('performance-dashboards/metrics-benchmark.py', 'metrics_benchmark')
+    # The script imports its own copy of the tracker; keep the shared one registered
+    sys.modules['team_metrics_tracker'] = tracker
+    module.tracker = tracker
+    return module
+
+def result(name='analytics', seconds=1.0, peak_memory_mb=10.0):
+    return {'name': name, 'size': '10x52', 'seconds': seconds, 'peak_memory_mb': peak_memory_mb}
+
+def test_parse_sizes(benchmark):
+    assert benchmark.parse_sizes('10x52,50X104') == [(10, 52), (50, 104)]
+
+def test_timed_runs_are_untraced_and_memory_is_measured_separately(benchmark, monkeypatch):
+    tracing = []
+    durations = iter([0.0, 3.0, 0.0, 1.0, 0.0, 2.0])
+    monkeypatch.setattr(benchmark.time, 'perf_counter', lambda: next(durations))
+
+    def func():
+        tracing.append(tracemalloc.is_tracing())
+        if tracing[-1]:
+            bytearray(2 * 1024 * 1024)
+        return 7
+
+    seconds, peak_mb, ops = benchmark.measure(func, repeats=3)
+    assert tracing == [False, False, False, True]
+    assert (seconds, ops) == (1.0, 7)
+    assert peak_mb >= 2
+
+def test_regressions_beyond_tolerance_are_reported(benchmark):
+    baseline = {'results': [result()]}
+    [regression] = benchmark.compare_to_baseline([result(seconds=1.5)], baseline, tolerance=0.2)
+    assert (regression['metric'], regression['change_percent']) == ('seconds', 50.0)
+    assert benchmark.compare_to_baseline([result(seconds=1.1)], baseline, tolerance=0.2) == []
+
+def test_changes_below_the_noise_floor_are_ignored(benchmark):
+    baseline = {'results': [result(seconds=0.001, peak_memory_mb=0.1)]}
+    assert benchmark.compare_to_baseline([result(seconds=0.003, peak_memory_mb=0.4)], baseline, 0.2) == []
+
+def test_suite_reports_every_benchmark_per_size(benchmark):
+    results = benchmark.run_suite([(2, 4)], seed=1, repeats=2)
+    assert {r['name'] for r in results} == {
+        'collect_github_metrics', 'dashboard_reports', 'dora_metrics', 'alerts_check_thresholds', 'analytics'}
+    assert all(r['size'] == '2x4' and r['seconds'] >= 0 and r['ops'] > 0 for r in results)
@@ -0,0 +1,77 @@
+"""Incremental week/month/quarter rollups"""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+def test_period_keys(tracker):
+    assert tracker.period_key('2024-02-14', 'week') == '2024-W07'
+    assert tracker.period_key('2024-02-14', 'month') == '2024-02'
+    assert tracker.period_key('2024-02-14', 'quarter') == '2024-Q1'
+    with pytest.raises(ValueError):
+        tracker.period_key('2024-02-14', 'decade')
+
+def test_tables_aggregate_per_period(tracker, make_metrics):
+    rollups = tracker.MetricsRollups.from_history([
+        make_metrics(date='2024-01-30', bugs_fixed=2),
+        make_metrics(date='2024-01-31', bugs_fixed=6),
+        make_metrics(date='2024-02-01', bugs_fixed=5)
+    ])
+    january, february = rollups.table('core', 'month')
+    assert (january['period'], january['count']) == ('2024-01', 2)
+    assert january['avg']['bugs_fixed'] == 4 and january['min']['bugs_fixed'] == 2
+    assert january['max']['bugs_fixed'] == 6 and january['total']['bugs_fixed'] == 8
+    assert february['count'] == 1
+    [quarter] = rollups.table('core', 'quarter')
+    assert quarter['count'] == 3
+
+@pytest.mark.parametrize('replacement', [
+    {'bugs_fixed': 4},       # Interior value: sums adjusted in place
+    {'bugs_fixed': 9},       # Replaces the bucket max
+    {'uptime_percent': 0.5}  # Old value was the bucket max, new one the min
+])
+def test_same_day_replacement_matches_a_full_rebuild(tracker, make_metrics, replacement):
+    dashboard = tracker.MetricsDashboard()
+    dashboard.add_metrics(make_metrics(date='2024-01-29', bugs_fixed=2, uptime_percent=1.0))
+    dashboard.add_metrics(make_metrics(date='2024-01-30', bugs_fixed=6, uptime_percent=2.0))
+    dashboard.update_metrics(make_metrics(date='2024-01-30', **dict({'bugs_fixed': 6, 'uptime_percent': 2.0},
+                                                                     **replacement)))
+
+    assert len(dashboard.metrics_history) == 2
+    rebuilt = tracker.MetricsRollups.from_history(dashboard.metrics_history)
+    for granularity in tracker.ROLLUP_GRANULARITIES:
+        assert dashboard.rollups.table('core', granularity) == rebuilt.table('core', granularity)
+    assert dashboard.rollups.latest('core')[-1].bugs_fixed == replacement.get('bugs_fixed', 6)
+
+def test_persisted_rollups_round_trip_through_json(tracker, make_metrics):
+    rollups = tracker.MetricsRollups.from_history(
+        make_metrics(date=f'2024-01-{day:02d}', bugs_fixed=day) for day in range(1, 10))
+    restored = tracker.MetricsRollups.from_dict(json.loads(json.dumps(rollups.to_dict())))
+    assert restored.table('core', 'week') == rollups.table('core', 'week')
+    assert [m.bugs_fixed for m in restored.latest('core')] == [6, 7, 8, 9]
+
+    restored.add(make_metrics(date='2024-01-10', bugs_fixed=10))
+    assert restored.table('core', 'month')[0]['count'] == 10
+
+def test_rollups_from_another_version_are_rebuilt(tracker, make_metrics):
+    state = tracker.MetricsRollups.from_history([make_metrics(bugs_fixed=3)]).to_dict()
+    assert tracker.MetricsRollups.from_dict(dict(state, version=-1)) is None
+
+    dashboard = tracker.MetricsDashboard()
+    dashboard.load_history([make_metrics(bugs_fixed=5)], dict(state, version=-1))
+    assert dashboard.rollups.table('core', 'month')[0]['total']['bugs_fixed'] == 5
+
+def test_quality_report_reads_the_recent_window(tracker, make_metrics):
+    dashboard = tracker.MetricsDashboard()
+    for day in range(1, 7):
+        dashboard.add_metrics(make_metrics(date=f'2024-01-{day:02d}', pull_requests_merged=day))
+    assert dashboard.generate_quality_metrics_report('core')['total_prs_merged'] == 3 + 4 + 5 + 6
+
+def test_checkpoint_rollups_are_rebuilt_from_raw_history(tracker, make_metrics, tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    path.write_text(json.dumps({'history': [asdict(make_metrics(bugs_fixed=7))], 'rollups': {'version': -1}}))
+    tracker.rebuild_checkpoint_rollups(str(path))
+
+    restored = tracker.MetricsRollups.from_dict(json.loads(path.read_text())['rollups'])
+    assert restored.table('core', 'week')[0]['total']['bugs_fixed'] == 7
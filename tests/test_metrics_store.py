@@ -0,0 +1,40 @@
+"""FrozenTeamMetrics and the NumPy-backed TeamMetricsStore"""
+
+import pickle
+from dataclasses import asdict
+
+import pytest
+
+def test_frozen_metrics_round_trip_and_pickle(tracker, make_metrics):
+    metrics = make_metrics(code_review_time_hours=2.5)
+    frozen = tracker.FrozenTeamMetrics.from_metrics(metrics)
+    assert not hasattr(frozen, '__dict__')
+    assert frozen.to_metrics() == metrics
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    with pytest.raises(Exception):
+        frozen.bugs_fixed = 3
+
+def test_store_round_trips_records(tracker, make_metrics):
+    records = [asdict(make_metrics('core', uptime_percent=99.95)),
+               asdict(make_metrics('web', date='2024-03-02', stories_delivered=7))]
+    store = tracker.TeamMetricsStore.from_records(records)
+    assert store.to_records() == records
+    assert len(store) == 2 and store[-1].team_name == 'web'
+    assert [row.date for row in reversed(store)] == ['2024-03-02', '2024-03-01']
+
+def test_store_grows_and_filters_by_team(tracker, make_metrics):
+    store = tracker.TeamMetricsStore(capacity=1)
+    for day in range(1, 6):
+        store.append(make_metrics('core' if day % 2 else 'web', date=f'2024-03-0{day}', bugs_fixed=day))
+
+    assert [row.bugs_fixed for row in store.team_rows('core')] == [1, 3, 5]
+    assert list(store.column('bugs_fixed', 'web')) == [2, 4]
+    assert len(store.team_rows('missing')) == 0
+    assert store[1:3][0].to_metrics() == make_metrics('web', date='2024-03-02', bugs_fixed=2)
+    with pytest.raises(IndexError):
+        store[5]
+
+def test_dashboard_reads_from_a_store(tracker, make_metrics):
+    dashboard = tracker.MetricsDashboard(history=tracker.TeamMetricsStore())
+    dashboard.add_metrics(make_metrics(pull_requests_merged=4))
+    assert dashboard.generate_quality_metrics_report('core')['total_prs_merged'] == 4
@@ -0,0 +1,127 @@
+"""OnboardingJournal bookkeeping and resuming interrupted onboardings"""
+
+import pytest
+
+@pytest.fixture
+def journal(onboarding, tmp_path):
+    journal = onboarding.OnboardingJournal(str(tmp_path / 'journal.db'))
+    yield journal
+    journal.close()
+
+@pytest.fixture
+def employee(make_employee):
+    return make_employee()
+
+@pytest.fixture
+def orchestrator(onboarding, journal):
+    # Skips config loading and integration setup; tests attach what they need
+    orchestrator = onboarding.OnboardingOrchestrator.__new__(onboarding.OnboardingOrchestrator)
+    orchestrator.journal = journal
+    orchestrator.limits = {}
+    return orchestrator
+
+def new_results():
+    return {'success': True, 'errors': [], 'resumed': []}
+
+def test_record_and_reset(journal):
+    journal.record('Ada@example.com', 'jira.epic', None, False, 'timeout')
+    journal.record('ada@example.com', 'jira.epic', 'ONBOARD-7', True)
+
+    assert journal.get('ADA@example.com', 'jira.epic') == {
+        'status': 'done', 'output': 'ONBOARD-7', 'error': None, 'attempts': 2}
+    assert journal.history('ada@example.com')['jira.epic']['attempts'] == 2
+
+    journal.reset('ada@example.com')
+    assert journal.get('ada@example.com', 'jira.epic') is None
+
+def test_rerun_skips_done_steps_and_retries_failed_ones(onboarding, orchestrator, employee):
+    calls = []
+    fail = {'slack'}
+
+    def step(name):
+        def run(emp, results):
+            calls.append(name)
+            if name in fail:
+                raise RuntimeError(f'{name} unavailable')
+            return {'success': True, 'name': name}
+        return run
+
+    steps = [
+        onboarding.OnboardingStep('github', step('github'), 'github'),
+        onboarding.OnboardingStep('slack', step('slack'), 'slack'),
+        onboarding.OnboardingStep('email', step('email'), 'smtp', ['slack'])
+    ]
+
+    first = new_results()
+    orchestrator._run_steps(employee, steps, first)
+    assert sorted(calls) == ['github', 'slack']
+    assert first['email']['skipped'] == 'slack did not complete'
+    assert orchestrator.journal.get(employee.email, 'slack')['status'] == 'failed'
+
+    calls.clear()
+    fail.clear()
+    second = new_results()
+    orchestrator._run_steps(employee, steps, second)
+    assert sorted(calls) == ['email', 'slack']
+    assert second['resumed'] == ['github']
+    assert second['github'] == {'success': True, 'name': 'github'}
+    assert second['success']
+
+def test_journaled_action_runs_once_until_it_succeeds(orchestrator, employee):
+    outputs = iter([None, 'ONBOARD-1', 'ONBOARD-2'])
+    calls = []
+
+    def create_epic():
+        calls.append(1)
+        return next(outputs)
+
+    assert orchestrator._journaled(employee, 'jira.epic', create_epic) is None
+    assert orchestrator._journaled(employee, 'jira.epic', create_epic) == 'ONBOARD-1'
+    assert orchestrator._journaled(employee, 'jira.epic', create_epic) == 'ONBOARD-1'
+    assert len(calls) == 2
+
+class FakeIAM:
+    """Records IAM calls; create_user fails the way boto3 does for an existing user"""
+
+    class EntityAlreadyExists(Exception):
+        response = {'Error': {'Code': 'EntityAlreadyExists'}}
+
+    def __init__(self, existing=()):
+        self.users = set(existing)
+        self.calls = []
+
+    def create_user(self, UserName, Tags):
+        self.calls.append('create_user')
+        if UserName in self.users:
+            raise self.EntityAlreadyExists(UserName)
+        self.users.add(UserName)
+
+    def create_access_key(self, UserName):
+        self.calls.append('create_access_key')
+        return {'AccessKey': {'AccessKeyId': 'AKIA', 'SecretAccessKey': 'secret'}}
+
+    def add_user_to_group(self, UserName, GroupName):
+        pass
+
+def fake_aws(onboarding, iam):
+    aws = onboarding.AWSIntegration.__new__(onboarding.AWSIntegration)
+    aws.iam = iam
+    return aws
+
+def test_iam_user_is_journaled_and_not_created_again(onboarding, orchestrator, employee):
+    iam = FakeIAM()
+    orchestrator.aws = fake_aws(onboarding, iam)
+
+    assert orchestrator._setup_aws_access(employee)['credentials']['username'] == 'ada.lovelace'
+    assert orchestrator.journal.get(employee.email, 'aws.user')['output'] == 'ada.lovelace'
+
+    iam.calls.clear()
+    assert orchestrator._setup_aws_access(employee)['success']
+    assert iam.calls == ['create_access_key']
+
+def test_existing_iam_user_counts_as_created(onboarding, orchestrator, employee):
+    orchestrator.aws = fake_aws(onboarding, FakeIAM(existing={'ada.lovelace'}))
+
+    result = orchestrator._setup_aws_access(employee)
+    assert result['success'] and result['user_created']
+    assert orchestrator.journal.get(employee.email, 'aws.user')['status'] == 'done'
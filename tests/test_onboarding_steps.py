@@ -0,0 +1,71 @@
+"""Onboarding steps run as a dependency graph"""
+
+import threading
+
+import pytest
+
+@pytest.fixture
+def orchestrator(onboarding):
+    # Skips config loading and integration setup
+    orchestrator = onboarding.OnboardingOrchestrator.__new__(onboarding.OnboardingOrchestrator)
+    orchestrator.journal = None
+    orchestrator.limits = {}
+    return orchestrator
+
+def new_results():
+    return {'success': True, 'errors': []}
+
+def test_independent_steps_run_concurrently(onboarding, orchestrator, make_employee):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def independent(employee, results):
+        barrier.wait()  # Only passes if all three run at once
+        return {'success': True}
+
+    def jira(employee, results):
+        barrier.wait()
+        return {'epic': 'ENG-1'}
+
+    def email(employee, results):
+        return {'success': True, 'epic': results['jira']['epic']}
+
+    steps = [onboarding.OnboardingStep('github', independent, 'github'),
+             onboarding.OnboardingStep('slack', independent, 'slack'),
+             onboarding.OnboardingStep('jira', jira, 'jira'),
+             onboarding.OnboardingStep('email', email, 'smtp', ['jira'])]
+    results = new_results()
+    orchestrator._run_steps(make_employee(), steps, results)
+
+    assert results['email'] == {'success': True, 'epic': 'ENG-1'}
+    assert results['success'] and not results['errors']
+    assert set(results['timings']) == {'github', 'slack', 'jira', 'email', 'total'}
+
+def test_failure_skips_only_downstream_steps(onboarding, orchestrator, make_employee):
+    ran = []
+
+    def step(name, fail=False):
+        def run(employee, results):
+            ran.append(name)
+            if fail:
+                raise RuntimeError('jira down')
+            return {'success': True}
+        return run
+
+    steps = [onboarding.OnboardingStep('jira', step('jira', fail=True), 'jira'),
+             onboarding.OnboardingStep('email', step('email'), 'smtp', ['jira']),
+             onboarding.OnboardingStep('report', step('report'), 'smtp', ['email']),
+             onboarding.OnboardingStep('github', step('github'), 'github')]
+    results = new_results()
+    orchestrator._run_steps(make_employee(), steps, results)
+
+    assert sorted(ran) == ['github', 'jira']
+    assert not results['success'] and results['errors'] == ['jira: jira down']
+    assert results['email']['skipped'] == 'jira did not complete'
+    assert results['report']['skipped'] == 'email did not complete'
+    assert results['github'] == {'success': True}
+
+def test_dependencies_on_disabled_steps_are_ignored(onboarding, orchestrator, make_employee):
+    steps = [onboarding.OnboardingStep('email', lambda e, r: {'success': True}, 'smtp', ['jira'])]
+    results = new_results()
+    orchestrator._run_steps(make_employee(), steps, results)
+    assert results['email'] == {'success': True}
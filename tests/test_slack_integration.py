@@ -0,0 +1,116 @@
+"""Slack channel index and user directory against the fake API server"""
+
+import pytest
+import requests
+
+def request_count(server, route):
+    return requests.get(f'{server.base_url}/__stats').json()['requests'].get(route, 0)
+
+@pytest.fixture
+def server(fake_api):
+    return fake_api(channels=50, users=50)
+
+@pytest.fixture
+def directory_path(tmp_path):
+    return str(tmp_path / 'slack_users.json')
+
+@pytest.fixture
+def make_slack(onboarding, server, directory_path):
+    def make(base_url=None):
+        slack = onboarding.SlackIntegration('xoxb-test', base_url=base_url or f'{server.base_url}/api',
+                                            user_directory_path=directory_path)
+        slack.CHANNEL_PAGE_SIZE = 20
+        slack.USER_PAGE_SIZE = 20
+        return slack
+    return make
+
+@pytest.fixture
+def slack(make_slack):
+    return make_slack()
+
+def test_index_follows_cursors_and_is_shared(slack, server):
+    assert slack._get_channel_id('#engineering-general') == 'C00000000'
+    assert slack._get_channel_id('project-0039') == 'C00000049'
+    assert request_count(server, '/api/conversations.list') == 3  # One listing, three pages
+
+    results = slack.add_user_to_channels('U1', 'backend')
+    assert all(results.values())
+    assert request_count(server, '/api/conversations.list') == 3
+
+def test_misses_refresh_at_most_once_per_interval(slack, server):
+    assert slack._get_channel_id('does-not-exist') is None
+    assert slack._get_channel_id('does-not-exist') is None
+    assert request_count(server, '/api/conversations.list') == 3
+
+    slack._channel_index_loaded_at -= slack.CHANNEL_MISS_REFRESH_SECONDS + 1
+    assert slack._get_channel_id('does-not-exist') is None
+    assert request_count(server, '/api/conversations.list') == 6
+
+def test_expired_index_is_rebuilt(slack, server):
+    slack._get_channel_id('random')
+    slack._channel_index_loaded_at -= slack.channel_cache_ttl + 1
+    assert slack._get_channel_id('random') == 'C00000002'
+    assert request_count(server, '/api/conversations.list') == 6
+
+def test_failed_rebuild_keeps_the_previous_index(onboarding, slack, server):
+    slack._get_channel_id('random')
+    slack._channel_index_loaded_at -= slack.channel_cache_ttl + 1
+    slack.base_url = 'http://127.0.0.1:9/api'  # Nothing listens here
+    assert slack._get_channel_id('random') == 'C00000002'
+
+def test_failed_listing_is_not_retried_on_every_lookup(onboarding, slack, monkeypatch):
+    calls = []
+
+    def unreachable(url, **kwargs):
+        calls.append(kwargs['timeout'])
+        raise requests.ConnectionError('slack unreachable')
+
+    monkeypatch.setattr(onboarding.requests, 'get', unreachable)
+    assert slack._get_channel_id('random') is None
+    assert slack._get_channel_id('general') is None
+    assert calls == [slack.REQUEST_TIMEOUT]
+
+    slack._channel_index_loaded_at -= slack.CHANNEL_MISS_REFRESH_SECONDS + 1
+    assert slack._get_channel_id('random') is None
+    assert len(calls) == 2
+
+def test_user_lookups_are_served_from_one_directory_listing(slack, server):
+    assert slack._get_user_id_by_email('Manager@Company.com') == 'U00000000'
+    assert slack._get_user_id_by_email('dev47@company.com') == 'U00000049'
+    assert request_count(server, '/api/users.list') == 3
+    assert request_count(server, '/api/users.lookupByEmail') == 0
+
+    assert slack._get_user_id_by_email('nobody@company.com') is None
+    assert request_count(server, '/api/users.lookupByEmail') == 1
+
+def test_directory_is_reused_by_the_next_run(make_slack, server):
+    make_slack().prefetch_user_directory()
+    assert make_slack()._get_user_id_by_email('buddy@company.com') == 'U00000001'
+    assert request_count(server, '/api/users.list') == 3
+
+def test_directory_from_another_workspace_is_ignored(make_slack, server, fake_api):
+    make_slack().prefetch_user_directory()
+    other = fake_api(users=50)
+    assert make_slack(f'{other.base_url}/api')._get_user_id_by_email('buddy@company.com') == 'U00000001'
+    assert request_count(other, '/api/users.list') == 3
+
+def test_failed_listing_falls_back_to_single_lookups(make_slack, server):
+    slack = make_slack('http://127.0.0.1:9/api')
+    slack.prefetch_user_directory()
+    slack.base_url = f'{server.base_url}/api'
+    assert slack._get_user_id_by_email('buddy@company.com') == 'U00000001'
+    assert request_count(server, '/api/users.list') == 0
+    assert request_count(server, '/api/users.lookupByEmail') == 1
+
+@pytest.mark.parametrize('listing', ['channels', 'users'])
+def test_listings_give_up_after_repeated_rate_limits(onboarding, make_slack, fake_api, monkeypatch, listing):
+    throttled = fake_api(channels=50, users=50, rate_limit=1)
+    sleeps = []
+    monkeypatch.setattr(onboarding.time, 'sleep', sleeps.append)
+    slack = make_slack(f'{throttled.base_url}/api')
+
+    if listing == 'channels':
+        assert slack._get_channel_id('random') is None
+    else:
+        assert slack._fetch_user_directory() is None
+    assert len(sleeps) == slack.RATE_LIMIT_RETRIES
@@ -0,0 +1,106 @@
+"""SMTPConnectionPool session reuse, retirement and reconnects"""
+
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+class FakeSMTP:
+    """Stands in for smtplib.SMTP and records what each session did"""
+
+    sessions = []
+    lock = threading.Lock()
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.logged_in = self.closed = False
+        self.fail_next = None
+        with self.lock:
+            self.sessions.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        self.logged_in = True
+
+    def sendmail(self, from_address, to_addresses, message):
+        if self.fail_next:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        time.sleep(0.005)
+        self.sent.extend(to_addresses)
+
+    def quit(self):
+        self.closed = True
+
+    close = quit
+
+@pytest.fixture
+def smtp(monkeypatch):
+    FakeSMTP.sessions = []
+    monkeypatch.setattr(smtplib, 'SMTP', FakeSMTP)
+    return FakeSMTP
+
+@pytest.fixture
+def make_pool(onboarding, smtp):
+    def make(**options):
+        return onboarding.SMTPConnectionPool('smtp.example.com', 587, 'hr', 'secret', **options)
+    return make
+
+def test_concurrent_sends_share_a_bounded_set_of_sessions(make_pool, smtp):
+    pool = make_pool(size=3)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda i: pool.sendmail('hr@example.com', [f'user{i}@example.com'], 'hi'), range(24)))
+
+    assert len(smtp.sessions) <= 3
+    assert sum(len(session.sent) for session in smtp.sessions) == 24
+    assert all(session.logged_in for session in smtp.sessions)
+    assert pool.stats['messages'] == 24
+
+def test_sessions_retire_after_max_messages_or_idle_time(make_pool, smtp):
+    pool = make_pool(size=1, max_messages=2, idle_timeout=60)
+    for i in range(3):
+        pool.sendmail('hr@example.com', [f'user{i}@example.com'], 'hi')
+    assert [len(session.sent) for session in smtp.sessions] == [2, 1]
+    assert smtp.sessions[0].closed
+
+    pool.idle_timeout = 0
+    time.sleep(0.01)
+    pool.sendmail('hr@example.com', ['late@example.com'], 'hi')
+    assert len(smtp.sessions) == 3 and smtp.sessions[1].closed
+
+def test_dropped_session_is_retried_once_on_a_new_one(make_pool, smtp):
+    pool = make_pool(size=1)
+    pool.sendmail('hr@example.com', ['first@example.com'], 'hi')
+    smtp.sessions[0].fail_next = smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+
+    pool.sendmail('hr@example.com', ['second@example.com'], 'hi')
+    assert smtp.sessions[1].sent == ['second@example.com']
+    assert pool.stats['reconnects'] == 1
+
+def test_other_failures_reach_the_caller(make_pool, smtp):
+    pool = make_pool(size=1)
+    pool.sendmail('hr@example.com', ['first@example.com'], 'hi')
+    smtp.sessions[0].fail_next = smtplib.SMTPRecipientsRefused({'x@example.com': (550, b'No such user')})
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        pool.sendmail('hr@example.com', ['x@example.com'], 'hi')
+    assert len(smtp.sessions) == 1 and smtp.sessions[0].closed
+
+def test_close_quits_idle_sessions(make_pool, smtp):
+    pool = make_pool(starttls=False)
+    pool.sendmail('hr@example.com', ['user@example.com'], 'hi')
+    pool.close()
+    assert smtp.sessions[0].closed
+
+def test_employee_emails_share_one_session(onboarding, smtp, make_employee):
+    email = onboarding.EmailNotification('smtp.example.com', 587, 'hr', 'secret', 'hr@example.com')
+    employee = make_employee()
+    assert email.send_welcome_email(employee)
+    assert email.send_manager_notification(employee, 'ENG-1', ['Laptop setup'])
+    email.close()
+
+    [session] = smtp.sessions
+    assert session.sent == ['Ada@example.com', 'manager@example.com'] and session.closed
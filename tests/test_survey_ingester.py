@@ -0,0 +1,119 @@
+"""SurveyIngester scoring and incremental ingestion"""
+
+import pytest
+
+def quarterly_row(team, wave, answers):
+    return {'team': team, 'wave': wave, **{f'q{q + 1}': answer for q, answer in enumerate(answers)}}
+
+def write_csv(path, rows, mode='w'):
+    columns = ['team', 'wave'] + [f'q{q}' for q in range(1, 25)]
+    with open(path, mode) as f:
+        if mode == 'w':
+            f.write(','.join(columns) + '\n')
+        for row in rows:
+            f.write(','.join(str(row.get(column, '')) for column in columns) + '\n')
+
+@pytest.fixture
+def ingester(tracker):
+    return tracker.SurveyIngester(chunk_size=2)
+
+def test_dimension_scores_average_question_averages(tracker, ingester):
+    answers = [4] * 24
+    answers[5:10] = [2, 2, 2, 2, 2]  # technical growth
+    ingester.ingest_frame(tracker.pd.DataFrame([
+        quarterly_row('core', '2024-03', answers),
+        quarterly_row('core', '2024-03', [4] * 5 + [4] * 19)
+    ]))
+
+    scores = ingester.scores().loc[('core', '2024-03')]
+    assert scores['technical_growth'] == pytest.approx(3.0)
+    assert scores['collaboration'] == pytest.approx(4.0)
+    assert ingester.question_scores('core', '2024-03')['q6']['distribution'] == [0.0, 50.0, 0.0, 50.0, 0.0]
+
+def test_pulse_reverse_scored_and_out_of_range_answers(tracker, ingester):
+    row = {'team': 'core', 'wave': '2024-04', 'survey': 'pulse',
+           'q1': 5, 'q2': 5, 'q3': 5, 'q4': 4, 'q5': 5, 'q6': 9, 'q7': 0}
+    ingester.ingest_frame(tracker.pd.DataFrame([row]))
+
+    questions = ingester.question_scores('core', '2024-04', 'pulse')
+    assert questions['q5']['average'] == 1.0  # High stress is unhealthy
+    assert 'q6' not in questions and 'q7' not in questions
+
+    summary = ingester.team_summary('core')
+    assert summary['dimensions']['workload_management'] == pytest.approx(2.5)
+    assert 'burnout' in summary['red_flags']
+    assert 'workload_management' in summary['red_flags']
+
+def test_team_summary_health_and_trends(tracker, ingester):
+    ingester.ingest_frame(tracker.pd.DataFrame([
+        quarterly_row('core', '2024-01', [5] * 24),
+        quarterly_row('core', '2024-04', [4] * 24)
+    ]))
+
+    summary = ingester.team_summary('core')
+    assert summary['wave'] == '2024-04'
+    assert summary['health_score'] == pytest.approx(4.0)
+    assert summary['health_level'] == 'Good'
+    assert summary['deltas']['team_satisfaction'] == pytest.approx(-1.0)
+    assert set(summary['trending_concerns']) == set(tracker.SURVEY_TRENDING_DIMENSIONS)
+    assert ingester.team_summary('unknown') == {}
+
+def test_team_without_valid_dimension_answers_has_no_summary(tracker, ingester):
+    ingester.ingest_frame(tracker.pd.DataFrame([quarterly_row('core', '2024-03', [9] * 24)]))
+    assert ingester.team_summary('core') == {}
+
+def test_csv_and_json_lines_exports_are_ingested_once(ingester, tmp_path):
+    write_csv(tmp_path / 'wave.csv', [quarterly_row('core', '2024-03', [4] * 24)] * 3)
+    (tmp_path / 'pulse.jsonl').write_text(
+        '{"team": "core", "wave": "2024-04", "survey": "pulse", "q1": 5, "q2": 4}\n')
+    patterns = [str(tmp_path / '*.csv'), str(tmp_path / '*.jsonl')]
+
+    assert ingester.ingest_new(patterns) == 4
+    assert ingester.ingest_new(patterns) == 0
+    assert ingester.question_scores('core', '2024-04', 'pulse')['q2']['average'] == 4.0
+
+def test_collector_maps_survey_satisfaction(tracker, tmp_path):
+    write_csv(tmp_path / 'wave.csv', [quarterly_row('core', '2024-03', [3] * 24)])
+    collector = tracker.MetricsCollector({'survey_exports': [str(tmp_path / '*.csv')]})
+    assert collector.ingest_surveys() == 1
+    core = collector.collect_team_health_metrics('core')
+    assert core['team_satisfaction_score'] == 3.0
+    assert set(core) <= {field.name for field in tracker.fields(tracker.TeamMetrics)}
+    assert collector.collect_team_health_metrics('web')['team_satisfaction_score'] == 4.2
+    assert collector.ingest_surveys() == 0
+
+def test_trend_deltas_are_cached_until_new_responses(tracker, ingester):
+    ingester.ingest_frame(tracker.pd.DataFrame([quarterly_row('core', '2024-01', [5] * 24),
+                                                quarterly_row('core', '2024-04', [4] * 24)]))
+    deltas = ingester.trend_deltas()
+    assert ingester.trend_deltas() is deltas
+    ingester.team_summary('core')
+    assert ingester.trend_deltas() is deltas
+
+    ingester.ingest_frame(tracker.pd.DataFrame([quarterly_row('core', '2024-07', [3] * 24)]))
+    assert ingester.trend_deltas() is not deltas
+    assert ingester.team_summary('core')['deltas']['team_satisfaction'] == pytest.approx(-1.0)
+
+def test_ingest_new_reads_only_appended_rows(ingester, tmp_path):
+    path = tmp_path / 'wave.csv'
+    write_csv(path, [quarterly_row('core', '2024-03', [4] * 24)] * 3)
+    assert ingester.ingest_new([str(tmp_path / '*.csv')]) == 3
+    assert ingester.ingest_new([str(tmp_path / '*.csv')]) == 0
+
+    write_csv(path, [quarterly_row('core', '2024-03', [2] * 24)] * 2, mode='a')
+    assert ingester.ingest_new([str(tmp_path / '*.csv')]) == 2
+
+    q1 = ingester.question_scores('core', '2024-03')['q1']
+    assert q1['responses'] == 5
+    assert q1['average'] == pytest.approx((3 * 4 + 2 * 2) / 5)
+
+def test_ingest_new_rebuilds_after_a_file_is_replaced(ingester, tmp_path):
+    path = tmp_path / 'wave.csv'
+    write_csv(path, [quarterly_row('core', '2024-03', [4] * 24)] * 3)
+    ingester.ingest_new([str(path)])
+
+    write_csv(path, [quarterly_row('core', '2024-03', [3] * 24)])
+    ingester.ingest_new([str(path)])
+
+    q1 = ingester.question_scores('core', '2024-03')['q1']
+    assert (q1['responses'], q1['average']) == (1, 3.0)
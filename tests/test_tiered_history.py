@@ -0,0 +1,130 @@
+"""TieredMetricsHistory hot tier, cold partitions and compaction"""
+
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+import pytest
+
+START = datetime(2024, 1, 1)
+
+def day(offset):
+    return (START + timedelta(days=offset)).strftime('%Y-%m-%d')
+
+@pytest.fixture
+def history(tracker, tmp_path):
+    return tracker.TieredMetricsHistory(str(tmp_path / 'history'), hot_size=5)
+
+def test_hot_tier_is_bounded_per_team(history, make_metrics):
+    for offset in range(8):
+        history.append(make_metrics('core', date=day(offset), bugs_fixed=offset))
+        history.append(make_metrics('web', date=day(offset)))
+
+    assert len(history) == 10
+    assert [m.bugs_fixed for m in history if m.team_name == 'core'] == [3, 4, 5, 6, 7]
+    assert history._team_partitions('core') == ['2024-01']
+
+def test_hot_tier_keeps_arrival_order_and_replaces_in_place(tracker, history, make_metrics):
+    for offset in range(7):
+        history.append(make_metrics('core', date=day(offset), bugs_fixed=offset))
+        if offset % 2:
+            history.append(make_metrics('web', date=day(offset), bugs_fixed=10 + offset))
+
+    expected = [11, 2, 3, 13, 4, 5, 15, 6]
+    assert [m.bugs_fixed for m in history] == expected
+    assert [m.bugs_fixed for m in reversed(history)] == expected[::-1]
+    assert (history[3].bugs_fixed, history[-1].bugs_fixed) == (13, 6)
+
+    history[3] = make_metrics('web', date=day(3), bugs_fixed=99)
+    assert [m.bugs_fixed for m in history.team_rows('web')] == [11, 99, 15]
+
+    dashboard = tracker.MetricsDashboard(history=history)
+    dashboard.update_metrics(make_metrics('core', date=day(6), bugs_fixed=42))
+    assert len(history) == 8 and history[-1].bugs_fixed == 42
+
+def test_recent_queries_stay_in_the_hot_tier(history, make_metrics):
+    for offset in range(8):
+        history.append(make_metrics(date=day(offset), bugs_fixed=offset))
+
+    assert [m.bugs_fixed for m in history.team_rows('core', limit=3)] == [5, 6, 7]
+    assert [m.bugs_fixed for m in history.team_rows('core', since=day(4))] == [4, 5, 6, 7]
+    assert not history._partition_cache
+
+def test_archive_query_and_compact_round_trip(history, make_metrics):
+    # Two weeks straight to cold storage, then a hot tail in February
+    for offset in range(14):
+        history.archive(make_metrics(date=day(offset), bugs_fixed=offset, code_review_time_hours=offset / 2))
+    for offset in range(40, 43):
+        history.append(make_metrics(date=day(offset), bugs_fixed=offset))
+
+    since = history.team_rows('core', since=day(10))
+    assert [m.date for m in since] == [day(o) for o in (10, 11, 12, 13, 40, 41, 42)]
+    assert [m.bugs_fixed for m in history.team_rows('core', limit=5)] == [12, 13, 40, 41, 42]
+    assert len(history.team_rows('core')) == 17
+
+    history.weekly_after_days = 30
+    history.compact(today=datetime(2024, 3, 15))
+    weekly = [m for m in history.team_rows('core') if m.date < day(40)]
+    # 2024-01-01 is a Monday, so the two archived weeks become two averaged rows
+    assert [m.date for m in weekly] == [day(6), day(13)]
+    assert [m.bugs_fixed for m in weekly] == [3, 10]
+    assert [m.code_review_time_hours for m in weekly] == pytest.approx([1.5, 5.0])
+    assert [m.bugs_fixed for m in history.team_rows('core', since=day(7))] == [10, 40, 41, 42]
+
+def test_compaction_runs_once_a_day_unless_forced(history, make_metrics, monkeypatch):
+    history.archive(make_metrics(date=day(0)))
+    runs = []
+    monkeypatch.setattr(history, '_compact_partition', lambda *args: runs.append(args))
+    today = datetime(2025, 1, 1)
+    history.compact(today)
+    history.compact(today)
+    history.compact(today, force=True)
+    assert len(runs) == 2
+
+def test_old_exports_are_archived(tracker, history, make_metrics, tmp_path):
+    export_dir = tmp_path / 'exports'
+    export_dir.mkdir()
+    old = (datetime.now() - timedelta(days=60))
+    recent = datetime.now()
+    for when in (old, recent):
+        metrics = make_metrics(date=when.strftime('%Y-%m-%d'))
+        (export_dir / f'core_metrics_{when.strftime("%Y%m%d")}.json').write_text(json.dumps(asdict(metrics)))
+
+    assert tracker.archive_exports(history, str(export_dir), keep_days=30) == 1
+    assert os.listdir(export_dir) == [f'core_metrics_{recent.strftime("%Y%m%d")}.json']
+    assert [m.date for m in history.team_rows('core')] == [old.strftime('%Y-%m-%d')]
+
+def test_full_scan_covers_cold_partitions_then_the_hot_tier(tracker, history, make_metrics):
+    for offset in range(8):
+        history.append(make_metrics(date=day(offset), bugs_fixed=offset))
+
+    assert [m.bugs_fixed for m in history.iter_all()] == list(range(8))
+    assert [row['count'] for row in tracker.MetricsRollups.from_history(history).table('core', 'month')] == [8]
+
+def test_monthly_compaction_weights_weeks_by_snapshot_count(tracker, history, make_metrics):
+    # 2024-01-29 to 2024-02-04 is one week split across two partitions
+    for offset in range(60):
+        history.archive(make_metrics(date=day(offset), code_review_time_hours=float(offset)))
+
+    history.weekly_after_days = 30
+    history.compact(today=datetime(2024, 6, 1), force=True)
+    history.monthly_after_days = 30
+    history.compact(today=datetime(2024, 6, 1), force=True)
+
+    monthly = history.team_rows('core')
+    assert [m.code_review_time_hours for m in monthly] == pytest.approx([15.0, 45.0])
+    assert [count for _, count in history.iter_all(with_counts=True)] == [31, 29]
+    rollups = tracker.MetricsRollups.from_history(history).table('core', 'month')
+    assert [row['count'] for row in rollups] == [31, 29]
+
+def test_checkpoint_rebuild_reads_the_cold_partitions(tracker, history, make_metrics, tmp_path):
+    for offset in range(8):
+        history.append(make_metrics(date=day(offset)))
+    checkpoint = tmp_path / 'checkpoint.json'
+    checkpoint.write_text(json.dumps({'history': [asdict(m) for m in history],
+                                      'history_dir': history.history_dir, 'rollups': {}}))
+
+    tracker.rebuild_checkpoint_rollups(str(checkpoint))
+    rollups = tracker.MetricsRollups.from_dict(json.loads(checkpoint.read_text())['rollups'])
+    assert [row['count'] for row in rollups.table('core', 'month')] == [8]